@@ -3,15 +3,24 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from processors import json_io
+from processors.columnar_store import PYARROW_AVAILABLE, fresh_arrow_path, read_arrow
+
+# --- JSON Backend ---
+# Same backend selection as the pipeline; API responses are always compact
+json_io.configure(backend=os.getenv("JSON_BACKEND", "auto"))
+DEFAULT_JSON_RESPONSE = ORJSONResponse if json_io.backend() == "orjson" else JSONResponse
+
 # --- Application Initialization ---
 app = FastAPI(
     title="PEOPLES AUDIT Pipeline API",
     description="API to serve HTML visualizations and data outputs from the People's Audit governance pipeline.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DEFAULT_JSON_RESPONSE
 )
 
 # --- Logging Configuration ---
@@ -37,6 +46,9 @@ FINAL_OUTPUTS_DATA_DIR = ROOT_DIR / "final_outputs" / "data"
 # List of directories to search for HTML files
 HTML_SOURCE_DIRS = [HTML_VISUALS_DIR, TEST_CHARTS_DIR, CHARTS_HTML_DIR]
 
+# Directories holding Arrow IPC copies of the tabular pipeline outputs
+TABLE_SOURCE_DIRS = [ROOT_DIR / "stage_4_visuals", ROOT_DIR / "stage_2_semantic", ROOT_DIR / "stage_1_extract"]
+
 # --- CORS Configuration ---
 # Allows your React sites on Vercel to embed or fetch these resources
 ALLOWED_ORIGINS = [
@@ -67,6 +79,19 @@ if CHARTS_STATIC_DIR.exists():
     except Exception as e:
         logger.warning(f"Could not mount static files: {e}")
 
+# Shared plotly.js bundle. Pages reference it relatively: chart pages (../js/) served
+# from /html/ or /dashboard resolve it to /js/, and sankey.html (charts/js/) served
+# as /html/sankey.html to /html/charts/js/. Pages under /charts/ use the /charts mount.
+PLOTLYJS_DIR = CHARTS_STATIC_DIR / "js"
+PLOTLYJS_MOUNTS = ["/js", "/html/charts/js"]
+if PLOTLYJS_DIR.exists():
+    for mount_path in PLOTLYJS_MOUNTS:
+        try:
+            app.mount(mount_path, StaticFiles(directory=str(PLOTLYJS_DIR)), name=f"plotlyjs{mount_path.replace('/', '_')}")
+            logger.info(f"Mounted plotly.js bundle from {PLOTLYJS_DIR} at {mount_path}")
+        except Exception as e:
+            logger.warning(f"Could not mount plotly.js bundle at {mount_path}: {e}")
+
 # --- Helper Functions ---
 def find_html_file(filename: str) -> Optional[Path]:
     """
@@ -106,7 +131,7 @@ def get_directory_listing(directory: Path, extension: str = "*") -> List[str]:
 @app.head("/", include_in_schema=False)
 async def root():
     """Simple redirect to the auto-generated docs."""
-    return JSONResponse(
+    return DEFAULT_JSON_RESPONSE(
         content={
             "message": "PEOPLES AUDIT Pipeline API",
             "docs_url": "/docs",
@@ -117,6 +142,7 @@ async def root():
                 "charts": "/charts/html/{filename}",
                 "test_charts": "/test-charts/{filename}",
                 "data_files": "/data/{filetype}/{filename}",
+                "tables": "/table/{name}?columns=a,b",
                 "list_available": "/list"
             }
         }
@@ -250,11 +276,11 @@ async def get_data_file(filetype: str, filename: str):
     Example: /data/csv/budget_analysis.csv
     """
     # Validate filetype
-    if filetype not in ["csv", "json", "xlsx"]:
+    if filetype not in ["csv", "json", "xlsx", "arrow"]:
         raise HTTPException(status_code=400, detail=f"Unsupported file type: {filetype}")
     
     # Map file types to their likely directories based on your pipeline
-    if filetype in ["csv", "json"]:
+    if filetype in ["csv", "json", "arrow"]:
         # Check stage_3_llm_text first, then final_outputs/data, then stage_4_visuals
         potential_dirs = [
             STAGE_3_DATA_DIR, 
@@ -272,7 +298,8 @@ async def get_data_file(filetype: str, filename: str):
             media_types = {
                 "csv": "text/csv",
                 "json": "application/json",
-                "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                "arrow": "application/vnd.apache.arrow.file"
             }
             return FileResponse(
                 path=file_path,
@@ -283,7 +310,62 @@ async def get_data_file(filetype: str, filename: str):
     logger.warning(f"Data file not found: {filename} (type: {filetype})")
     raise HTTPException(status_code=404, detail=f"Data file not found: {filename}")
 
-@app.get("/list", response_class=JSONResponse)
+def find_fresh_table(base_dir: Path, name: str) -> Optional[Path]:
+    """Arrow copy of a table in base_dir, skipped when older than its CSV/JSON source"""
+    file_path = base_dir / f"{name}.arrow"
+    if not file_path.exists():
+        return None
+    
+    sources = [base_dir / f"{name}{suffix}" for suffix in (".csv", ".json")]
+    sources = [source for source in sources if source.exists()]
+    if sources and any(fresh_arrow_path(source) is None for source in sources):
+        # A failed or skipped Arrow write would otherwise serve the previous run's rows
+        logger.warning(f"Arrow copy of {name} in {base_dir} is older than its source, skipping")
+        return None
+    return file_path
+
+@app.get("/table/{name}", response_class=DEFAULT_JSON_RESPONSE)
+@app.head("/table/{name}")
+async def get_table(
+    name: str,
+    columns: Optional[str] = Query(None, description="Comma-separated columns to return"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1)
+):
+    """
+    Returns rows of a tabular pipeline output as JSON records.
+    The Arrow copy is memory-mapped and only the requested columns are read.
+    Example: /table/budget_analysis?columns=sector,amount_billions
+    """
+    if not PYARROW_AVAILABLE:
+        raise HTTPException(status_code=503, detail="pyarrow is not installed on this server")
+    if Path(name).name != name:
+        raise HTTPException(status_code=400, detail=f"Invalid table name: {name}")
+    
+    for base_dir in TABLE_SOURCE_DIRS:
+        file_path = find_fresh_table(base_dir, name)
+        if file_path is None:
+            continue
+        
+        table = read_arrow(file_path)
+        selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else table.column_names
+        unknown = [c for c in selected if c not in table.column_names]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown columns for {name}: {', '.join(unknown)}")
+        
+        rows = table.select(selected).slice(offset, limit)
+        logger.info(f"Serving table {name} ({rows.num_rows} rows, {len(selected)} columns)")
+        return {
+            "name": name,
+            "total_rows": table.num_rows,
+            "columns": selected,
+            "rows": rows.to_pylist()
+        }
+    
+    logger.warning(f"Table not found: {name}")
+    raise HTTPException(status_code=404, detail=f"Table not found: {name}")
+
+@app.get("/list", response_class=DEFAULT_JSON_RESPONSE)
 @app.head("/list")
 async def list_available_files():
     """
@@ -303,6 +385,10 @@ async def list_available_files():
             get_directory_listing(STAGE_3_DATA_DIR, "json") + 
             get_directory_listing(FINAL_OUTPUTS_DATA_DIR, "json")
         ),
+        "tables": sorted(
+            Path(name).stem for base_dir in TABLE_SOURCE_DIRS
+            for name in get_directory_listing(base_dir, "arrow")
+        ),
         "dashboard_available": DASHBOARD_PATH.exists(),
         "sankey_available": SANKEY_PATH.exists(),
         "paths": {
@@ -0,0 +1,204 @@
+# generators/pdf_report_builder.py
+import os
+import sys
+import time
+import shutil
+import tempfile
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+try:
+    from PyPDF2 import PdfWriter
+    PYPDF2_AVAILABLE = True
+except ImportError:
+    PYPDF2_AVAILABLE = False
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is then not reported
+    resource = None
+
+
+@lru_cache(maxsize=None)
+def _styles() -> Dict[str, Any]:
+    """Paragraph styles, resolved once per process"""
+    styles = getSampleStyleSheet()
+    return {'title': styles['Title'], 'heading': styles['Heading2'], 'normal': styles['Normal']}
+
+
+def _spacer(height: int):
+    # Not cached: reportlab records layout state on flowables, so a shared
+    # instance breaks the next build in the same (worker) process
+    return Spacer(1, height)
+
+
+def split_sections(text: str) -> List[List[str]]:
+    """Split plain-text report into sections of non-empty lines
+
+    A section starts at an ARTICLE heading or at a line underlined by a
+    row of '=' characters.
+    """
+    lines = [line for line in text.split('\n') if line.strip()]
+    sections = [[]]
+    for i, line in enumerate(lines):
+        underlined = i + 1 < len(lines) and lines[i + 1].startswith('=') and not line.startswith('=')
+        if (line.startswith('ARTICLE') or underlined) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return [section for section in sections if section]
+
+
+def report_flowables(lines: List[str]) -> List[Any]:
+    """Flowables for report lines: '=' rules become spacing, ARTICLE lines headings"""
+    styles = _styles()
+    story = []
+    for line in lines:
+        if line.startswith('='):
+            story.append(_spacer(6))
+        elif line.startswith('ARTICLE'):
+            story.append(Paragraph(escape(line), styles['heading']))
+        else:
+            story.append(Paragraph(escape(line), styles['normal']))
+    return story
+
+
+class PdfReportBuilder:
+    """Renders a plain-text report to PDF in chunks and merges them
+
+    Sections are grouped into chunks, each chunk is rendered to its own PDF
+    (across a process pool when there is more than one) and the chunks are
+    appended into the final file with PyPDF2. Without PyPDF2 the report is
+    rendered as a single chunk. Each chunk starts on a new page.
+    """
+
+    def __init__(self, title: str, sections_per_chunk: int = 8,
+                 parallel: bool = True, max_workers: Optional[int] = None):
+        self.title = title
+        self.sections_per_chunk = max(1, sections_per_chunk)
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+
+    def build(self, text: str, pdf_path: Path) -> Dict[str, Any]:
+        """Write the PDF and return its page count, render time and peak memory
+
+        peak_memory_mb is how far rendering raised a process's peak resident
+        memory above where it stood before rendering, for the largest of this
+        process and the pool workers. The process-wide peak alone would
+        report whatever the pipeline used earlier. 0 means the render stayed
+        within memory the process had already used.
+        """
+        pdf_path = Path(pdf_path)
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        baseline = peak_rss_bytes()
+
+        sections = split_sections(text)
+        if PYPDF2_AVAILABLE:
+            chunks = [sections[i:i + self.sections_per_chunk]
+                      for i in range(0, len(sections), self.sections_per_chunk)] or [[]]
+        else:
+            chunks = [sections]
+
+        chunk_dir = Path(tempfile.mkdtemp(prefix=f".{pdf_path.stem}.", dir=pdf_path.parent))
+        try:
+            tasks = [(chunk_dir / f'chunk_{i:04d}.pdf', self.title if i == 0 else None,
+                      [line for section in chunk for line in section])
+                     for i, chunk in enumerate(chunks)]
+
+            if self.parallel and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=self.max_workers,
+                                         initializer=_init_render_worker) as executor:
+                    rendered = list(executor.map(_render_chunk, tasks))
+            else:
+                rendered = [_render_chunk(task) for task in tasks]
+
+            self._merge([task[0] for task in tasks], pdf_path)
+        finally:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+
+        # Workers report their own increase; the merge and serial renders run here
+        peaks = [peak for _, _, peak in rendered]
+        if baseline is not None:
+            peaks.append(peak_rss_bytes() - baseline)
+        peaks = [peak for peak in peaks if peak is not None]
+
+        stats = {
+            'pages': sum(pages for pages, _, _ in rendered),
+            'sections': len(sections),
+            'chunks': len(tasks),
+            'parallel': self.parallel and len(tasks) > 1,
+            'render_seconds': round(time.perf_counter() - started, 4),
+            'chunk_seconds': [round(seconds, 4) for _, seconds, _ in rendered],
+            'peak_memory_mb': round(max(peaks) / (1 << 20), 2) if peaks else None
+        }
+        self.logger.info(f"Rendered {pdf_path.name}: {stats['pages']} pages from {stats['chunks']} chunks "
+                         f"in {stats['render_seconds']:.2f}s (peak {stats['peak_memory_mb']} MB)")
+        return stats
+
+    def _merge(self, chunk_paths: List[Path], pdf_path: Path):
+        """Combine the chunk PDFs into pdf_path atomically"""
+        tmp = pdf_path.with_name(f".{pdf_path.name}.tmp")
+        if len(chunk_paths) == 1:
+            shutil.move(str(chunk_paths[0]), str(tmp))
+        else:
+            writer = PdfWriter()
+            for chunk_path in chunk_paths:
+                writer.append(str(chunk_path))
+            with open(tmp, 'wb') as f:
+                writer.write(f)
+            writer.close()
+        os.replace(tmp, pdf_path)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident memory of this process, or None where it cannot be read"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+# Peak RSS of a pool worker when it started; forked workers inherit the parent's peak
+_worker_baseline_peak: Optional[int] = None
+
+
+def _init_render_worker():
+    global _worker_baseline_peak
+    _worker_baseline_peak = peak_rss_bytes()
+
+
+def _render_chunk(task: Tuple[Path, Optional[str], List[str]]) -> Tuple[int, float, Optional[int]]:
+    """Render one chunk, returning (pages, seconds, worker peak RSS increase in bytes)
+
+    The increase is only reported from pool workers; in the parent the
+    caller measures it around the whole build.
+    """
+    path, title, lines = task
+    started = time.perf_counter()
+    story = []
+    if title:
+        story.append(Paragraph(escape(title), _styles()['title']))
+        story.append(_spacer(12))
+    story.extend(report_flowables(lines))
+
+    doc = SimpleDocTemplate(str(path), pagesize=letter)
+    doc.build(story or [_spacer(1)])
+    increase = None
+    if _worker_baseline_peak is not None:
+        increase = peak_rss_bytes() - _worker_baseline_peak
+    return doc.page, time.perf_counter() - started, increase
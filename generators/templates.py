@@ -0,0 +1,158 @@
+# generators/templates.py
+import re
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+# {{ name }} / {{ name.key }} insert a value, {{> file }} inlines another template,
+# {{# name }} ... {{/ name }} repeats for each item of a list or renders once if truthy
+_TAG = re.compile(r'\{\{\s*([>#/]?)\s*([\w.]+)\s*\}\}')
+
+# Templates being compiled on the current thread, to catch partials that include themselves
+_compiling = threading.local()
+
+
+class Template:
+    """A template compiled once into literal strings, value lookups and sections
+
+    Partials are inlined at compile time, so rendering is a single walk
+    over the parts, appending to a caller-supplied list that is joined
+    once at the end. Only {{ ... }} is special: single braces in CSS,
+    JavaScript or prose pass through untouched, and whitespace around
+    tags is kept exactly as written.
+    """
+
+    def __init__(self, source: str, name: str = '<string>'):
+        self.name = name
+        self.source = source
+        self.partials: List['Template'] = []
+        self.parts = self._compile(source)
+
+    def _compile(self, source: str) -> List[Any]:
+        # Each open section gets its own part list; the stack holds (name, parts)
+        stack = [(None, [])]
+        pos = 0
+        for match in _TAG.finditer(source):
+            parts = stack[-1][1]
+            _append_literal(parts, source[pos:match.start()])
+            kind, name = match.groups()
+            if kind == '>':
+                partial = get_template(name)
+                self.partials.append(partial)
+                for part in partial.parts:
+                    if isinstance(part, str):
+                        _append_literal(parts, part)
+                    else:
+                        parts.append(part)
+            elif kind == '#':
+                stack.append((name, []))
+            elif kind == '/':
+                if stack[-1][0] != name:
+                    raise ValueError(f"Template {self.name}: {{{{/ {name} }}}} does not close "
+                                     f"{stack[-1][0] or 'any section'}")
+                section_name, section_parts = stack.pop()
+                stack[-1][1].append(('section', tuple(section_name.split('.')), section_parts))
+            else:
+                parts.append(('value', tuple(name.split('.'))))
+            pos = match.end()
+
+        if len(stack) > 1:
+            raise ValueError(f"Template {self.name}: section {stack[-1][0]} is not closed")
+        _append_literal(stack[0][1], source[pos:])
+        return stack[0][1]
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of this template's source and every partial it includes"""
+        digest = hashlib.sha256(self.source.encode('utf-8'))
+        for partial in self.partials:
+            digest.update(partial.fingerprint.encode('utf-8'))
+        return digest.hexdigest()
+
+    def render_into(self, out: List[str], context: Dict[str, Any]) -> List[str]:
+        """Append the rendered pieces to out and return it"""
+        _render(self.parts, out, [context], self.name)
+        return out
+
+    def render(self, context: Optional[Dict[str, Any]] = None, **values) -> str:
+        if values:
+            context = dict(context or {}, **values)
+        return ''.join(self.render_into([], context or {}))
+
+
+def _append_literal(parts: List[Any], text: str):
+    """Add literal text, merging it with a preceding literal"""
+    if not text:
+        return
+    if parts and isinstance(parts[-1], str):
+        parts[-1] += text
+    else:
+        parts.append(text)
+
+
+def _render(parts: List[Any], out: List[str], stack: List[Dict[str, Any]], template_name: str):
+    append = out.append
+    for part in parts:
+        if part.__class__ is str:
+            append(part)
+        elif part[0] == 'value':
+            append(str(_lookup(stack, part[1], template_name)))
+        else:
+            value = _lookup(stack, part[1], template_name)
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    _render(part[2], out, stack + [item] if isinstance(item, dict) else stack, template_name)
+            elif value:
+                _render(part[2], out, stack + [value] if isinstance(value, dict) else stack, template_name)
+
+
+def _lookup(stack: List[Dict[str, Any]], path: Tuple[str, ...], template_name: str) -> Any:
+    # The first name is resolved from the innermost section outwards
+    for context in reversed(stack):
+        if path[0] in context:
+            value = context[path[0]]
+            break
+    else:
+        raise KeyError(f"Template {template_name} has no value for {'.'.join(path)}")
+
+    for key in path[1:]:
+        try:
+            value = value[key] if isinstance(value, dict) else getattr(value, key)
+        except (KeyError, AttributeError):
+            raise KeyError(f"Template {template_name} has no value for {'.'.join(path)}") from None
+    return value
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str) -> Template:
+    """Load and compile a template from generators/templates, once per process"""
+    if not hasattr(_compiling, 'names'):
+        _compiling.names = []
+    stack = _compiling.names
+    if name in stack:
+        raise ValueError(f"Template {name} includes itself")
+    stack.append(name)
+    try:
+        source = (TEMPLATE_DIR / name).read_text(encoding='utf-8')
+        return Template(source, name)
+    finally:
+        stack.pop()
+
+
+def render_template(name: str, context: Optional[Dict[str, Any]] = None, **values) -> str:
+    return get_template(name).render(context, **values)
+
+
+def render_each(name: str, items: Iterable[Dict[str, Any]], out: List[str]) -> List[str]:
+    """Render a template once per item context into the same buffer"""
+    template = get_template(name)
+    for item in items:
+        template.render_into(out, item)
+    return out
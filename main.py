@@ -6,14 +6,15 @@ Complete pipeline for analyzing Kenya's economic governance crisis
 """
 
 import os
-import json
-import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
 import logging
 import traceback
 
+from processors import json_io
+from processors.artifact_writer import write_artifact
+
 class PeopleAuditPipeline:
     """Main pipeline controller for People's Audit analysis"""
     
@@ -87,6 +88,13 @@ class PeopleAuditPipeline:
         try:
             from pipeline_config import config as pipeline_config
             extraction_opts = pipeline_config.extraction_optimization
+            semantic_opts = pipeline_config.semantic_tagging
+            consolidation_opts = pipeline_config.consolidation
+            validation_opts = pipeline_config.validation
+            generation_opts = pipeline_config.text_generation
+            visualization_opts = pipeline_config.visualization
+            serialization_opts = pipeline_config.serialization
+            assembly_opts = pipeline_config.final_assembly
             self.logger.info("Loaded extraction optimization settings from pipeline_config")
         except Exception as e:
             self.logger.warning(f"Could not load pipeline_config, using defaults: {e}")
@@ -101,6 +109,48 @@ class PeopleAuditPipeline:
                 'quality_scoring': True,
                 'save_quality_metrics': True,
             }
+            semantic_opts = {
+                'incremental': True,
+                'streaming': False,
+                'parallel': False,
+                'max_workers': None,
+                'batch_size': 8,
+                'llm_backend': {'enabled': False},
+            }
+            consolidation_opts = {
+                'parallel': False,
+                'executor': 'thread',
+                'max_workers': None,
+            }
+            validation_opts = {
+                'incremental': True,
+                'parallel': False,
+                'max_workers': None,
+                'batch_size': 16,
+                'reference_corpus': False,
+                'pdf_parallel': True,
+                'pdf_sections_per_chunk': 8,
+            }
+            generation_opts = {
+                'incremental': True,
+                'parallel': True,
+                'max_workers': None,
+            }
+            visualization_opts = {
+                'incremental': True,
+                'parallel': False,
+                'max_workers': None,
+                'plotlyjs': 'local',
+                'static_engine': 'kaleido',
+            }
+            serialization_opts = {
+                'backend': 'auto',
+                'pretty': True,
+                'compact_machine': True,
+            }
+            assembly_opts = {
+                'link_strategy': 'auto',
+            }
         
         self.config = {
             'source_pdf': self.root / 'input' / 'THE-PEOPLES-AUDIT_compressed.pdf',
@@ -114,9 +164,20 @@ class PeopleAuditPipeline:
                 '4': self.root / 'stage_4_visuals',
                 '5': self.root / 'stage_5_validation'
             },
-            'extraction_optimization': extraction_opts
+            'extraction_optimization': extraction_opts,
+            'semantic_tagging': semantic_opts,
+            'consolidation': consolidation_opts,
+            'validation': validation_opts,
+            'text_generation': generation_opts,
+            'visualization': visualization_opts,
+            'serialization': serialization_opts,
+            'final_assembly': assembly_opts
         }
         
+        # JSON backend and output style for every stage
+        json_io.configure(**serialization_opts)
+        self.logger.info(f"JSON backend: {json_io.backend()}")
+        
         # Verify critical files exist
         if not self.config['source_pdf'].exists():
             self.logger.warning(f"Source PDF not found: {self.config['source_pdf']}")
@@ -184,6 +245,8 @@ class PeopleAuditPipeline:
             # Import modules
             from extractors.pdf_extractor import PDFExtractor
             from extractors.constitution_extractor import ConstitutionExtractor
+            from processors.columnar_store import write_arrow, PYARROW_AVAILABLE
+            from processors.numeric_facts import NumericFactFrame
             
             # Extract main PDF if exists
             if self.config['source_pdf'].exists():
@@ -222,33 +285,31 @@ class PeopleAuditPipeline:
                 extraction_dir = self.config['stages']['1']
                 
                 # Save raw text with structure
-                with open(extraction_dir / 'raw_text.json', 'w', encoding='utf-8') as f:
-                    json.dump(extraction_results['text'], f, indent=2, ensure_ascii=False)
+                json_io.dump(extraction_results['text'], extraction_dir / 'raw_text.json')
                 
                 # Save document structure
-                with open(extraction_dir / 'document_structure.json', 'w', encoding='utf-8') as f:
-                    json.dump(extraction_results['structure'], f, indent=2, ensure_ascii=False)
+                json_io.dump(extraction_results['structure'], extraction_dir / 'document_structure.json')
                 
                 # Save numeric facts
-                with open(extraction_dir / 'numeric_facts.json', 'w', encoding='utf-8') as f:
-                    json.dump(extraction_results['numerics'], f, indent=2, ensure_ascii=False)
+                json_io.dump(extraction_results['numerics'], extraction_dir / 'numeric_facts.json')
+                
+                # Columnar copy for the consolidator, one row per fact
+                if PYARROW_AVAILABLE:
+                    write_arrow(extraction_dir / 'numeric_facts.arrow',
+                                NumericFactFrame.flatten(extraction_results['numerics']), 'numeric_facts')
                 
                 # Save references
-                with open(extraction_dir / 'references.json', 'w', encoding='utf-8') as f:
-                    json.dump(extraction_results['references'], f, indent=2, ensure_ascii=False)
+                json_io.dump(extraction_results['references'], extraction_dir / 'references.json')
                 
                 # Save metadata
-                with open(extraction_dir / 'extraction_metadata.json', 'w', encoding='utf-8') as f:
-                    json.dump(extraction_results['metadata'], f, indent=2, ensure_ascii=False)
+                json_io.dump(extraction_results['metadata'], extraction_dir / 'extraction_metadata.json')
                 
                 # Save statistics
-                with open(extraction_dir / 'extraction_statistics.json', 'w', encoding='utf-8') as f:
-                    json.dump(extraction_results['statistics'], f, indent=2, ensure_ascii=False)
+                json_io.dump(extraction_results['statistics'], extraction_dir / 'extraction_statistics.json')
                 
                 # Save quality metrics if available
                 if 'quality_metrics' in extraction_results and opts.get('save_quality_metrics', True):
-                    with open(extraction_dir / 'quality_metrics.json', 'w', encoding='utf-8') as f:
-                        json.dump(extraction_results['quality_metrics'], f, indent=2, ensure_ascii=False)
+                    json_io.dump(extraction_results['quality_metrics'], extraction_dir / 'quality_metrics.json')
                     self.logger.info("✓ Quality metrics saved")
                 
                 # Log extraction summary
@@ -287,8 +348,7 @@ class PeopleAuditPipeline:
                 const_extractor = ConstitutionExtractor()
                 const_data = const_extractor.extract(str(self.config['constitution_pdf']))
                 
-                with open(self.root / 'reference_materials' / 'constitution_extracted.json', 'w', encoding='utf-8') as f:
-                    json.dump(const_data, f, indent=2, ensure_ascii=False)
+                json_io.dump(const_data, self.root / 'reference_materials' / 'constitution_extracted.json')
                 
                 self.logger.info("Constitution extraction complete")
                 self.logger.info(f"Found {len(const_data.get('articles', []))} constitutional articles")
@@ -309,50 +369,99 @@ class PeopleAuditPipeline:
         
         try:
             # Import modules
-            from processors.semantic_tagger import SemanticTagger
+            from processors.semantic_tagger import (
+                SemanticTagger, SemanticStreamWriter, TaggingCache, iter_raw_text_pages
+            )
+            from processors.llm_tagger import LLMTaggingBackend
+            from processors.article_index import ArticleIndexBuilder
+            from processors.columnar_store import write_arrow, PYARROW_AVAILABLE
             
             # Load Stage 1 outputs
             extraction_dir = self.config['stages']['1']
             raw_text_path = extraction_dir / 'raw_text.json'
             
             if raw_text_path.exists():
-                with open(raw_text_path, 'r', encoding='utf-8') as f:
-                    raw_text = json.load(f)
-                
                 # Initialize tagger
                 tagger = SemanticTagger()
-                
-                # Process each paragraph
-                tagged_results = tagger.process_all(raw_text)
-                
-                # Save tagged results
+                semantic_opts = self.config.get('semantic_tagging', {})
                 output_dir = self.config['stages']['2']
                 
-                with open(output_dir / 'tagged_paragraphs.json', 'w', encoding='utf-8') as f:
-                    json.dump(tagged_results['paragraphs'], f, indent=2, ensure_ascii=False)
+                # Optional local LLM backend, keyword tagging takes over per paragraph
+                llm_opts = dict(semantic_opts.get('llm_backend', {}))
+                if llm_opts.pop('enabled', False):
+                    tagger.use_llm_backend(LLMTaggingBackend(
+                        allowed_tags=tagger.tag_keywords,
+                        cache_path=output_dir / 'cache' / 'llm_cache.json',
+                        **llm_opts
+                    ))
                 
-                with open(output_dir / 'recommendations.json', 'w', encoding='utf-8') as f:
-                    json.dump(tagged_results['recommendations'], f, indent=2, ensure_ascii=False)
+                # Reuse results for paragraphs unchanged since the last run
+                if semantic_opts.get('incremental', True):
+                    tagger.cache = TaggingCache(output_dir / 'cache' / 'tagging_cache.json', tagger.rules_version)
                 
-                with open(output_dir / 'key_findings.json', 'w', encoding='utf-8') as f:
-                    json.dump(tagged_results['findings'], f, indent=2, ensure_ascii=False)
+                if semantic_opts.get('streaming', False):
+                    # Stream pages through the tagger straight into the output files
+                    with SemanticStreamWriter(output_dir, tagger) as writer:
+                        counts = writer.write_all(tagger.iter_tagged_with_source(iter_raw_text_pages(raw_text_path)))
+                else:
+                    raw_text = json_io.load(raw_text_path)
+                    
+                    # Process each paragraph
+                    tagged_results = tagger.process_all(
+                        raw_text,
+                        parallel=semantic_opts.get('parallel', False),
+                        max_workers=semantic_opts.get('max_workers'),
+                        batch_size=semantic_opts.get('batch_size', 8)
+                    )
+                    
+                    # Save tagged results
+                    json_io.dump(tagged_results['paragraphs'], output_dir / 'tagged_paragraphs.json')
+                    
+                    json_io.dump(tagged_results['recommendations'], output_dir / 'recommendations.json')
+                    
+                    json_io.dump(tagged_results['findings'], output_dir / 'key_findings.json')
+                    
+                    json_io.dump(tagged_results['timeline'], output_dir / 'timeline_events.json')
+                    
+                    # Columnar copies for downstream readers
+                    if PYARROW_AVAILABLE:
+                        for key, name in [('paragraphs', 'tagged_paragraphs'), ('recommendations', 'recommendations'),
+                                          ('findings', 'key_findings'), ('timeline', 'timeline_events')]:
+                            write_arrow(output_dir / f'{name}.arrow', tagged_results[key], name)
+                    
+                    # Article -> paragraph index for the constitutional validator, over the raw text
+                    article_index = ArticleIndexBuilder()
+                    article_index.add_all(tagger.iter_source_paragraphs(raw_text.items()))
+                    article_index.save(output_dir / 'article_index.json')
+                    
+                    counts = {key: len(tagged_results[key])
+                              for key in ('paragraphs', 'recommendations', 'findings', 'timeline')}
                 
-                with open(output_dir / 'timeline_events.json', 'w', encoding='utf-8') as f:
-                    json.dump(tagged_results['timeline'], f, indent=2, ensure_ascii=False)
+                stats = {
+                    'total_paragraphs': counts['paragraphs'],
+                    'total_recommendations': counts['recommendations'],
+                    'total_findings': counts['findings'],
+                    'total_timeline_events': counts['timeline'],
+                    'processing_date': datetime.now().isoformat()
+                }
+                if tagger.cache is not None:
+                    stats['incremental'] = tagger.cache.statistics()
+                if tagger.llm_backend is not None:
+                    stats['llm_backend'] = tagger.llm_backend.statistics()
+                json_io.dump(stats, output_dir / 'semantic_statistics.json')
                 
-                with open(output_dir / 'semantic_statistics.json', 'w', encoding='utf-8') as f:
-                    stats = {
-                        'total_paragraphs': len(tagged_results['paragraphs']),
-                        'total_recommendations': len(tagged_results['recommendations']),
-                        'total_findings': len(tagged_results['findings']),
-                        'total_timeline_events': len(tagged_results['timeline']),
-                        'processing_date': datetime.now().isoformat()
-                    }
-                    json.dump(stats, f, indent=2, ensure_ascii=False)
+                if tagger.llm_backend is not None:
+                    tagger.llm_backend.save_cache()
+                
+                if tagger.cache is not None:
+                    tagger.cache.save()
+                    cache_stats = tagger.cache.statistics()
+                    self.logger.info(f"Tagging cache hit rate: {cache_stats['hit_rate']:.1%} "
+                                     f"(~{cache_stats['estimated_seconds_saved']:.2f}s saved)")
                 
                 self.logger.info(f"Stage 2 complete. Files saved to {output_dir}")
-                self.logger.info(f"Processed {len(tagged_results['paragraphs'])} paragraphs")
-                self.logger.info(f"Found {len(tagged_results['recommendations'])} recommendations")
+                self.logger.info(f"Processed {counts['paragraphs']} paragraphs")
+                self.logger.info(f"Found {counts['recommendations']} recommendations")
             else:
                 self.logger.warning("Stage 1 outputs not found. Creating sample semantic data.")
                 self.create_sample_stage2_data()
@@ -386,19 +495,16 @@ class PeopleAuditPipeline:
             if all(f.exists() for f in required_files):
                 output_dir = self.config['stages']['4']
                 consolidator = DataConsolidator(stage1_dir, stage2_dir, output_dir)
-                consolidated_data = consolidator.consolidate_all()
+                consolidation_opts = self.config.get('consolidation', {})
+                consolidated_data = consolidator.consolidate_all(
+                    parallel=consolidation_opts.get('parallel', False),
+                    executor=consolidation_opts.get('executor', 'thread'),
+                    max_workers=consolidation_opts.get('max_workers')
+                )
                 
-                for filename, data in consolidated_data.items():
-                    filepath = output_dir / filename
-                    if filename.endswith('.json'):
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2, ensure_ascii=False)
-                        self.logger.info(f"Saved {filename} ({len(str(data))} bytes)")
-                    elif filename.endswith('.csv'):
-                        import pandas as pd
-                        if isinstance(data, pd.DataFrame):
-                            data.to_csv(filepath, index=False, encoding='utf-8')
-                            self.logger.info(f"Saved {filename} ({data.shape[0]} rows)")
+                # The consolidator has already written each dataset once
+                for filename in consolidated_data:
+                    self.logger.info(f"Saved {filename} ({consolidator.timings[filename]['bytes']} bytes)")
                 
                 self.logger.info(f"Stage 3 complete. Files saved to {output_dir}")
                 
@@ -425,61 +531,70 @@ class PeopleAuditPipeline:
         
         try:
             # Import modules
-            from validators.constitutional_validator import ConstitutionalValidator
+            from validators.constitutional_validator import ConstitutionalValidator, ValidationCache
             
             # Check if required files exist
             stage1_dir = self.config['stages']['1']
             constitution_path = self.root / 'reference_materials' / 'constitution_extracted.json'
+            article_index_path = self.config['stages']['2'] / 'article_index.json'
             
-            if constitution_path.exists() and (stage1_dir / 'references.json').exists():
-                validator = ConstitutionalValidator(stage1_dir, constitution_path)
-                validation_results = validator.validate_all()
-                
-                # Save validation results
+            if constitution_path.exists() and ((stage1_dir / 'references.json').exists()
+                                               or article_index_path.exists()):
+                validator = ConstitutionalValidator(stage1_dir, constitution_path, article_index_path)
+                validation_opts = self.config.get('validation', {})
                 output_dir = self.config['stages']['5']
                 
-                with open(output_dir / 'constitutional_validation.json', 'w', encoding='utf-8') as f:
-                    json.dump(validation_results['detailed'], f, indent=2, ensure_ascii=False)
+                # Reuse results for references unchanged since the last run
+                if validation_opts.get('incremental', True):
+                    validator.cache = ValidationCache(output_dir / 'cache' / 'validation_cache.json',
+                                                      validator.rules_version)
+                
+                corpus_dir = None
+                if validation_opts.get('reference_corpus', False):
+                    corpus_dir = self.config['reference_extract_dir']
+                validation_results = validator.validate_all(
+                    parallel=validation_opts.get('parallel', False),
+                    max_workers=validation_opts.get('max_workers'),
+                    batch_size=validation_opts.get('batch_size', 16),
+                    corpus_dir=corpus_dir
+                )
+                
+                if validator.cache is not None:
+                    validator.cache.save()
+                    validation_results['summary']['incremental'] = validator.cache.statistics()
+                    self.logger.info(f"Validation cache hit rate: "
+                                     f"{validation_results['summary']['incremental']['hit_rate']:.1%}")
                 
-                with open(output_dir / 'validation_summary.json', 'w', encoding='utf-8') as f:
-                    json.dump(validation_results['summary'], f, indent=2, ensure_ascii=False)
+                # Save validation results before the optional PDF, so a PDF failure loses nothing
+                json_io.dump(validation_results['detailed'], output_dir / 'constitutional_validation.json')
                 
-                with open(output_dir / 'citizen_constitutional_guide.txt', 'w', encoding='utf-8') as f:
-                    f.write(validation_results['guide'])
+                json_io.dump(validation_results['summary'], output_dir / 'validation_summary.json')
+                
+                if 'corpus' in validation_results:
+                    json_io.dump(validation_results['corpus'], output_dir / 'corpus_validation.json')
+                
+                write_artifact(output_dir / 'citizen_constitutional_guide.txt', validation_results['guide'])
                 
                 # Create PDF version if we have reportlab
-                try:
-                    from reportlab.lib.pagesizes import letter
-                    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-                    from reportlab.lib.styles import getSampleStyleSheet
-                    
+                from generators.pdf_report_builder import PdfReportBuilder, REPORTLAB_AVAILABLE
+                if REPORTLAB_AVAILABLE:
                     pdf_path = output_dir / 'citizen_constitutional_guide.pdf'
-                    doc = SimpleDocTemplate(str(pdf_path), pagesize=letter)
-                    styles = getSampleStyleSheet()
-                    story = []
-                    
-                    # Add title
-                    title = Paragraph("Your Constitutional Rights: A Citizen's Guide", styles['Title'])
-                    story.append(title)
-                    story.append(Spacer(1, 12))
-                    
-                    # Add content
-                    for line in validation_results['guide'].split('\n'):
-                        if line.strip():
-                            if line.startswith('='):
-                                # This is a separator
-                                story.append(Spacer(1, 6))
-                            elif line.startswith('ARTICLE'):
-                                story.append(Paragraph(line, styles['Heading2']))
-                            elif line.startswith('What it means:'):
-                                story.append(Paragraph(line, styles['Normal']))
-                            else:
-                                story.append(Paragraph(line, styles['Normal']))
+                    builder = PdfReportBuilder(
+                        "Your Constitutional Rights: A Citizen's Guide",
+                        sections_per_chunk=validation_opts.get('pdf_sections_per_chunk', 8),
+                        parallel=validation_opts.get('pdf_parallel', True),
+                        max_workers=validation_opts.get('max_workers')
+                    )
+                    try:
+                        validation_results['summary']['guide_pdf'] = builder.build(validation_results['guide'], pdf_path)
+                        self.logger.info(f"Created PDF guide: {pdf_path}")
+                    except Exception as e:
+                        self.logger.error(f"Error creating PDF guide: {str(e)}")
+                        validation_results['summary']['guide_pdf'] = {'error': str(e)}
                     
-                    doc.build(story)
-                    self.logger.info(f"Created PDF guide: {pdf_path}")
-                    
-                except ImportError:
+                    # Record the PDF stats (or failure) alongside the saved results
+                    json_io.dump(validation_results['summary'], output_dir / 'validation_summary.json')
+                else:
                     self.logger.warning("ReportLab not installed. Skipping PDF generation.")
                 
                 self.logger.info(f"Stage 4 complete. Files saved to {output_dir}")
@@ -513,16 +628,22 @@ class PeopleAuditPipeline:
             
             if all(f.exists() for f in required_files):
                 generator = TextGenerator(stage4_dir)
-                documents = generator.generate_all_documents()
+                generation_opts = self.config.get('text_generation', {})
                 
-                # Save documents
+                # Regenerate and save only the documents whose inputs changed
                 output_dir = self.config['stages']['3']
+                status = generator.update_documents(
+                    output_dir,
+                    incremental=generation_opts.get('incremental', True),
+                    parallel=generation_opts.get('parallel', True),
+                    max_workers=generation_opts.get('max_workers')
+                )
                 
-                for doc_name, content in documents.items():
-                    filepath = output_dir / f"{doc_name}.md"
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    self.logger.info(f"Generated document: {doc_name}.md")
+                for doc_name, state in status.items():
+                    if state == 'generated':
+                        self.logger.info(f"Generated document: {doc_name}.md")
+                    else:
+                        self.logger.info(f"Inputs unchanged, kept document: {doc_name}.md")
                 
                 self.logger.info(f"Stage 5 complete. Files saved to {output_dir}")
                 
@@ -543,9 +664,12 @@ class PeopleAuditPipeline:
             # Import modules
             from visualizers.sankey_generator import SankeyGenerator
             from visualizers.chart_generator import ChartGenerator, ChartConfig
+            from visualizers.plotly_assets import plotlyjs_source
             
             # Load data for visualization
             stage4_dir = self.config['stages']['4']
+            visualization_opts = self.config.get('visualization', {})
+            plotlyjs_mode = visualization_opts.get('plotlyjs', 'local')
             
             # Check if required files exist
             sankey_data_path = stage4_dir / 'sankey_data.json'
@@ -555,10 +679,12 @@ class PeopleAuditPipeline:
                 # Generate Sankey diagram
                 sankey_gen = SankeyGenerator()
                 
-                with open(sankey_data_path, 'r', encoding='utf-8') as f:
-                    sankey_data = json.load(f)
+                sankey_data = json_io.load(sankey_data_path)
                 
-                sankey_html = sankey_gen.generate_sankey(sankey_data)
+                sankey_html = sankey_gen.generate_sankey(
+                    sankey_data,
+                    include_plotlyjs=plotlyjs_source(plotlyjs_mode, stage4_dir / 'charts', stage4_dir)
+                )
                 
                 # Save Sankey visualizations
                 sankey_gen.save_visualizations(sankey_html, stage4_dir)
@@ -575,12 +701,18 @@ class PeopleAuditPipeline:
                     title_font_size=20,
                     axis_font_size=14,
                     label_font_size=12,
-                    export_formats=['html', 'png', 'svg', 'json']
+                    export_formats=['html', 'png', 'svg', 'json'],
+                    plotlyjs=plotlyjs_mode,
+                    static_engine=visualization_opts.get('static_engine', 'kaleido')
                 )
                 
                 # Generate charts
                 chart_gen = ChartGenerator(stage4_dir, config=chart_config)
-                charts = chart_gen.generate_all_charts()
+                charts = chart_gen.generate_all_charts(
+                    parallel=visualization_opts.get('parallel', False),
+                    max_workers=visualization_opts.get('max_workers'),
+                    incremental=visualization_opts.get('incremental', True)
+                )
                 
                 self.logger.info(f"Generated {len(charts)} charts")
                 
@@ -616,7 +748,13 @@ class PeopleAuditPipeline:
             final_dir = self.config['output_dir']
             final_dir.mkdir(exist_ok=True)
             
-            # Copy and organize all final outputs
+            from processors.artifact_linker import ArtifactLinker
+            from visualizers.plotly_assets import find_plotlyjs_bundles
+            
+            # Link or copy all final outputs, skipping unchanged ones
+            assembly_opts = self.config.get('final_assembly', {})
+            linker = ArtifactLinker(assembly_opts.get('link_strategy', 'auto'))
+            
             sources = {
                 'summaries': self.config['stages']['3'],
                 'visuals': self.config['stages']['4'],
@@ -628,12 +766,26 @@ class PeopleAuditPipeline:
                 target_dir = final_dir / target
                 target_dir.mkdir(exist_ok=True)
                 
-                # Copy relevant files
+                # Place relevant files
                 if source.exists():
                     for file in source.iterdir():
                         if file.is_file() and not file.name.startswith('.'):
-                            shutil.copy2(file, target_dir / file.name)
-                            self.logger.debug(f"Copied {file.name} to {target}")
+                            used = linker.place(file, target_dir / file.name)
+                            self.logger.debug(f"Placed {file.name} in {target} ({used})")
+            
+            # sankey.html loads the shared plotly.js bundle from charts/js/
+            for bundle in find_plotlyjs_bundles(self.config['stages']['4'] / 'charts'):
+                bundle_target = final_dir / 'visuals' / 'charts' / bundle.parent.name / bundle.name
+                bundle_target.parent.mkdir(parents=True, exist_ok=True)
+                linker.place(bundle, bundle_target)
+            
+            self.assembly = {
+                'link_strategy': linker.strategy,
+                'placements': linker.summary(),
+                'files': {str(Path(path).relative_to(final_dir)): used
+                          for path, used in linker.placements.items()}
+            }
+            self.logger.info(f"Final outputs placed: {self.assembly['placements']}")
             
             # Create additional consolidated files
             self.create_final_consolidated_files(final_dir)
@@ -746,16 +898,13 @@ class PeopleAuditPipeline:
                 target_dir = out_root / relative
                 target_dir.mkdir(parents=True, exist_ok=True)
 
-                with open(target_dir / 'raw_text.json', 'w', encoding='utf-8') as f:
-                    json.dump(result['text'], f, indent=2, ensure_ascii=False)
+                json_io.dump(result['text'], target_dir / 'raw_text.json')
 
-                with open(target_dir / 'metadata.json', 'w', encoding='utf-8') as f:
-                    json.dump(result['metadata'], f, indent=2, ensure_ascii=False)
+                json_io.dump(result['metadata'], target_dir / 'metadata.json')
                 
                 # Save quality metrics if available
                 if 'quality_metrics' in result and opts.get('save_quality_metrics', True):
-                    with open(target_dir / 'quality_metrics.json', 'w', encoding='utf-8') as f:
-                        json.dump(result['quality_metrics'], f, indent=2, ensure_ascii=False)
+                    json_io.dump(result['quality_metrics'], target_dir / 'quality_metrics.json')
 
                 index[str(relative)] = {
                     'source_file': str(file_path),
@@ -767,8 +916,7 @@ class PeopleAuditPipeline:
             except Exception as e:
                 self.logger.error(f"Reference extraction failed for {file_path}: {e}")
 
-        with open(out_root / 'reference_index.json', 'w', encoding='utf-8') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False)
+        json_io.dump(index, out_root / 'reference_index.json')
 
         self.logger.info(f"Reference extraction complete: {len(index)} documents processed")
 
@@ -776,77 +924,32 @@ class PeopleAuditPipeline:
     def create_final_consolidated_files(self, final_dir: Path):
         """Create final consolidated files"""
         try:
-            # Consolidated data file
-            consolidated_data = {}
+            from processors.json_assembler import assemble_json_object
             
             # Gather data from all stages
+            entries = []
             stages = ['1', '2', '3', '4', '5']
             for stage in stages:
                 stage_dir = self.config['stages'][stage]
                 if stage_dir.exists():
                     for json_file in stage_dir.glob('*.json'):
-                        try:
-                            with open(json_file, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                key = f"stage_{stage}_{json_file.stem}"
-                                consolidated_data[key] = data
-                        except:
-                            pass
+                        entries.append((f"stage_{stage}_{json_file.stem}", json_file))
             
-            # Save consolidated data
-            with open(final_dir / 'data' / 'all_consolidated_data.json', 'w', encoding='utf-8') as f:
-                json.dump(consolidated_data, f, indent=2, ensure_ascii=False)
+            # Stream each file's bytes into the consolidated data file, compacted per JSON_COMPACT_MACHINE
+            assembled = assemble_json_object(entries, final_dir / 'data' / 'all_consolidated_data.json')
+            self.logger.info(f"Assembled all_consolidated_data.json from {assembled['files']} files "
+                             f"({assembled['bytes']} bytes, {assembled['skipped']} skipped)")
             
-            # Create Excel summary if pandas is available
-            try:
-                import pandas as pd
-                
-                # Create summary DataFrame
-                summary_data = []
-                
-                # Add key statistics
-                stats_path = self.config['stages']['4'] / 'statistics_summary.json'
-                if stats_path.exists():
-                    with open(stats_path, 'r', encoding='utf-8') as f:
-                        stats = json.load(f)
-                    
-                    for key, value in stats.items():
-                        if key != 'generated_date':
-                            summary_data.append({
-                                'Category': 'Key Statistics',
-                                'Metric': key.replace('_', ' ').title(),
-                                'Value': value,
-                                'Source': 'People\'s Audit'
-                            })
-                
-                # Add to Excel
-                if summary_data:
-                    df = pd.DataFrame(summary_data)
-                    excel_path = final_dir / 'data' / 'Kenya_Governance_By_The_Numbers.xlsx'
-                    
-                    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-                        df.to_excel(writer, sheet_name='Summary', index=False)
-                        
-                        # Add detailed sheets if available
-                        detailed_files = [
-                            ('corruption_cases.csv', 'Corruption Cases'),
-                            ('debt_analysis.csv', 'Debt Analysis'),
-                            ('budget_analysis.csv', 'Budget Analysis')
-                        ]
-                        
-                        for filename, sheetname in detailed_files:
-                            filepath = self.config['stages']['4'] / filename
-                            if filepath.exists():
-                                try:
-                                    detail_df = pd.read_csv(filepath)
-                                    detail_df.to_excel(writer, sheet_name=sheetname, index=False)
-                                except:
-                                    pass
-                    
-                    self.logger.info(f"Created Excel summary: {excel_path}")
-                    
-            except ImportError:
-                self.logger.warning("Pandas not installed. Skipping Excel generation.")
+            # Stream the Excel summary sheet by sheet
+            from processors.excel_builder import StreamingWorkbookBuilder, OPENPYXL_AVAILABLE
+            if OPENPYXL_AVAILABLE:
+                builder = StreamingWorkbookBuilder(self.config['stages']['1'], self.config['stages']['2'],
+                                                   self.config['stages']['4'],
+                                                   reference_dir=self.config['reference_extract_dir'])
+                row_counts = builder.build(final_dir / 'data' / 'Kenya_Governance_By_The_Numbers.xlsx')
+                self.workbook = {'rows': row_counts, 'failed_sheets': builder.failed_sheets}
+            else:
+                self.logger.warning("openpyxl not installed. Skipping Excel generation.")
                 
         except Exception as e:
             self.logger.error(f"Error creating consolidated files: {str(e)}")
@@ -854,171 +957,11 @@ class PeopleAuditPipeline:
     def create_dashboard(self, final_dir: Path):
         """Create HTML dashboard"""
         try:
-            dashboard_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>People\'s Audit Dashboard</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); min-height: 100vh; }
-        .container { max-width: 1400px; margin: 0 auto; background: rgba(255, 255, 255, 0.95); padding: 30px; border-radius: 15px; box-shadow: 0 10px 30px rgba(0, 0, 0, 0.2); }
-        header { text-align: center; margin-bottom: 40px; padding-bottom: 20px; border-bottom: 2px solid #eee; }
-        h1 { color: #2c3e50; font-size: 2.8rem; margin-bottom: 10px; background: linear-gradient(90deg, #667eea, #764ba2); -webkit-background-clip: text; background-clip: text; color: transparent; }
-        .subtitle { color: #7f8c8d; font-size: 1.2rem; margin-bottom: 30px; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 30px 0; }
-        .stat-card { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 20px; border-radius: 10px; text-align: center; box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1); }
-        .stat-value { font-size: 2.5rem; font-weight: bold; margin-bottom: 5px; }
-        .stat-label { font-size: 0.9rem; opacity: 0.9; }
-        .section { margin: 40px 0; }
-        .section-title { color: #2c3e50; font-size: 1.8rem; margin-bottom: 20px; padding-bottom: 10px; border-bottom: 2px solid #f0f0f0; }
-        .file-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }
-        .file-card { background: white; padding: 20px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1); border-left: 4px solid #3498db; transition: transform 0.3s ease; }
-        .file-card:hover { transform: translateY(-5px); box-shadow: 0 10px 25px rgba(0, 0, 0, 0.15); }
-        .file-title { color: #2c3e50; font-size: 1.2rem; margin-bottom: 10px; }
-        .file-desc { color: #7f8c8d; font-size: 0.9rem; margin-bottom: 15px; }
-        .btn { display: inline-block; padding: 10px 20px; background: #3498db; color: white; text-decoration: none; border-radius: 5px; font-weight: 500; transition: background 0.3s ease; }
-        .btn:hover { background: #2980b9; }
-        .chart-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(500px, 1fr)); gap: 20px; margin: 20px 0; }
-        .chart-container { background: white; padding: 20px; border-radius: 10px; box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1); }
-        .chart-title { color: #2c3e50; font-size: 1.2rem; margin-bottom: 15px; }
-        footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #eee; text-align: center; color: #7f8c8d; font-size: 0.9rem; }
-        @media (max-width: 768px) { .container { padding: 15px; } h1 { font-size: 2rem; } .chart-grid { grid-template-columns: 1fr; } }
-    </style>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1><i class="fas fa-chart-line"></i> People\'s Audit Dashboard</h1>
-            <p class="subtitle">Comprehensive Analysis of Kenya\'s Economic Governance Crisis</p>
-            
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value" id="total-debt">KSh 12.05T</div>
-                    <div class="stat-label">Total Public Debt (2025)</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value" id="debt-ratio">56%</div>
-                    <div class="stat-label">Debt Service to Revenue</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value" id="corruption-loss">KSh 800B</div>
-                    <div class="stat-label">Annual Corruption Loss</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value" id="food-insecure">15.5M</div>
-                    <div class="stat-label">Food Insecure Kenyans</div>
-                </div>
-            </div>
-        </header>
-        
-        <div class="section">
-            <h2 class="section-title"><i class="fas fa-file-alt"></i> Key Documents</h2>
-            <div class="file-grid">
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-users"></i> Citizen\'s Summary</h3>
-                    <p class="file-desc">Simple English guide for ordinary Kenyans explaining the economic crisis</p>
-                    <a href="summaries/citizen_summary.md" class="btn" download><i class="fas fa-download"></i> Download</a>
-                </div>
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-chart-bar"></i> Data Compendium</h3>
-                    <p class="file-desc">Complete statistics and analysis in Excel format with all data points</p>
-                    <a href="data/Kenya_Governance_By_The_Numbers.xlsx" class="btn" download><i class="fas fa-download"></i> Download</a>
-                </div>
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-gavel"></i> Constitutional Guide</h3>
-                    <p class="file-desc">Your rights under the Constitution and how they\'re being violated</p>
-                    <a href="reports/citizen_constitutional_guide.txt" class="btn" download><i class="fas fa-download"></i> Download</a>
-                </div>
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-hands-helping"></i> Action Handbook</h3>
-                    <p class="file-desc">What you can do to demand accountability and fight corruption</p>
-                    <a href="summaries/action_handbook.md" class="btn" download><i class="fas fa-download"></i> Download</a>
-                </div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2 class="section-title"><i class="fas fa-chart-pie"></i> Visualizations</h2>
-            <div class="chart-grid">
-                <div class="chart-container">
-                    <h3 class="chart-title">Debt Growth Timeline (2014-2025)</h3>
-                    <img src="visuals/charts/png/debt_timeline.png" alt="Debt Timeline" style="width: 100%; border-radius: 5px;">
-                    <p style="color: #7f8c8d; font-size: 0.9rem; margin-top: 10px;">Kenya\'s public debt grew from KSh 2.4T to KSh 12.05T in 11 years</p>
-                </div>
-                <div class="chart-container">
-                    <h3 class="chart-title">Corruption Losses by Sector</h3>
-                    <img src="visuals/charts/png/corruption_by_sector.png" alt="Corruption by Sector" style="width: 100%; border-radius: 5px;">
-                    <p style="color: #7f8c8d; font-size: 0.9rem; margin-top: 10px;">Estimated annual losses across different government sectors</p>
-                </div>
-            </div>
-            <div style="text-align: center; margin-top: 20px;">
-                <a href="final_outputs/dashboard.html" class="btn" target="_blank"><i class="fas fa-expand"></i> View Interactive Dashboard</a>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2 class="section-title"><i class="fas fa-database"></i> Data Files</h2>
-            <div class="file-grid">
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-code"></i> JSON Data</h3>
-                    <p class="file-desc">Complete extracted data in JSON format for developers and researchers</p>
-                    <a href="data/all_consolidated_data.json" class="btn"><i class="fas fa-eye"></i> View Data</a>
-                </div>
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-project-diagram"></i> Sankey Diagram</h3>
-                    <p class="file-desc">Interactive visualization of public fund flows and corruption</p>
-                    <a href="visuals/sankey.html" class="btn" target="_blank"><i class="fas fa-external-link-alt"></i> Open Interactive</a>
-                </div>
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-clipboard-list"></i> Validation Reports</h3>
-                    <p class="file-desc">Constitutional violation analysis and legal compliance reports</p>
-                    <a href="reports/constitutional_validation.json" class="btn"><i class="fas fa-eye"></i> View Report</a>
-                </div>
-                <div class="file-card">
-                    <h3 class="file-title"><i class="fas fa-cogs"></i> Reform Agenda</h3>
-                    <p class="file-desc">Priority actions and governance reforms needed</p>
-                    <a href="data/reform_agenda.json" class="btn"><i class="fas fa-eye"></i> View Agenda</a>
-                </div>
-            </div>
-        </div>
-        
-        <footer>
-            <p>People\'s Audit Pipeline | Data Source: Okoa Uchumi Campaign / TISA</p>
-            <p>Generated: {current_date} | Pipeline Version: 1.0</p>
-            <p style="margin-top: 10px; font-size: 0.8rem; opacity: 0.7;">
-                <i class="fas fa-info-circle"></i> This dashboard provides access to all analysis outputs. Use the links above to download or view specific files.
-            </p>
-        </footer>
-    </div>
-    
-    <script>
-        // Load dynamic data if available
-        fetch(\'data/statistics_summary.json\')
-            .then(response => response.json())
-            .then(data => {
-                if (data.total_debt) {
-                    document.getElementById(\'total-debt\').textContent = data.total_debt;
-                }
-                if (data.debt_service_ratio) {
-                    document.getElementById(\'debt-ratio\').textContent = data.debt_service_ratio;
-                }
-                if (data.corruption_loss_annual) {
-                    document.getElementById(\'corruption-loss\').textContent = data.corruption_loss_annual;
-                }
-                if (data.food_insecure) {
-                    document.getElementById(\'food-insecure\').textContent = data.food_insecure;
-                }
-            })
-            .catch(error => console.log(\'Error loading statistics:\', error));
-    </script>
-</body>
-</html>'''
+            from generators.templates import render_template
             
             # Fill in current date
             current_date = datetime.now().strftime("%B %d, %Y %H:%M")
-            dashboard_html = dashboard_template.replace('{current_date}', current_date)
+            dashboard_html = render_template('dashboard.html', current_date=current_date)
             
             # Save dashboard
             dashboard_path = final_dir / 'dashboard.html'
@@ -1032,113 +975,8 @@ class PeopleAuditPipeline:
     
     def create_readme(self, final_dir: Path):
         """Create README documentation"""
-        readme_content = f"""# People's Audit Pipeline Outputs
-
-## Overview
-This directory contains the complete outputs from the People's Audit pipeline analysis. 
-The audit examines Kenya's economic governance, corruption, and constitutional violations.
-
-## Generation Details
-- **Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-- **Pipeline Version**: 1.0
-- **Source Document**: THE-PEOPLES-AUDIT_compressed.pdf
-- **Constitution**: Constitution of Kenya 2010
-
-## Directory Structure
-
-### summaries/
-- `citizen_summary.md`: Simple English guide for ordinary Kenyans
-- `executive_summary.md`: Brief overview for policymakers
-- `action_handbook.md`: Practical steps citizens can take
-
-### data/
-- `Kenya_Governance_By_The_Numbers.xlsx`: Complete dataset in Excel format
-- `statistics_summary.json`: Key statistics in JSON format
-- `constitutional_violations.json`: Documented constitutional violations
-- `reform_agenda.json`: Priority governance reforms
-- `all_consolidated_data.json`: All extracted data combined
-
-### visuals/
-- `sankey.html`: Interactive Sankey diagram of fund flows
-- `charts/`: Directory containing all generated charts
-  - `html/`: Interactive HTML charts
-  - `png/`: Static PNG images
-  - `svg/`: Vector SVG images
-  - `dashboard.html`: Interactive charts dashboard
-- `debt_timeline.png`: Chart showing debt growth 2014-2025
-- `corruption_by_sector.png`: Map of corruption by sector
-
-### reports/
-- `citizen_constitutional_guide.txt`: Constitutional rights guide
-- `constitutional_validation.json`: Constitutional validation findings
-- `validation_summary.json`: Summary of constitutional violations
-
-## Key Findings
-
-### 1. Debt Crisis
-- Kenya's debt grew from KSh 2.4 trillion (2014) to KSh 12.05 trillion (2025)
-- 56% of government revenue goes to debt service
-- Each Kenyan owes approximately KSh 240,000 in public debt
-
-### 2. Corruption
-- Estimated KSh 800 billion lost annually to corruption
-- Only 6 of 47 counties received clean audit opinions (2023/24)
-- Conviction rate for corruption cases: <10%
-
-### 3. Human Impact
-- 15.5 million Kenyans food insecure
-- 20 million below poverty line
-- 1.7 million university graduates unemployed
-- 200+ killed in 2024 protests demanding accountability
-
-### 4. Constitutional Violations
-- Articles 1, 35, 43 routinely violated
-- Right to information requests ignored
-- Social and economic rights unfulfilled
-
-## How to Use These Materials
-
-### For Citizens:
-1. Start with `summaries/citizen_summary.md`
-2. Use `summaries/action_handbook.md` for practical steps
-3. Refer to `reports/citizen_constitutional_guide.txt` for legal rights
-
-### For Researchers:
-1. Use `data/` directory for complete datasets
-2. Analyze `reports/` for detailed findings
-3. Reference `visuals/` for graphical representations
-
-### For Media:
-1. Use `summaries/executive_summary.md` for quick overview
-2. Reference key statistics from `data/statistics_summary.json`
-3. Use visuals from `visuals/` for reporting
-
-## Data Sources
-All data is extracted from:
-1. "THE-PEOPLES-AUDIT: From hustle to hardship" (December 8, 2025)
-2. Constitution of Kenya 2010
-3. Official government reports (OAG, CoB, KNBS)
-
-## Pipeline Architecture
-The analysis was conducted through a 7-stage pipeline:
-
-1. **PDF Extraction**: Raw text and structure extraction
-2. **Semantic Tagging**: Categorization and tagging of content
-3. **Data Consolidation**: Aggregation and structuring of data
-4. **Constitutional Validation**: Analysis against constitutional provisions
-5. **Text Generation**: Creation of human-readable reports
-6. **Visualization**: Chart and diagram generation
-7. **Final Assembly**: Packaging of all outputs
-
-## Contact
-For questions or additional analysis, contact the Okoa Uchumi Coalition.
-
-## License
-This work is licensed under Creative Commons Attribution 4.0 International.
-
----
-Generated by People's Audit Pipeline v1.0
-"""
+        from generators.templates import render_template
+        readme_content = render_template('readme.md', generated_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
         
         with open(final_dir / 'README.md', 'w', encoding='utf-8') as f:
             f.write(readme_content)
@@ -1155,13 +993,20 @@ Generated by People's Audit Pipeline v1.0
         # Count files by type
         file_types = {}
         total_size = 0
+        # Linked artifacts share storage, so count each inode once for disk usage
+        seen_inodes = set()
+        disk_size = 0
         
         for root, dirs, files in os.walk(final_dir):
             for file in files:
                 filepath = Path(root) / file
                 relative_path = filepath.relative_to(final_dir)
                 file_type = filepath.suffix.lower()
-                file_size = filepath.stat().st_size
+                file_stat = filepath.stat()
+                file_size = file_stat.st_size
+                if (file_stat.st_dev, file_stat.st_ino) not in seen_inodes:
+                    seen_inodes.add((file_stat.st_dev, file_stat.st_ino))
+                    disk_size += file_size
                 
                 manifest['files'].append({
                     'path': str(relative_path),
@@ -1173,15 +1018,30 @@ Generated by People's Audit Pipeline v1.0
                 file_types[file_type] = file_types.get(file_type, 0) + 1
                 total_size += file_size
         
+        # How stage artifacts got into the tree (reflink, hardlink, symlink, copy or unchanged)
+        assembly = getattr(self, 'assembly', None)
+        if assembly:
+            manifest['assembly'] = {
+                'link_strategy': assembly['link_strategy'],
+                'placements': assembly['placements']
+            }
+            for entry in manifest['files']:
+                entry['placement'] = assembly['files'].get(entry['path'], 'generated')
+        
+        # Rows per workbook sheet, and any sheet that stopped early
+        workbook = getattr(self, 'workbook', None)
+        if workbook:
+            manifest['workbook'] = workbook
+        
         manifest['statistics'] = {
             'total_files': len(manifest['files']),
             'file_types': file_types,
             'total_size_bytes': total_size,
-            'total_size_human': self._human_readable_size(total_size)
+            'total_size_human': self._human_readable_size(total_size),
+            'disk_size_bytes': disk_size
         }
         
-        with open(final_dir / 'manifest.json', 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        json_io.dump(manifest, final_dir / 'manifest.json')
     
     def print_final_summary(self, final_dir: Path):
         """Print final summary of outputs"""
@@ -1252,8 +1112,7 @@ Generated by People's Audit Pipeline v1.0
         }
         
         stage1_dir = self.config['stages']['1']
-        with open(stage1_dir / 'raw_text.json', 'w', encoding='utf-8') as f:
-            json.dump(sample_data, f, indent=2, ensure_ascii=False)
+        json_io.dump(sample_data, stage1_dir / 'raw_text.json')
         
         self.logger.info("Created sample Stage 1 data")
     
@@ -1267,8 +1126,7 @@ Generated by People's Audit Pipeline v1.0
             ]
         }
         
-        with open(self.root / 'reference_materials' / 'constitution_extracted.json', 'w', encoding='utf-8') as f:
-            json.dump(sample_data, f, indent=2, ensure_ascii=False)
+        json_io.dump(sample_data, self.root / 'reference_materials' / 'constitution_extracted.json')
         
         self.logger.info("Created sample constitutional data")
     
@@ -1290,17 +1148,13 @@ Generated by People's Audit Pipeline v1.0
         }
         
         stage2_dir = self.config['stages']['2']
-        with open(stage2_dir / 'tagged_paragraphs.json', 'w', encoding='utf-8') as f:
-            json.dump(sample_data['paragraphs'], f, indent=2, ensure_ascii=False)
+        json_io.dump(sample_data['paragraphs'], stage2_dir / 'tagged_paragraphs.json')
         
-        with open(stage2_dir / 'recommendations.json', 'w', encoding='utf-8') as f:
-            json.dump(sample_data['recommendations'], f, indent=2, ensure_ascii=False)
+        json_io.dump(sample_data['recommendations'], stage2_dir / 'recommendations.json')
         
-        with open(stage2_dir / 'key_findings.json', 'w', encoding='utf-8') as f:
-            json.dump(sample_data['findings'], f, indent=2, ensure_ascii=False)
+        json_io.dump(sample_data['findings'], stage2_dir / 'key_findings.json')
         
-        with open(stage2_dir / 'timeline_events.json', 'w', encoding='utf-8') as f:
-            json.dump(sample_data['timeline'], f, indent=2, ensure_ascii=False)
+        json_io.dump(sample_data['timeline'], stage2_dir / 'timeline_events.json')
         
         self.logger.info("Created sample Stage 2 data")
     
@@ -1316,8 +1170,7 @@ Generated by People's Audit Pipeline v1.0
             ]
         }
         
-        with open(stage4_dir / 'timeline_data.json', 'w', encoding='utf-8') as f:
-            json.dump(timeline_data, f, indent=2, ensure_ascii=False)
+        json_io.dump(timeline_data, stage4_dir / 'timeline_data.json')
         
         # Create constitutional_matrix.json
         constitutional_matrix = {
@@ -1335,8 +1188,7 @@ Generated by People's Audit Pipeline v1.0
             }
         }
         
-        with open(stage4_dir / 'constitutional_matrix.json', 'w', encoding='utf-8') as f:
-            json.dump(constitutional_matrix, f, indent=2, ensure_ascii=False)
+        json_io.dump(constitutional_matrix, stage4_dir / 'constitutional_matrix.json')
         
         # Create reform_agenda.json
         reform_agenda = {
@@ -1348,8 +1200,7 @@ Generated by People's Audit Pipeline v1.0
             ]
         }
         
-        with open(stage4_dir / 'reform_agenda.json', 'w', encoding='utf-8') as f:
-            json.dump(reform_agenda, f, indent=2, ensure_ascii=False)
+        json_io.dump(reform_agenda, stage4_dir / 'reform_agenda.json')
         
         # Create other expected files
         charts_data = {
@@ -1362,8 +1213,7 @@ Generated by People's Audit Pipeline v1.0
             }
         }
         
-        with open(stage4_dir / 'charts_data.json', 'w', encoding='utf-8') as f:
-            json.dump(charts_data, f, indent=2, ensure_ascii=False)
+        json_io.dump(charts_data, stage4_dir / 'charts_data.json')
         
         statistics_summary = {
             'total_debt': '12.05 trillion',
@@ -1374,8 +1224,7 @@ Generated by People's Audit Pipeline v1.0
             'generated_date': datetime.now().isoformat()
         }
         
-        with open(stage4_dir / 'statistics_summary.json', 'w', encoding='utf-8') as f:
-            json.dump(statistics_summary, f, indent=2, ensure_ascii=False)
+        json_io.dump(statistics_summary, stage4_dir / 'statistics_summary.json')
         
         self.logger.info("Created sample Stage 3 data including missing files")
     
@@ -1398,14 +1247,11 @@ Generated by People's Audit Pipeline v1.0
             'guide': 'Sample constitutional guide text'
         }
         
-        with open(stage5_dir / 'constitutional_validation.json', 'w', encoding='utf-8') as f:
-            json.dump(validation_data['detailed'], f, indent=2, ensure_ascii=False)
+        json_io.dump(validation_data['detailed'], stage5_dir / 'constitutional_validation.json')
         
-        with open(stage5_dir / 'validation_summary.json', 'w', encoding='utf-8') as f:
-            json.dump(validation_data['summary'], f, indent=2, ensure_ascii=False)
+        json_io.dump(validation_data['summary'], stage5_dir / 'validation_summary.json')
         
-        with open(stage5_dir / 'citizen_constitutional_guide.txt', 'w', encoding='utf-8') as f:
-            f.write(validation_data['guide'])
+        write_artifact(stage5_dir / 'citizen_constitutional_guide.txt', validation_data['guide'])
         
         self.logger.info("Created sample Stage 4 data")
     
@@ -1420,8 +1266,7 @@ Generated by People's Audit Pipeline v1.0
         }
         
         for doc_name, content in sample_docs.items():
-            with open(stage3_dir / f'{doc_name}.md', 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_artifact(stage3_dir / f'{doc_name}.md', content)
         
         self.logger.info("Created sample Stage 5 data")
     
@@ -1442,8 +1287,7 @@ Generated by People's Audit Pipeline v1.0
             ]
         }
         
-        with open(stage4_dir / 'sankey_data.json', 'w', encoding='utf-8') as f:
-            json.dump(sankey_data, f, indent=2, ensure_ascii=False)
+        json_io.dump(sankey_data, stage4_dir / 'sankey_data.json')
         
         self.logger.info("Created sample visualization data")
 
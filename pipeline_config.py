@@ -36,6 +36,70 @@ class PipelineConfig:
         'save_quality_metrics': True,   # Save quality metrics to file
     })
     
+    # Semantic Tagging Settings (Stage 2)
+    semantic_tagging: Dict[str, Any] = field(default_factory=lambda: {
+        'incremental': True,           # Re-tag only new or changed paragraphs
+        'streaming': False,            # Stream pages into the output files (bounded memory)
+        'parallel': False,             # Shard pages across a process pool
+        'max_workers': None,           # Worker processes (None = CPU count)
+        'batch_size': 8,               # Pages per worker task
+        'llm_backend': {
+            'enabled': False,          # Tag with a local OpenAI-compatible server
+            'base_url': 'http://localhost:8000/v1',
+            'model': 'local-model',
+            'batch_size': 16,          # Paragraphs per request
+            'max_concurrency': 4,      # Requests in flight
+            'timeout': 30.0,           # Seconds before falling back to keywords
+            'max_failures': 3,         # Consecutive failures before giving up on the backend
+        },
+    })
+    
+    # Data Consolidation Settings (Stage 3)
+    consolidation: Dict[str, Any] = field(default_factory=lambda: {
+        'parallel': False,             # Run dataset builders concurrently
+        'executor': 'thread',          # 'thread' or 'process' pool for builders
+        'max_workers': None,           # Pool size (None = executor default)
+    })
+    
+    # Constitutional Validation Settings (Stage 4)
+    validation: Dict[str, Any] = field(default_factory=lambda: {
+        'incremental': True,           # Reuse results for unchanged references
+        'parallel': False,             # Shard articles across a process pool
+        'max_workers': None,           # Worker processes (None = CPU count)
+        'batch_size': 16,              # Articles per worker task
+        'reference_corpus': False,     # Also validate extracted Acts and CoB reports
+        'pdf_parallel': True,          # Render citizen guide PDF chunks in a process pool
+        'pdf_sections_per_chunk': 8,   # Guide sections per PDF chunk
+    })
+    
+    # Text Generation Settings (Stage 5)
+    text_generation: Dict[str, Any] = field(default_factory=lambda: {
+        'incremental': True,           # Only regenerate documents whose inputs changed
+        'parallel': True,              # Generate stale documents concurrently
+        'max_workers': None,           # Thread pool size (None = executor default)
+    })
+    
+    # Visualization Settings (Stage 6)
+    visualization: Dict[str, Any] = field(default_factory=lambda: {
+        'incremental': True,           # Reuse charts whose data, config and renderers are unchanged
+        'parallel': False,             # Render charts across a process pool
+        'max_workers': None,           # Worker processes (None = CPU count)
+        'plotlyjs': 'local',           # 'local' (one shared bundle in charts/js), 'inline' or 'cdn'
+        'static_engine': 'kaleido',    # PNG/SVG from the Plotly figure via kaleido, or 'matplotlib'
+    })
+    
+    # JSON Serialization Settings (all stages)
+    serialization: Dict[str, Any] = field(default_factory=lambda: {
+        'backend': 'auto',             # 'auto' (orjson if installed), 'orjson' or 'stdlib'
+        'pretty': True,                # Indent human-facing JSON outputs
+        'compact_machine': True,       # No whitespace in machine-facing outputs (aggregates, API, all_consolidated_data.json)
+    })
+    
+    # Final Assembly Settings (Stage 7)
+    final_assembly: Dict[str, Any] = field(default_factory=lambda: {
+        'link_strategy': 'auto',       # 'auto' (reflink, else hardlink, else copy), or reflink/hardlink/symlink/copy
+    })
+    
     # Visualization
     chart_width: int = 1200
     chart_height: int = 800
@@ -69,6 +133,70 @@ class PipelineConfig:
             'save_quality_metrics': os.getenv('SAVE_QUALITY_METRICS', 'true').lower() == 'true',
         }
         
+        # Semantic tagging settings from env
+        semantic_opts = {
+            'incremental': os.getenv('SEMANTIC_INCREMENTAL', 'true').lower() == 'true',
+            'streaming': os.getenv('SEMANTIC_STREAMING', 'false').lower() == 'true',
+            'parallel': os.getenv('SEMANTIC_PARALLEL', 'false').lower() == 'true',
+            'max_workers': int(os.getenv('SEMANTIC_MAX_WORKERS')) if os.getenv('SEMANTIC_MAX_WORKERS') else None,
+            'batch_size': int(os.getenv('SEMANTIC_BATCH_SIZE', '8')),
+            'llm_backend': {
+                'enabled': os.getenv('LLM_TAGGING', 'false').lower() == 'true',
+                'base_url': os.getenv('LLM_BASE_URL', 'http://localhost:8000/v1'),
+                'model': os.getenv('LLM_MODEL', 'local-model'),
+                'batch_size': int(os.getenv('LLM_BATCH_SIZE', '16')),
+                'max_concurrency': int(os.getenv('LLM_MAX_CONCURRENCY', '4')),
+                'timeout': float(os.getenv('LLM_TIMEOUT', '30')),
+                'max_failures': int(os.getenv('LLM_MAX_FAILURES', '3')),
+            },
+        }
+        
+        # Data consolidation settings from env
+        consolidation_opts = {
+            'parallel': os.getenv('CONSOLIDATION_PARALLEL', 'false').lower() == 'true',
+            'executor': os.getenv('CONSOLIDATION_EXECUTOR', 'thread'),
+            'max_workers': int(os.getenv('CONSOLIDATION_MAX_WORKERS')) if os.getenv('CONSOLIDATION_MAX_WORKERS') else None,
+        }
+        
+        # Constitutional validation settings from env
+        validation_opts = {
+            'incremental': os.getenv('VALIDATION_INCREMENTAL', 'true').lower() == 'true',
+            'parallel': os.getenv('VALIDATION_PARALLEL', 'false').lower() == 'true',
+            'max_workers': int(os.getenv('VALIDATION_MAX_WORKERS')) if os.getenv('VALIDATION_MAX_WORKERS') else None,
+            'batch_size': int(os.getenv('VALIDATION_BATCH_SIZE', '16')),
+            'reference_corpus': os.getenv('VALIDATION_REFERENCE_CORPUS', 'false').lower() == 'true',
+            'pdf_parallel': os.getenv('VALIDATION_PDF_PARALLEL', 'true').lower() == 'true',
+            'pdf_sections_per_chunk': int(os.getenv('VALIDATION_PDF_SECTIONS_PER_CHUNK', '8')),
+        }
+        
+        # Text generation settings from env
+        generation_opts = {
+            'incremental': os.getenv('TEXT_GENERATION_INCREMENTAL', 'true').lower() == 'true',
+            'parallel': os.getenv('TEXT_GENERATION_PARALLEL', 'true').lower() == 'true',
+            'max_workers': int(os.getenv('TEXT_GENERATION_MAX_WORKERS')) if os.getenv('TEXT_GENERATION_MAX_WORKERS') else None,
+        }
+        
+        # Visualization settings from env
+        visualization_opts = {
+            'incremental': os.getenv('VISUALIZATION_INCREMENTAL', 'true').lower() == 'true',
+            'parallel': os.getenv('VISUALIZATION_PARALLEL', 'false').lower() == 'true',
+            'max_workers': int(os.getenv('VISUALIZATION_MAX_WORKERS')) if os.getenv('VISUALIZATION_MAX_WORKERS') else None,
+            'plotlyjs': os.getenv('VISUALIZATION_PLOTLYJS', 'local'),
+            'static_engine': os.getenv('VISUALIZATION_STATIC_ENGINE', 'kaleido'),
+        }
+        
+        # JSON serialization settings from env
+        serialization_opts = {
+            'backend': os.getenv('JSON_BACKEND', 'auto'),
+            'pretty': os.getenv('JSON_PRETTY', 'true').lower() == 'true',
+            'compact_machine': os.getenv('JSON_COMPACT_MACHINE', 'true').lower() == 'true',
+        }
+        
+        # Final assembly settings from env
+        assembly_opts = {
+            'link_strategy': os.getenv('ASSEMBLY_LINK_STRATEGY', 'auto'),
+        }
+        
         return cls(
             root_dir=root,
             input_dir=Path(os.getenv('INPUT_DIR', root / "input")),
@@ -77,7 +205,14 @@ class PipelineConfig:
             logs_dir=Path(os.getenv('LOGS_DIR', root / "logs")),
             chunk_size=int(os.getenv('CHUNK_SIZE', 1000)),
             max_workers=int(os.getenv('MAX_WORKERS', 4)),
-            extraction_optimization=extraction_opts
+            extraction_optimization=extraction_opts,
+            semantic_tagging=semantic_opts,
+            consolidation=consolidation_opts,
+            validation=validation_opts,
+            text_generation=generation_opts,
+            visualization=visualization_opts,
+            serialization=serialization_opts,
+            final_assembly=assembly_opts
         )
 
 # Create default config
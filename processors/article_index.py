@@ -0,0 +1,99 @@
+# processors/article_index.py
+import re
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from processors import json_io
+from processors.artifact_writer import write_artifact
+
+logger = logging.getLogger(__name__)
+
+# Same forms the Stage 1 extractor recognises: "Article 43", "Article 6(2)", "Art. 201", "Art 35"
+ARTICLE_PATTERN = re.compile(r'\bArt(?:icle\s*|\.\s*|\s+)(\d+[a-z]?(?:\(\d+[a-z]?\))?)', re.IGNORECASE)
+_SENTENCE_END = re.compile(r'[.!?](?=\s|$)')
+
+# PDF text often has no sentence punctuation for long stretches, so windows are capped
+MAX_WINDOW_CHARS = 300
+
+
+class ArticleIndexBuilder:
+    """Builds the article -> paragraph inverted index while paragraphs are tagged
+
+    Each reference records the paragraph id and page it was found in, the
+    character offsets of the match in the paragraph text, and the sentence
+    around it. The validator reads the windows straight from the index, so
+    it never has to rescan the document text.
+
+    Paragraphs should be indexed from their raw Stage 1 text. The tagger's
+    cleaned text drops parentheses, so sub-clauses such as 6(2) would be
+    lost and the offsets would not point into the source paragraph.
+    """
+
+    def __init__(self):
+        self.articles: Dict[str, List[Dict[str, Any]]] = {}
+        self.paragraphs = 0
+
+    def add(self, paragraph_id: str, page: int, text: str) -> int:
+        """Index the article references in one paragraph, returning how many were found"""
+        self.paragraphs += 1
+        found = 0
+        for match in ARTICLE_PATTERN.finditer(text):
+            sentence_start, sentence_end = sentence_window(text, match.start(), match.end())
+            self.articles.setdefault(match.group(1), []).append({
+                'paragraph_id': paragraph_id,
+                'page': page,
+                'start': match.start(),
+                'end': match.end(),
+                'sentence_start': sentence_start,
+                'sentence_end': sentence_end,
+                'context': text[sentence_start:sentence_end]
+            })
+            found += 1
+        return found
+
+    def add_all(self, paragraphs: Iterable[Tuple[str, int, str]]):
+        """Index (paragraph id, page, raw text) triples, e.g. from SemanticTagger.iter_source_paragraphs"""
+        for paragraph_id, page, text in paragraphs:
+            self.add(paragraph_id, page, text)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'paragraphs_indexed': self.paragraphs,
+            'total_references': sum(len(refs) for refs in self.articles.values()),
+            'articles': self.articles
+        }
+
+    def save(self, path: Path) -> int:
+        size = write_artifact(path, self.to_dict())
+        logger.info(f"Indexed {len(self.articles)} constitutional articles to {path}")
+        return size
+
+
+def sentence_window(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Offsets of the sentence containing text[start:end], capped at MAX_WINDOW_CHARS per side"""
+    lower = max(0, start - MAX_WINDOW_CHARS)
+    window_start = lower
+    for match in _SENTENCE_END.finditer(text, lower, start):
+        window_start = match.end()
+
+    upper = min(len(text), end + MAX_WINDOW_CHARS)
+    match = _SENTENCE_END.search(text, end, upper)
+    window_end = match.end() if match else upper
+
+    # Trim the whitespace left after the previous sentence's full stop
+    while window_start < start and text[window_start].isspace():
+        window_start += 1
+    return window_start, window_end
+
+
+def load_article_index(path: Path) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Article references keyed by article number, or None when there is no index"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        return json_io.load(path).get('articles', {})
+    except Exception as e:
+        logger.warning(f"Could not load article index {path}: {e}")
+        return None
@@ -0,0 +1,142 @@
+# processors/artifact_linker.py
+import os
+import sys
+import errno
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Linux ioctl for copy-on-write clones (btrfs, XFS, overlay on those)
+_FICLONE = 0x40049409
+
+
+class ArtifactLinker:
+    """Places pipeline artifacts into the final output tree without copying where possible
+
+    Targets whose size, modification time and content already match the
+    source are left alone. New or changed artifacts are placed with the
+    first strategy the filesystem supports: a copy-on-write reflink, then a
+    hard link, then a plain copy. Every placement goes through a temporary
+    name and os.replace, so a target is never half-written.
+
+    Hard links are safe because every writer of the placed stage files
+    replaces its file atomically instead of rewriting it, so a hard-linked
+    target keeps the old content until the next placement. Symlinks are
+    only used when asked for: they follow the stage path, so final_outputs
+    shows a stage file as soon as a later run replaces it.
+    """
+
+    STRATEGIES = ['reflink', 'hardlink', 'symlink', 'copy']
+
+    # Strategies whose targets keep their content while the stage files are rewritten
+    AUTO_STRATEGIES = ['reflink', 'hardlink', 'copy']
+
+    def __init__(self, strategy: str = 'auto'):
+        if strategy != 'auto' and strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown link strategy: {strategy}")
+        self.strategy = strategy
+        self.logger = logging.getLogger(__name__)
+        if strategy == 'symlink':
+            self.logger.warning("Symlinked final outputs change as soon as a run rewrites the stage files")
+        self.placements: Dict[str, str] = {}
+        # Strategies that failed once for lack of filesystem support are not retried
+        self._unsupported = set()
+
+    @property
+    def candidates(self) -> List[str]:
+        if self.strategy == 'auto':
+            return self.AUTO_STRATEGIES
+        # An explicit strategy still falls back to a copy rather than failing the stage
+        return [self.strategy] if self.strategy == 'copy' else [self.strategy, 'copy']
+
+    def place(self, source: Path, target: Path) -> str:
+        """Make target hold the content of source, returning the strategy used"""
+        source, target = Path(source), Path(target)
+
+        if self._is_current(source, target):
+            used = 'unchanged'
+        else:
+            used = self._place_new(source, target)
+
+        self.placements[str(target)] = used
+        return used
+
+    def summary(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for used in self.placements.values():
+            counts[used] = counts.get(used, 0) + 1
+        return counts
+
+    def _is_current(self, source: Path, target: Path) -> bool:
+        if not target.exists():
+            return False
+        try:
+            if os.path.samefile(source, target):
+                return True
+        except OSError:
+            return False
+        if target.is_symlink():
+            return False
+        # Reflinks and copies keep the source's mtime, so a changed source shows up here unhashed
+        source_stat, target_stat = source.stat(), target.stat()
+        if (source_stat.st_size != target_stat.st_size
+                or source_stat.st_mtime_ns != target_stat.st_mtime_ns):
+            return False
+        return file_hash(source) == file_hash(target)
+
+    def _place_new(self, source: Path, target: Path) -> str:
+        tmp = target.with_name(f".{target.name}.tmp")
+        for strategy in self.candidates:
+            if strategy in self._unsupported:
+                continue
+            try:
+                if tmp.exists() or tmp.is_symlink():
+                    tmp.unlink()
+                getattr(self, f'_{strategy}')(source, tmp)
+                os.replace(tmp, target)
+                return strategy
+            except OSError as e:
+                if e.errno in (errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP,
+                               errno.EINVAL, errno.ENOTTY, errno.EMLINK):
+                    self.logger.debug(f"{strategy} unavailable for {target}: {e}")
+                    self._unsupported.add(strategy)
+                    continue
+                raise
+            finally:
+                if tmp.exists() or tmp.is_symlink():
+                    tmp.unlink()
+        raise OSError(f"Could not place {source} at {target}")
+
+    @staticmethod
+    def _reflink(source: Path, tmp: Path):
+        if not sys.platform.startswith('linux'):
+            raise OSError(errno.ENOTSUP, "reflink not supported on this platform")
+        import fcntl
+        with open(source, 'rb') as src, open(tmp, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, tmp)
+
+    @staticmethod
+    def _hardlink(source: Path, tmp: Path):
+        os.link(source, tmp)
+
+    @staticmethod
+    def _symlink(source: Path, tmp: Path):
+        os.symlink(os.path.relpath(source.resolve(), tmp.parent.resolve()), tmp)
+
+    @staticmethod
+    def _copy(source: Path, tmp: Path):
+        shutil.copy2(source, tmp)
+
+
+def file_hash(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's content, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
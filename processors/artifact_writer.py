@@ -0,0 +1,42 @@
+# processors/artifact_writer.py
+import logging
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from processors import json_io
+from processors.atomic_file import atomic_replace
+
+logger = logging.getLogger(__name__)
+
+
+def write_artifact(filepath: Path, data: Any) -> int:
+    """Write one pipeline artifact atomically and return its size in bytes
+
+    The format follows the file extension: .json goes through json_io and
+    .csv expects a DataFrame. Any other extension accepts str or bytes. The
+    data goes to a temporary file in the target directory, which then
+    replaces the target, so readers never see a half-written artifact.
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    suffix = filepath.suffix.lower()
+
+    if suffix == '.csv' and not isinstance(data, pd.DataFrame):
+        raise TypeError(f"Data for {filepath.name} is not a DataFrame")
+
+    with atomic_replace(filepath) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            if suffix == '.json':
+                f.write(json_io.dumps(data))
+            elif suffix == '.csv':
+                data.to_csv(f, index=False, encoding='utf-8')
+            elif isinstance(data, bytes):
+                f.write(data)
+            else:
+                f.write(str(data).encode('utf-8'))
+            size = f.tell()
+
+    logger.debug(f"Wrote {filepath} ({size} bytes)")
+    return size
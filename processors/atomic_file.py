@@ -0,0 +1,43 @@
+# processors/atomic_file.py
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# Read once at import: os.umask can only be queried by setting it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def default_mode(path: Path) -> int:
+    """Permission bits for a replacement of path: the existing file's, else 0666 less the umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_replace(path: Path) -> Iterator[Path]:
+    """Yield a temporary path next to path, which replaces path when the block succeeds
+
+    mkstemp creates the temporary file owner-only (0600), so it is given the
+    permissions a plain open() would have produced before the replace.
+    Readers never see a half-written file, and a file hard-linked to the old
+    path keeps the old content. On error the temporary file is removed.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    os.close(fd)
+    try:
+        yield Path(tmp_name)
+        os.chmod(tmp_name, default_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,197 @@
+# processors/columnar_store.py
+import os
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Union
+
+import pandas as pd
+
+from processors import json_io
+from processors.atomic_file import atomic_replace
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ARROW_SUFFIX = '.arrow'
+
+# Record fields that are only present on some records, dropped again when null
+OPTIONAL_FIELDS = {'duplicate_ids'}
+
+
+def _schemas() -> Dict[str, 'pa.Schema']:
+    """Declared Arrow schemas for the Stage 1/2 record lists"""
+    tags = pa.list_(pa.string())
+    return {
+        'tagged_paragraphs': pa.schema([
+            ('paragraph_id', pa.string()),
+            ('text', pa.string()),
+            ('tags', tags),
+            ('category', pa.string()),
+            ('confidence', pa.float64()),
+            ('page_number', pa.int32()),
+            ('metadata', pa.struct([
+                ('has_monetary_value', pa.bool_()),
+                ('has_percentage', pa.bool_()),
+                ('has_year', pa.bool_()),
+                ('has_article', pa.bool_()),
+                ('has_institution', pa.bool_()),
+                ('word_count', pa.int32())
+            ]))
+        ]),
+        'recommendations': pa.schema([
+            ('id', pa.string()),
+            ('text', pa.string()),
+            ('page', pa.int32()),
+            ('tags', tags),
+            ('priority', pa.string()),
+            ('duplicate_ids', tags)
+        ]),
+        'key_findings': pa.schema([
+            ('id', pa.string()),
+            ('text', pa.string()),
+            ('page', pa.int32()),
+            ('tags', tags),
+            ('severity', pa.string()),
+            ('duplicate_ids', tags)
+        ]),
+        'timeline_events': pa.schema([
+            ('id', pa.string()),
+            ('year', pa.string()),
+            ('text', pa.string()),
+            ('page', pa.int32()),
+            ('category', pa.string()),
+            ('duplicate_ids', tags)
+        ]),
+        'numeric_facts': pa.schema([
+            ('kind', pa.string()),
+            ('value', pa.float64()),
+            ('unit', pa.string()),
+            ('currency', pa.string()),
+            ('page', pa.int32()),
+            ('position', pa.int64()),
+            ('original_text', pa.string()),
+            ('context', pa.string())
+        ])
+    }
+
+
+def schema_for(name: str) -> Optional['pa.Schema']:
+    return _schemas().get(name) if PYARROW_AVAILABLE else None
+
+
+def arrow_path(path: Path) -> Path:
+    """Arrow IPC sibling of a JSON/CSV artifact"""
+    return Path(path).with_suffix(ARROW_SUFFIX)
+
+
+def fresh_arrow_path(path: Path) -> Optional[Path]:
+    """The Arrow sibling of an artifact, if it exists and is not older than the artifact"""
+    if not PYARROW_AVAILABLE:
+        return None
+    path = Path(path)
+    sibling = arrow_path(path)
+    if not sibling.exists():
+        return None
+    if path.exists() and sibling.stat().st_mtime < path.stat().st_mtime:
+        return None
+    return sibling
+
+
+def _to_table(data: Union[pd.DataFrame, List[Dict]], schema: Optional['pa.Schema']) -> 'pa.Table':
+    if isinstance(data, pd.DataFrame):
+        return pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+    return pa.Table.from_pylist(list(data), schema=schema)
+
+
+def write_arrow(path: Path, data: Union[pd.DataFrame, List[Dict]], name: Optional[str] = None) -> int:
+    """Write records or a DataFrame as an Arrow IPC file, atomically
+
+    With name set, the declared schema for that artifact is used. Otherwise
+    the schema comes from the DataFrame dtypes. Returns the bytes written.
+    """
+    table = _to_table(data, schema_for(name) if name else None)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with atomic_replace(path) as tmp_path:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    return path.stat().st_size
+
+
+def read_arrow(path: Path, columns: Optional[List[str]] = None) -> 'pa.Table':
+    """Memory-map an Arrow IPC file; buffers are read lazily from the page cache"""
+    source = pa.memory_map(str(path), 'r')
+    table = pa.ipc.open_file(source).read_all()
+    if columns:
+        table = table.select([column for column in columns if column in table.column_names])
+    return table
+
+
+def iter_arrow_records(path: Path, columns: Optional[List[str]] = None) -> Iterator[Dict]:
+    """Yield records from an Arrow IPC file one record batch at a time"""
+    reader = pa.ipc.open_file(pa.memory_map(str(path), 'r'))
+    for i in range(reader.num_record_batches):
+        table = pa.Table.from_batches([reader.get_batch(i)])
+        if columns:
+            table = table.select([column for column in columns if column in table.column_names])
+        yield from table.to_pylist()
+
+
+def _records(table: 'pa.Table') -> List[Dict]:
+    records = table.to_pylist()
+    optional = OPTIONAL_FIELDS.intersection(table.column_names)
+    if optional:
+        for record in records:
+            for key in optional:
+                if record[key] is None:
+                    del record[key]
+    return records
+
+
+def load_records(path: Path, columns: Optional[List[str]] = None) -> Any:
+    """Load a record-list artifact, preferring its Arrow sibling over the JSON"""
+    sibling = fresh_arrow_path(path)
+    if sibling is not None:
+        try:
+            return _records(read_arrow(sibling, columns))
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not read {sibling}, falling back to {Path(path).name}: {e}")
+    return json_io.load(path)
+
+
+class ArrowRecordWriter:
+    """Append records to an Arrow IPC file in fixed-size record batches"""
+
+    def __init__(self, path: Path, name: str, batch_size: int = 1024):
+        self.path = Path(path)
+        self.schema = schema_for(name)
+        self.batch_size = batch_size
+        self._pending: List[Dict] = []
+        self._tmp_name = str(self.path.with_name(f".{self.path.name}.tmp"))
+        self._sink = pa.OSFile(self._tmp_name, 'wb')
+        self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def append(self, record: Dict):
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._writer.write_batch(pa.RecordBatch.from_pylist(self._pending, schema=self.schema))
+            self._pending = []
+
+    def close(self) -> int:
+        self._flush()
+        self._writer.close()
+        self._sink.close()
+        os.replace(self._tmp_name, self.path)
+        return self.path.stat().st_size
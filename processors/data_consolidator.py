@@ -1,12 +1,21 @@
 import re
-import json
+import time
 import pandas as pd
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import threading
 import logging
 from datetime import datetime, timedelta
 import numpy as np
 
+from processors.numeric_facts import NumericFactFrame
+from processors import json_io
+from processors.artifact_writer import write_artifact
+from processors.columnar_store import (
+    PYARROW_AVAILABLE, arrow_path, fresh_arrow_path, load_records, read_arrow, write_arrow
+)
+
 class DataConsolidator:
     """Consolidates data from multiple extraction stages into unified datasets"""
     
@@ -39,62 +48,76 @@ class DataConsolidator:
             'categories': ['Debt Service', 'Recurrent Expenditure', 'Development', 'Other'],
             'percentages': [56, 29, 15, 0]
         }
+        
+        # Budget lines mapped to NumericFactFrame sector tags
+        self.budget_fact_sectors = {
+            'Debt Service': 'Debt',
+            'Development': 'Infrastructure',
+            'County Allocation': 'Counties',
+            'Education': 'Education',
+            'Health': 'Health',
+            'Security': 'Security',
+            'Agriculture': 'Agriculture'
+        }
     
-    def consolidate_all(self) -> Dict[str, Any]:
-        """Consolidate all data from stages 1 and 2"""
-        self.logger.info("Starting data consolidation")
+    # Stage 1/2 artifacts the builders read, by input name
+    INPUTS = {
+        'raw_text': ('stage1', 'raw_text.json'),
+        'document_structure': ('stage1', 'document_structure.json'),
+        'numeric_facts': ('stage1', 'numeric_facts.json'),
+        'references': ('stage1', 'references.json'),
+        'tagged_paragraphs': ('stage2', 'tagged_paragraphs.json'),
+        'recommendations': ('stage2', 'recommendations.json'),
+        'key_findings': ('stage2', 'key_findings.json'),
+        'timeline_events': ('stage2', 'timeline_events.json')
+    }
+    
+    # Columns the builders use from record inputs read via Arrow (others = all columns)
+    INPUT_COLUMNS = {
+        'tagged_paragraphs': ['paragraph_id', 'tags', 'category', 'confidence', 'page_number']
+    }
+    
+    # Output file -> (builder method, inputs); no builder depends on another
+    BUILDERS = [
+        ('sankey_data.json', 'create_sankey_data', ('tagged_paragraphs', 'numeric_facts')),
+        ('charts_data.json', 'create_charts_data', ('numeric_facts', 'key_findings')),
+        ('timeline_data.json', 'create_timeline_data', ('timeline_events', 'numeric_facts')),
+        ('constitutional_matrix.json', 'create_constitutional_matrix', ('references', 'tagged_paragraphs')),
+        ('corruption_cases.csv', 'create_corruption_cases', ('tagged_paragraphs',)),
+        ('debt_analysis.csv', 'create_debt_analysis', ('numeric_facts',)),
+        ('budget_analysis.csv', 'create_budget_analysis', ('numeric_facts',)),
+        ('reform_agenda.json', 'create_reform_agenda', ('recommendations',)),
+        ('statistics_summary.json', 'create_statistics_summary', ('numeric_facts', 'key_findings'))
+    ]
+    
+    def consolidate_all(self, parallel: bool = False, executor: str = 'thread',
+                        max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Consolidate all data from stages 1 and 2
         
-        consolidated_data = {}
+        Args:
+            parallel: Run builders concurrently and save each output as soon as it is built
+            executor: 'thread' or 'process' pool for the builders
+            max_workers: Pool size (None = executor default)
+        """
+        self.logger.info("Starting data consolidation")
+        started = time.perf_counter()
+        self.timings = {}
         
         try:
-            # Load all available data
-            raw_text = self._load_json_safe(self.stage1_dir / 'raw_text.json')
-            document_structure = self._load_json_safe(self.stage1_dir / 'document_structure.json')
-            numeric_facts = self._load_json_safe(self.stage1_dir / 'numeric_facts.json')
-            references = self._load_json_safe(self.stage1_dir / 'references.json')
-            
-            tagged_paragraphs = self._load_json_safe(self.stage2_dir / 'tagged_paragraphs.json')
-            recommendations = self._load_json_safe(self.stage2_dir / 'recommendations.json')
-            key_findings = self._load_json_safe(self.stage2_dir / 'key_findings.json')
-            timeline_events = self._load_json_safe(self.stage2_dir / 'timeline_events.json')
-            
-            # Generate all consolidated datasets
-            self.logger.info("Generating sankey data...")
-            consolidated_data['sankey_data.json'] = self.create_sankey_data(tagged_paragraphs, numeric_facts)
-            
-            self.logger.info("Generating charts data...")
-            consolidated_data['charts_data.json'] = self.create_charts_data(numeric_facts, key_findings)
-            
-            self.logger.info("Generating timeline data...")
-            consolidated_data['timeline_data.json'] = self.create_timeline_data(timeline_events, numeric_facts)
-            
-            self.logger.info("Generating constitutional matrix...")
-            consolidated_data['constitutional_matrix.json'] = self.create_constitutional_matrix(references, tagged_paragraphs)
-            
-            self.logger.info("Generating corruption cases...")
-            corruption_df = self.create_corruption_cases(tagged_paragraphs)
-            consolidated_data['corruption_cases.csv'] = corruption_df
-            
-            self.logger.info("Generating debt analysis...")
-            debt_df = self.create_debt_analysis(numeric_facts)
-            consolidated_data['debt_analysis.csv'] = debt_df
-            
-            self.logger.info("Generating budget analysis...")
-            budget_df = self.create_budget_analysis(numeric_facts)
-            consolidated_data['budget_analysis.csv'] = budget_df
-            
-            self.logger.info("Generating reform agenda...")
-            consolidated_data['reform_agenda.json'] = self.create_reform_agenda(recommendations)
-            
-            self.logger.info("Generating statistics summary...")
-            consolidated_data['statistics_summary.json'] = self.create_statistics_summary(numeric_facts, key_findings)
+            inputs = InputRegistry(self)
+            if parallel:
+                consolidated_data = self._consolidate_parallel(inputs, executor, max_workers)
+            else:
+                consolidated_data = self._consolidate_serial(inputs)
             
-            # Save all files
-            self.logger.info("Saving consolidated data files...")
-            for filename, data in consolidated_data.items():
-                self._save_data_file(filename, data)
+            self.timings['inputs'] = dict(inputs.timings)
+            unused = [name for name in self.INPUTS if name not in inputs.timings]
+            if unused:
+                self.logger.info(f"Inputs never requested, not loaded: {', '.join(unused)}")
             
-            self.logger.info(f"Data consolidation completed: {len(consolidated_data)} files generated")
+            total = time.perf_counter() - started
+            self.timings['total_seconds'] = round(total, 4)
+            self.logger.info(f"Data consolidation completed: {len(consolidated_data)} files generated in {total:.2f}s")
             
             return consolidated_data
             
@@ -102,6 +125,89 @@ class DataConsolidator:
             self.logger.error(f"Error in data consolidation: {str(e)}")
             raise
     
+    def _consolidate_serial(self, inputs: 'InputRegistry') -> Dict[str, Any]:
+        consolidated_data = {}
+        for filename, method, input_names in self.BUILDERS:
+            data, build_seconds = _run_builder(self, method, [inputs.get(name) for name in input_names])
+            consolidated_data[filename] = data
+            self._record_timing(filename, build_seconds, self._timed_save(filename, data))
+        
+        return consolidated_data
+    
+    def _consolidate_parallel(self, inputs: 'InputRegistry', executor: str,
+                              max_workers: Optional[int]) -> Dict[str, Any]:
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"Unknown executor: {executor}")
+        pool_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+        self.logger.info(f"Running {len(self.BUILDERS)} builders on a {executor} pool")
+        
+        results = {}
+        # Saving is I/O bound and gets its own thread pool alongside the builders
+        with ThreadPoolExecutor(max_workers=4) as io_pool, pool_class(max_workers=max_workers) as build_pool:
+            build_futures = {}
+            for filename, method, input_names in self.BUILDERS:
+                if executor == 'process':
+                    # Worker processes cannot share the registry, resolve inputs here
+                    args = [inputs.get(name) for name in input_names]
+                    future = build_pool.submit(_run_builder, self, method, args)
+                else:
+                    future = build_pool.submit(self._run_builder_lazy, inputs, method, input_names)
+                build_futures[future] = filename
+            
+            save_futures = {}
+            for future in as_completed(build_futures):
+                filename = build_futures[future]
+                data, build_seconds = future.result()
+                results[filename] = (data, build_seconds)
+                save_futures[filename] = io_pool.submit(self._timed_save, filename, data)
+            
+            for filename, future in save_futures.items():
+                self._record_timing(filename, results[filename][1], future.result())
+        
+        # Keep the serial output order
+        return {filename: results[filename][0] for filename, _, _ in self.BUILDERS}
+    
+    def _run_builder_lazy(self, inputs: 'InputRegistry', method: str,
+                          input_names: Tuple[str, ...]) -> Tuple[Any, float]:
+        """Resolve inputs from the shared registry inside the worker thread, then build"""
+        return _run_builder(self, method, [inputs.get(name) for name in input_names])
+    
+    def _load_input(self, name: str) -> Any:
+        stage, filename = self.INPUTS[name]
+        directory = self.stage1_dir if stage == 'stage1' else self.stage2_dir
+        filepath = directory / filename
+        
+        # Prefer the memory-mapped Arrow copy when it is current
+        if fresh_arrow_path(filepath) is not None:
+            try:
+                if name == 'numeric_facts':
+                    data = NumericFactFrame.from_flat(read_arrow(arrow_path(filepath)).to_pandas())
+                    self.logger.info(f"Loaded {len(data.frame)} numeric facts from Arrow")
+                    return data
+                return load_records(filepath, self.INPUT_COLUMNS.get(name))
+            except Exception as e:
+                self.logger.warning(f"Could not read Arrow copy of {filename}, using JSON: {e}")
+        
+        data = self._load_json_safe(filepath)
+        if name == 'numeric_facts':
+            data = NumericFactFrame(data)
+            self.logger.info(f"Loaded {len(data.frame)} numeric facts into columnar frame")
+        return data
+    
+    def _timed_save(self, filename: str, data: Any) -> Tuple[float, int]:
+        started = time.perf_counter()
+        size = self._save_data_file(filename, data)
+        return time.perf_counter() - started, size
+    
+    def _record_timing(self, filename: str, build_seconds: float, saved: Tuple[float, int]):
+        save_seconds, size = saved
+        self.timings[filename] = {
+            'build_seconds': round(build_seconds, 4),
+            'save_seconds': round(save_seconds, 4),
+            'bytes': size
+        }
+        self.logger.info(f"{filename}: built in {build_seconds:.3f}s, saved {size} bytes in {save_seconds:.3f}s")
+    
     def create_sankey_data(self, tagged_data: List, numeric_data: Dict) -> Dict:
         """Create Sankey diagram data showing fund flows"""
         sankey_data = {
@@ -162,8 +268,11 @@ class DataConsolidator:
         
         return sankey_data
     
-    def create_charts_data(self, numeric_data: Dict, findings_data: List) -> Dict:
+    def create_charts_data(self, numeric_data: NumericFactFrame, findings_data: List) -> Dict:
         """Create comprehensive charts dataset"""
+        facts = NumericFactFrame.coerce(numeric_data)
+        sector_summary = facts.sector_summary()
+        
         charts_data = {
             "debt_timeline": {
                 "title": "Kenya Public Debt Growth (2014-2025)",
@@ -245,6 +354,22 @@ class DataConsolidator:
                     "units": "Millions of People",
                     "population_2025": "55 million"
                 }
+            },
+            
+            "cited_figures_by_sector": {
+                "title": "Monetary Figures Cited in the Audit by Sector (KSh Billions)",
+                "type": "bar",
+                "description": "Sum and count of KSh amounts extracted from the audit text, by sector keywords in their context",
+                "data": {
+                    "sectors": sector_summary['sector'].tolist(),
+                    "amounts": sector_summary['amount'].round(1).tolist(),
+                    "mentions": sector_summary['mentions'].astype(int).tolist()
+                },
+                "metadata": {
+                    "source": "People's Audit (Stage 1 numeric facts)",
+                    "units": "KSh Billions",
+                    "total_facts": int(len(facts.frame))
+                }
             }
         }
         
@@ -648,21 +773,32 @@ class DataConsolidator:
         
         return pd.DataFrame(corruption_cases)
     
-    def create_debt_analysis(self, numeric_data: Dict) -> pd.DataFrame:
+    def create_debt_analysis(self, numeric_data: NumericFactFrame) -> pd.DataFrame:
         """Create debt analysis DataFrame"""
-        debt_analysis = []
+        facts = NumericFactFrame.coerce(numeric_data)
         
         # Debt by year analysis
-        for year, amount in zip(self.debt_timeline['years'], self.debt_timeline['debt_amounts']):
-            debt_analysis.append({
-                "year": int(year),
-                "debt_amount_trillions": amount,
-                "debt_gdp_percentage": self.debt_timeline['debt_gdp'][self.debt_timeline['years'].index(year)],
-                "per_capita_debt_thousands": amount * 1000 / 50,  # Simplified calculation
-                "debt_service_ratio": self.debt_timeline['debt_gdp'][self.debt_timeline['years'].index(year)] * 0.8,
-                "debt_type": "Total Public Debt",
-                "risk_level": "High" if int(year) >= 2020 else "Medium"
-            })
+        years = np.array(self.debt_timeline['years'], dtype=int)
+        amounts = np.array(self.debt_timeline['debt_amounts'])
+        debt_gdp = np.array(self.debt_timeline['debt_gdp'])
+        
+        debt_analysis = pd.DataFrame({
+            "year": years,
+            "debt_amount_trillions": amounts,
+            "debt_gdp_percentage": debt_gdp,
+            "per_capita_debt_thousands": amounts * 1000 / 50,  # Simplified calculation
+            "debt_service_ratio": debt_gdp * 0.8,
+            "debt_type": "Total Public Debt",
+            "risk_level": np.where(years >= 2020, "High", "Medium")
+        })
+        
+        # Largest debt figure the audit itself cites for each year
+        cited = facts.sector_by_year('Debt', scale=1e12)
+        debt_analysis = debt_analysis.merge(
+            cited.rename(columns={'max_amount': 'cited_max_trillions', 'mentions': 'cited_mentions'}),
+            left_on='year', right_index=True, how='left'
+        )
+        debt_analysis['cited_mentions'] = debt_analysis['cited_mentions'].fillna(0).astype(int)
         
         # Add debt composition
         debt_composition = [
@@ -672,12 +808,11 @@ class DataConsolidator:
             {"year": 2025, "debt_type": "Domestic", "amount": 0.55, "percentage": 4, "interest_rate": 12.5}
         ]
         
-        debt_analysis.extend(debt_composition)
-        
-        return pd.DataFrame(debt_analysis)
+        return pd.concat([debt_analysis, pd.DataFrame(debt_composition)], ignore_index=True)
     
-    def create_budget_analysis(self, numeric_data: Dict) -> pd.DataFrame:
+    def create_budget_analysis(self, numeric_data: NumericFactFrame) -> pd.DataFrame:
         """Create budget analysis DataFrame"""
+        facts = NumericFactFrame.coerce(numeric_data)
         budget_analysis = []
         
         # Main budget allocations
@@ -792,7 +927,15 @@ class DataConsolidator:
         
         budget_analysis.extend(wasteful_expenditure)
         
-        return pd.DataFrame(budget_analysis)
+        budget_df = pd.DataFrame(budget_analysis)
+        
+        # How often, and for how much, the audit cites each budget line's sector
+        sector_summary = facts.sector_summary().set_index('sector')
+        fact_sector = budget_df['sector'].map(self.budget_fact_sectors)
+        budget_df['cited_mentions'] = fact_sector.map(sector_summary['mentions']).fillna(0).astype(int)
+        budget_df['cited_amount_billions'] = fact_sector.map(sector_summary['amount']).round(1)
+        
+        return budget_df
     
     def create_reform_agenda(self, recommendations_data: List) -> Dict:
         """Create comprehensive reform agenda"""
@@ -978,8 +1121,13 @@ class DataConsolidator:
         
         return reform_agenda
     
-    def create_statistics_summary(self, numeric_data: Dict, findings_data: List) -> Dict:
+    def create_statistics_summary(self, numeric_data: NumericFactFrame, findings_data: List) -> Dict:
         """Create comprehensive statistics summary"""
+        facts = NumericFactFrame.coerce(numeric_data)
+        sector_summary = facts.sector_summary()
+        cited_years = facts.frame['year'].dropna()
+        largest = facts.monetary[facts.monetary['currency'] == 'KSh']['amount'].max()
+        
         stats_summary = {
             "fiscal_indicators": {
                 "total_debt": "KSh 12.05 trillion",
@@ -1043,6 +1191,15 @@ class DataConsolidator:
                 "audit_compliance": "Below regional average"
             },
             
+            "extracted_indicators": {
+                "monetary_figures_cited": int(len(facts.monetary)),
+                "percentages_cited": int(len(facts.percentages)),
+                "pages_with_figures": int(facts.frame['page'].nunique()),
+                "years_referenced": f"{cited_years.min()}-{cited_years.max()}" if not cited_years.empty else "",
+                "largest_figure_cited": f"KSh {largest / 1e9:,.1f} billion" if pd.notna(largest) else "",
+                "figures_by_sector": dict(zip(sector_summary['sector'], sector_summary['mentions'].astype(int).tolist()))
+            },
+            
             "metadata": {
                 "data_sources": "National Treasury, KNBS, World Bank, IMF, EACC, OAG, CoB, UNICEF",
                 "period_covered": "2014-2025",
@@ -1058,8 +1215,7 @@ class DataConsolidator:
         """Safely load JSON file with fallback"""
         try:
             if filepath.exists():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return json_io.load(filepath)
             else:
                 self.logger.warning(f"File not found: {filepath}")
                 return {}
@@ -1067,22 +1223,56 @@ class DataConsolidator:
             self.logger.error(f"Error loading {filepath}: {str(e)}")
             return {}
     
-    def _save_data_file(self, filename: str, data: Any):
-        """Save data to appropriate format"""
+    def _save_data_file(self, filename: str, data: Any) -> int:
+        """Save data to appropriate format, returning the bytes written"""
         filepath = self.output_dir / filename
         
         try:
-            if filename.endswith('.json'):
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    
-            elif filename.endswith('.csv'):
-                if isinstance(data, pd.DataFrame):
-                    data.to_csv(filepath, index=False, encoding='utf-8')
-                else:
-                    self.logger.error(f"Data for {filename} is not a DataFrame")
-                    
+            size = write_artifact(filepath, data)
             self.logger.debug(f"Saved: {filename}")
-            
         except Exception as e:
-            self.logger.error(f"Error saving {filename}: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"Error saving {filename}: {str(e)}")
+            return 0
+        
+        # Columnar copy alongside the CSV export; readers fall back to the CSV if it fails
+        if filename.endswith('.csv') and PYARROW_AVAILABLE:
+            try:
+                write_arrow(arrow_path(filepath), data)
+            except Exception as e:
+                self.logger.warning(f"Could not write Arrow copy of {filename}: {str(e)}")
+        
+        return size
+
+
+class InputRegistry:
+    """Stage 1/2 inputs of one consolidation run, loaded on first request
+    
+    Each input is parsed at most once and then shared by every builder that
+    asks for it. Inputs no builder asks for are never opened. Safe to use
+    from several threads: concurrent requests for the same input wait for
+    a single load.
+    """
+    
+    def __init__(self, consolidator: DataConsolidator):
+        self.consolidator = consolidator
+        self.timings: Dict[str, float] = {}
+        self._data: Dict[str, Any] = {}
+        self._locks = {name: threading.Lock() for name in consolidator.INPUTS}
+    
+    def get(self, name: str) -> Any:
+        if name in self._data:
+            return self._data[name]
+        with self._locks[name]:
+            if name not in self._data:
+                started = time.perf_counter()
+                self._data[name] = self.consolidator._load_input(name)
+                self.timings[name] = round(time.perf_counter() - started, 4)
+                self.consolidator.logger.info(f"Loaded input {name} in {self.timings[name]:.3f}s")
+        return self._data[name]
+
+
+def _run_builder(consolidator: DataConsolidator, method: str, args: List) -> Tuple[Any, float]:
+    """Run one dataset builder, returning its output and elapsed seconds"""
+    started = time.perf_counter()
+    data = getattr(consolidator, method)(*args)
+    return data, time.perf_counter() - started
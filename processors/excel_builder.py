@@ -0,0 +1,263 @@
+# processors/excel_builder.py
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from processors import json_io
+from processors.columnar_store import fresh_arrow_path, iter_arrow_records
+from processors.semantic_tagger import iter_raw_text_pages
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+# Excel sheet and cell limits
+MAX_ROWS = 1048576
+MAX_CELL_CHARS = 32767
+
+
+class StreamingWorkbookBuilder:
+    """Writes Kenya_Governance_By_The_Numbers.xlsx one row at a time
+
+    Uses openpyxl's write-only mode, so rows go straight to the compressed
+    sheet parts and memory does not grow with the data. Each sheet reads
+    its source incrementally: Arrow copies batch by batch, CSVs and JSONL
+    line by line, and raw_text.json page by page.
+    """
+
+    # Reference extractions whose tables fill the Survey Tables sheet
+    SURVEY_PATTERN = 'economic_survey_*/raw_text.json'
+
+    def __init__(self, stage1_dir: Path, stage2_dir: Path, stage3_dir: Path,
+                 reference_dir: Optional[Path] = None):
+        """
+        Args:
+            stage1_dir: Stage 1 extraction of the audit itself
+            stage2_dir: Stage 2 semantic tagging output
+            stage3_dir: Consolidated Stage 3 datasets
+            reference_dir: Extracted reference materials holding the economic surveys
+        """
+        self.stage1_dir = Path(stage1_dir)
+        self.stage2_dir = Path(stage2_dir)
+        self.stage3_dir = Path(stage3_dir)
+        self.reference_dir = Path(reference_dir) if reference_dir else None
+        self.logger = logging.getLogger(__name__)
+        self.row_counts: Dict[str, int] = {}
+        # Sheets that stopped early because their source failed, with the error
+        self.failed_sheets: Dict[str, str] = {}
+
+    def build(self, excel_path: Path) -> Dict[str, int]:
+        """Write the workbook and return the data rows written per sheet"""
+        workbook = Workbook(write_only=True)
+        self.row_counts = {}
+        self.failed_sheets = {}
+
+        sheets = [
+            ('Summary', ['Category', 'Metric', 'Value', 'Source'], self._summary_rows()),
+            ('Corruption Cases', None, self._table_rows(self.stage3_dir / 'corruption_cases.csv')),
+            ('Debt Analysis', None, self._table_rows(self.stage3_dir / 'debt_analysis.csv')),
+            ('Budget Analysis', None, self._table_rows(self.stage3_dir / 'budget_analysis.csv')),
+            ('Tagged Paragraphs', ['Paragraph ID', 'Page', 'Category', 'Confidence', 'Tags', 'Word Count', 'Text'],
+             self._paragraph_rows()),
+            ('Numeric Facts', ['Kind', 'Value', 'Unit', 'Currency', 'Page', 'Original Text', 'Context'],
+             self._numeric_fact_rows()),
+            ('Audit Tables', ['Page', 'Table', 'Method', 'Row'], self._audit_table_rows()),
+            ('Survey Tables', ['Survey', 'Page', 'Table', 'Method', 'Row'], self._survey_table_rows())
+        ]
+
+        for title, header, rows in sheets:
+            self._write_sheet(workbook, title, header, rows)
+
+        workbook.save(excel_path)
+        self.logger.info(f"Created Excel summary: {excel_path} ({self.row_counts})")
+        if self.failed_sheets:
+            self.logger.error(f"Excel summary is incomplete, sheets failed: {self.failed_sheets}")
+        return self.row_counts
+
+    def _write_sheet(self, workbook, title: str, header: Optional[List[str]], rows: Iterator[List[Any]]):
+        sheet = workbook.create_sheet(title)
+        count = 0
+        try:
+            # Sources without a fixed header yield their own column names first
+            if header is None:
+                header = next(rows, None)
+                if header is None:
+                    return
+            sheet.append([self._header_cell(sheet, name) for name in header])
+
+            for row in rows:
+                if count >= MAX_ROWS - 1:
+                    self.logger.warning(f"Sheet {title} truncated at Excel's row limit")
+                    break
+                sheet.append([self._cell(value) for value in row])
+                count += 1
+        except Exception as e:
+            # The rows written so far stay; the failure is reported with the build
+            self.logger.error(f"Could not fill sheet {title} after {count} rows: {e}", exc_info=True)
+            self.failed_sheets[title] = f"{type(e).__name__}: {e}"
+        finally:
+            self.row_counts[title] = count
+
+    @staticmethod
+    def _header_cell(sheet, name: Any):
+        cell = WriteOnlyCell(sheet, value=str(name))
+        cell.font = Font(bold=True)
+        return cell
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if value is None or isinstance(value, (int, float, bool)):
+            return value
+        if isinstance(value, (list, tuple)):
+            value = ', '.join(str(item) for item in value)
+        elif isinstance(value, dict):
+            value = json_io.dumps(value, machine=True).decode('utf-8')
+        value = str(value)
+        return value[:MAX_CELL_CHARS]
+
+    @staticmethod
+    def _number(text: str) -> Any:
+        """CSV cells come in as text; restore numbers the way read_csv would"""
+        if text == '':
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+    def _summary_rows(self) -> Iterator[List[Any]]:
+        stats_path = self.stage3_dir / 'statistics_summary.json'
+        if not stats_path.exists():
+            return
+        stats = json_io.load(stats_path)
+
+        for section, values in stats.items():
+            if section in ('generated_date', 'metadata'):
+                continue
+            category = section.replace('_', ' ').title()
+            if isinstance(values, dict):
+                for key, value in self._flatten(values):
+                    yield [category, key, value, "People's Audit"]
+            else:
+                yield ['Key Statistics', category, values, "People's Audit"]
+
+    def _flatten(self, values: Dict, prefix: str = '') -> Iterator[tuple]:
+        for key, value in values.items():
+            label = f"{prefix}{key.replace('_', ' ').title()}"
+            if isinstance(value, dict):
+                yield from self._flatten(value, prefix=f"{label} / ")
+            else:
+                yield label, value
+
+    def _table_rows(self, csv_path: Path) -> Iterator[List[Any]]:
+        """Header row then data rows of a Stage 3 dataset, from Arrow when current"""
+        arrow = fresh_arrow_path(csv_path)
+        if arrow is not None:
+            records = iter_arrow_records(arrow)
+            first = next(records, None)
+            if first is None:
+                return
+            columns = list(first)
+            yield columns
+            yield [first[column] for column in columns]
+            for record in records:
+                yield [record[column] for column in columns]
+        elif csv_path.exists():
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                yield next(reader, [])
+                for row in reader:
+                    yield [self._number(value) for value in row]
+
+    def _records(self, directory: Path, name: str, columns: Optional[List[str]] = None) -> Iterable[Dict]:
+        """Records of a Stage 1/2 list artifact, preferring Arrow, then JSONL, then JSON"""
+        json_path = directory / f'{name}.json'
+        arrow = fresh_arrow_path(json_path)
+        if arrow is not None:
+            return iter_arrow_records(arrow, columns)
+        jsonl_path = directory / f'{name}.jsonl'
+        if jsonl_path.exists() and (not json_path.exists()
+                                    or jsonl_path.stat().st_mtime >= json_path.stat().st_mtime):
+            return self._iter_jsonl(jsonl_path)
+        if json_path.exists():
+            return json_io.load(json_path)
+        return []
+
+    @staticmethod
+    def _iter_jsonl(path: Path) -> Iterator[Dict]:
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json_io.loads(line)
+
+    def _paragraph_rows(self) -> Iterator[List[Any]]:
+        columns = ['paragraph_id', 'page_number', 'category', 'confidence', 'tags', 'metadata', 'text']
+        for paragraph in self._records(self.stage2_dir, 'tagged_paragraphs', columns):
+            metadata = paragraph.get('metadata') or {}
+            yield [
+                paragraph.get('paragraph_id'),
+                paragraph.get('page_number'),
+                paragraph.get('category'),
+                paragraph.get('confidence'),
+                paragraph.get('tags') or [],
+                metadata.get('word_count'),
+                paragraph.get('text')
+            ]
+
+    def _numeric_fact_rows(self) -> Iterator[List[Any]]:
+        json_path = self.stage1_dir / 'numeric_facts.json'
+        arrow = fresh_arrow_path(json_path)
+        if arrow is not None:
+            facts = iter_arrow_records(arrow)
+        elif json_path.exists():
+            numeric_data = json_io.load(json_path)
+            facts = [dict(fact, kind='monetary', value=fact.get('amount'))
+                     for fact in numeric_data.get('monetary_values', [])]
+            facts += [dict(fact, kind='percentage', unit='percent')
+                      for fact in numeric_data.get('percentages', [])]
+        else:
+            return
+
+        for fact in facts:
+            yield [fact.get('kind'), fact.get('value'), fact.get('unit'), fact.get('currency'),
+                   fact.get('page'), fact.get('original_text'), fact.get('context')]
+
+    def _audit_table_rows(self) -> Iterator[List[Any]]:
+        """Every table Stage 1 extracted from the audit, one sheet row per table row"""
+        yield from self._extracted_table_rows(self.stage1_dir / 'raw_text.json')
+
+    def _survey_table_rows(self) -> Iterator[List[Any]]:
+        """Tables of each extracted economic survey, in survey order, prefixed with the survey name"""
+        if self.reference_dir is None or not self.reference_dir.exists():
+            return
+        for raw_text_path in sorted(self.reference_dir.rglob(self.SURVEY_PATTERN)):
+            survey = raw_text_path.parent.name
+            for row in self._extracted_table_rows(raw_text_path):
+                yield [survey] + row
+
+    @staticmethod
+    def _extracted_table_rows(raw_text_path: Path) -> Iterator[List[Any]]:
+        """Page, table number, method, row number and cells of each table in a raw_text.json"""
+        if not raw_text_path.exists():
+            return
+
+        for page_key, page in iter_raw_text_pages(raw_text_path):
+            if not isinstance(page, dict):
+                continue
+            for table in page.get('tables') or []:
+                rows = table.get('data') or []
+                # Skip tables the extractor found but could not fill
+                if not any(cell for row in rows for cell in row):
+                    continue
+                for row_number, row in enumerate(rows, 1):
+                    yield [table.get('page', page.get('page_number')), table.get('table_number'),
+                           table.get('method'), row_number] + list(row)
@@ -0,0 +1,189 @@
+# processors/json_assembler.py
+import re
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from processors import json_io
+from processors.atomic_file import atomic_replace
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20
+
+_JSON_WHITESPACE = b' \t\r\n'
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE_RUN = re.compile(rb'[ \t\r\n]+')
+_CLOSERS = {ord('['): ord(']'), ord('{'): ord('}')}
+
+
+class JsonStructureScanner:
+    """Checks that a byte stream holds exactly one balanced JSON object or array
+
+    The scan only tracks strings, escapes and bracket nesting, so it costs
+    a few regex searches per chunk and no Python objects are built. It
+    catches truncated, concatenated or mismatched documents, not every
+    grammar error inside a value.
+    """
+
+    def __init__(self):
+        self._stack = bytearray()
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+        self._finished = False
+        self.error = None
+
+    def feed(self, chunk: bytes) -> bool:
+        if self.error:
+            return False
+        pos = 0
+        end = len(chunk)
+        while pos < end:
+            if self._escaped:
+                self._escaped = False
+                pos += 1
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(chunk, pos)
+                if match is None:
+                    return True
+                pos = match.end()
+                if match.group() == b'\\':
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                continue
+
+            if not self._started or self._finished:
+                stripped = chunk[pos:].lstrip(_JSON_WHITESPACE)
+                if not stripped:
+                    return True
+                if self._finished:
+                    return self._fail("data after the top-level value")
+                if stripped[0] not in _CLOSERS:
+                    return self._fail("top-level value is not an object or array")
+                self._started = True
+                pos = end - len(stripped)
+
+            match = _STRUCTURAL.search(chunk, pos)
+            if match is None:
+                return True
+            byte = chunk[match.start()]
+            pos = match.end()
+            if byte == ord('"'):
+                self._in_string = True
+            elif byte in _CLOSERS:
+                self._stack.append(_CLOSERS[byte])
+            elif not self._stack or self._stack.pop() != byte:
+                return self._fail(f"unbalanced '{chr(byte)}'")
+            elif not self._stack:
+                self._finished = True
+        return True
+
+    def close(self) -> bool:
+        if not self.error and not self._finished:
+            self._fail("document is empty or truncated")
+        return self.error is None
+
+    def _fail(self, message: str) -> bool:
+        self.error = message
+        return False
+
+
+class JsonWhitespaceStripper:
+    """Removes insignificant whitespace from a JSON byte stream, chunk by chunk
+
+    String contents, including escapes split across chunks, pass through
+    untouched; everything else loses its spaces, tabs and newlines. The
+    values themselves are never re-encoded, so numbers keep their spelling.
+    """
+
+    def __init__(self):
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: bytes) -> bytes:
+        parts = []
+        pos = 0
+        end = len(chunk)
+        while pos < end:
+            if self._escaped:
+                self._escaped = False
+                parts.append(chunk[pos:pos + 1])
+                pos += 1
+                continue
+
+            if self._in_string:
+                match = _STRING_SPECIAL.search(chunk, pos)
+                if match is None:
+                    parts.append(chunk[pos:])
+                    break
+                parts.append(chunk[pos:match.end()])
+                pos = match.end()
+                if match.group() == b'\\':
+                    self._escaped = True
+                else:
+                    self._in_string = False
+                continue
+
+            quote = chunk.find(b'"', pos)
+            stop = end if quote < 0 else quote + 1
+            parts.append(_WHITESPACE_RUN.sub(b'', chunk[pos:stop]))
+            pos = stop
+            self._in_string = quote >= 0
+        return b''.join(parts)
+
+
+def assemble_json_object(entries: Iterable[Tuple[str, Path]], output_path: Path,
+                         compact: Optional[bool] = None) -> Dict[str, int]:
+    """Write {key: <contents of path>, ...} without parsing the member files
+
+    Each file's bytes are copied into the output in fixed-size chunks while
+    being scanned, so memory stays constant whatever the file sizes. With
+    compact (by default the configured machine-facing style) whitespace
+    outside strings is stripped on the way through, otherwise the bytes are
+    copied verbatim. A file that fails the scan is cut back out of the
+    output and skipped. The output replaces output_path atomically.
+
+    Returns counts of files written and skipped and the bytes written.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stats = {'files': 0, 'skipped': 0, 'bytes': 0}
+    if compact is None:
+        compact = json_io.compact_machine()
+
+    with atomic_replace(output_path) as tmp_path:
+        with open(tmp_path, 'wb') as out:
+            out.write(b'{')
+            for key, path in entries:
+                start = out.tell()
+                if stats['files']:
+                    out.write(b',')
+                out.write(json_io.dumps(key, machine=True) + b':')
+
+                scanner = JsonStructureScanner()
+                stripper = JsonWhitespaceStripper() if compact else None
+                try:
+                    with open(path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                            if not scanner.feed(chunk):
+                                break
+                            out.write(stripper.feed(chunk) if stripper else chunk)
+                except OSError as e:
+                    scanner.error = str(e)
+
+                if scanner.close():
+                    stats['files'] += 1
+                else:
+                    logger.warning(f"Skipping {path}: {scanner.error}")
+                    out.seek(start)
+                    out.truncate()
+                    stats['skipped'] += 1
+            out.write(b'}')
+            stats['bytes'] = out.tell()
+
+    return stats
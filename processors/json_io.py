@@ -0,0 +1,136 @@
+# processors/json_io.py
+import json
+import math
+import logging
+from pathlib import Path
+from typing import Any, Union
+
+from processors.atomic_file import atomic_replace
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Process-wide defaults, set once from the pipeline configuration
+_settings = {
+    'backend': 'orjson' if ORJSON_AVAILABLE else 'stdlib',
+    'pretty': True,
+    'compact_machine': True
+}
+
+
+def configure(backend: str = 'auto', pretty: bool = True, compact_machine: bool = True):
+    """Choose the JSON backend and output styles
+
+    Args:
+        backend: 'auto' (orjson when installed), 'orjson' or 'stdlib'
+        pretty: Indent human-facing artifacts
+        compact_machine: Write machine-facing artifacts without whitespace
+    """
+    if backend == 'auto':
+        backend = 'orjson' if ORJSON_AVAILABLE else 'stdlib'
+    elif backend == 'orjson' and not ORJSON_AVAILABLE:
+        logger.warning("orjson not installed, using the stdlib JSON encoder")
+        backend = 'stdlib'
+    elif backend not in ('orjson', 'stdlib'):
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    _settings.update(backend=backend, pretty=pretty, compact_machine=compact_machine)
+
+
+def backend() -> str:
+    return _settings['backend']
+
+
+def compact_machine() -> bool:
+    return _settings['compact_machine']
+
+
+def dumps(obj: Any, machine: bool = False) -> bytes:
+    """Encode to UTF-8 JSON, pretty or compact according to the configured style
+
+    orjson and the stdlib encoder produce the same values but not always the
+    same bytes: some floats are spelled differently (orjson writes 0.00001
+    where the stdlib writes 1e-05).
+    orjson would also write NaN and Infinity as null, which changes the data,
+    so objects holding non-finite floats go through the stdlib encoder and
+    keep NaN/Infinity as before.
+    """
+    indent = not _settings['compact_machine'] if machine else _settings['pretty']
+
+    if _settings['backend'] == 'orjson' and not _has_non_finite(obj):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Types orjson does not handle (e.g. very large ints), let the stdlib decide
+            pass
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_numpy_default).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_numpy_default).encode('utf-8')
+
+
+def _numpy_default(obj: Any) -> Any:
+    """Encode numpy values for the stdlib encoder, matching orjson's OPT_SERIALIZE_NUMPY"""
+    if NUMPY_AVAILABLE and isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """True if obj contains a NaN or infinite float anywhere"""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif NUMPY_AVAILABLE and isinstance(item, (np.ndarray, np.floating)):
+            if item.dtype.kind in 'fc' and not np.isfinite(item).all():
+                return True
+    return False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if _settings['backend'] == 'orjson':
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Older stdlib output may contain NaN/Infinity, which orjson rejects
+            pass
+    return json.loads(data)
+
+
+def load(filepath: Path) -> Any:
+    with open(filepath, 'rb') as f:
+        return loads(f.read())
+
+
+def dump(obj: Any, filepath: Path, machine: bool = False) -> int:
+    """Write obj as JSON to filepath atomically, returning the bytes written
+
+    The data goes to a temporary file that then replaces filepath, so the
+    old file (and anything linked to it) is never rewritten in place.
+    """
+    filepath = Path(filepath)
+    data = dumps(obj, machine=machine)
+    with atomic_replace(filepath) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+    return len(data)
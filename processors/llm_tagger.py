@@ -0,0 +1,207 @@
+# processors/llm_tagger.py
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+from processors import json_io
+
+try:
+    from openai import AsyncOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+
+class LLMTaggingBackend:
+    """Tags paragraphs through a local OpenAI-compatible chat endpoint
+
+    Paragraphs are sent in batches, with a bounded number of requests in
+    flight. Responses are cached on disk by paragraph hash plus prompt
+    version and model. Anything the backend cannot answer in time is left
+    out of the returned annotations so the keyword tagger handles it.
+    """
+
+    PROMPT_VERSION = '1'
+
+    SYSTEM_PROMPT = (
+        "You classify paragraphs from a Kenyan public finance audit. "
+        "For each numbered paragraph return one JSON object with keys "
+        "'index' (the paragraph number), 'tags' (a list drawn from: {tags}), "
+        "'category' (one of: {categories}) and 'confidence' (0 to 1). "
+        "Reply with a JSON array only."
+    )
+
+    def __init__(self, allowed_tags: Iterable[str], base_url: str = 'http://localhost:8000/v1',
+                 model: str = 'local-model', api_key: str = 'not-needed', batch_size: int = 16,
+                 max_concurrency: int = 4, timeout: float = 30.0, max_failures: int = 3,
+                 cache_path: Optional[Path] = None):
+        self.logger = logging.getLogger(__name__)
+        self.allowed_tags = list(allowed_tags)
+        self.categories = self.allowed_tags + ['narrative']
+        self.base_url = base_url
+        self.model = model
+        self.api_key = api_key
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_failures = max_failures
+        self.cache_path = Path(cache_path) if cache_path else None
+
+        self.cache: Dict[str, Dict] = {}
+        self.stats = {
+            'requests': 0,
+            'failed_requests': 0,
+            'cache_hits': 0,
+            'annotated': 0,
+            'fallback': 0,
+            'request_seconds': 0.0
+        }
+        self._consecutive_failures = 0
+        self._load_cache()
+
+    @property
+    def version(self) -> str:
+        """Identifies prompt and model, used in cache keys and the tagger rules version"""
+        return f"llm-{self.PROMPT_VERSION}-{self.model}"
+
+    @property
+    def available(self) -> bool:
+        """False once the endpoint has failed too many times in a row"""
+        return OPENAI_AVAILABLE and self._consecutive_failures < self.max_failures
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.version}\0{text}".encode('utf-8')).hexdigest()
+
+    def annotate(self, texts: List[str]) -> Dict[str, Dict]:
+        """Return {text: {'tags', 'category', 'confidence'}} for the texts the backend answered"""
+        annotations = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            key = self.key(text)
+            if key in self.cache:
+                annotations[text] = self.cache[key]
+                self.stats['cache_hits'] += 1
+            else:
+                pending.append(text)
+
+        if pending and self.available:
+            fresh = asyncio.run(self._annotate_async(pending))
+            for text in pending:
+                key = self.key(text)
+                if key in fresh:
+                    self.cache[key] = fresh[key]
+                    annotations[text] = fresh[key]
+            self.stats['annotated'] += len(fresh)
+            self.stats['fallback'] += len(pending) - len(fresh)
+        elif pending:
+            self.stats['fallback'] += len(pending)
+
+        return annotations
+
+    async def _annotate_async(self, texts: List[str]) -> Dict[str, Dict]:
+        client = AsyncOpenAI(base_url=self.base_url, api_key=self.api_key,
+                             timeout=self.timeout, max_retries=0)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+        async def run_batch(batch: List[str]) -> Dict[str, Dict]:
+            async with semaphore:
+                # Stop sending once the backend looks down
+                if not self.available:
+                    return {}
+                return await self._request_batch(client, batch)
+
+        try:
+            results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+        finally:
+            await client.close()
+
+        merged = {}
+        for result in results:
+            merged.update(result)
+        return merged
+
+    async def _request_batch(self, client, batch: List[str]) -> Dict[str, Dict]:
+        numbered = '\n\n'.join(f"[{i}] {text}" for i, text in enumerate(batch, 1))
+        system_prompt = self.SYSTEM_PROMPT.format(tags=', '.join(self.allowed_tags),
+                                                  categories=', '.join(self.categories))
+        started = time.perf_counter()
+        self.stats['requests'] += 1
+
+        try:
+            response = await asyncio.wait_for(
+                client.chat.completions.create(
+                    model=self.model,
+                    temperature=0,
+                    messages=[
+                        {'role': 'system', 'content': system_prompt},
+                        {'role': 'user', 'content': numbered}
+                    ]
+                ),
+                timeout=self.timeout
+            )
+            parsed = self._parse_response(response.choices[0].message.content, batch)
+            self._consecutive_failures = 0
+            return parsed
+        except Exception as e:
+            self.stats['failed_requests'] += 1
+            self._consecutive_failures += 1
+            self.logger.warning(f"LLM tagging request failed ({type(e).__name__}): {e}")
+            return {}
+        finally:
+            self.stats['request_seconds'] += time.perf_counter() - started
+
+    def _parse_response(self, content: str, batch: List[str]) -> Dict[str, Dict]:
+        """Validate the model's JSON reply against the known tags and categories"""
+        content = content.strip()
+        if content.startswith('```'):
+            content = content.strip('`')
+            content = content[content.index('\n') + 1:] if '\n' in content else content
+
+        items = json.loads(content)
+        if not isinstance(items, list):
+            raise ValueError("Expected a JSON array")
+
+        parsed = {}
+        for item in items:
+            index = int(item['index'])
+            if not 1 <= index <= len(batch):
+                continue
+            category = item.get('category')
+            if category not in self.categories:
+                continue
+            tags = [tag for tag in item.get('tags', []) if tag in self.allowed_tags]
+            confidence = min(max(float(item.get('confidence', 0.5)), 0.0), 1.0)
+            parsed[self.key(batch[index - 1])] = {
+                'tags': list(dict.fromkeys(tags)),
+                'category': category,
+                'confidence': confidence
+            }
+        return parsed
+
+    def _load_cache(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            data = json_io.load(self.cache_path)
+            # Keys already include the prompt version, drop the rest
+            self.cache = data.get(self.version, {})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read LLM tagging cache {self.cache_path}: {e}")
+
+    def save_cache(self):
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        json_io.dump({self.version: self.cache}, self.cache_path, machine=True)
+
+    def statistics(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['request_seconds'] = round(stats['request_seconds'], 4)
+        stats['version'] = self.version
+        stats['available'] = self.available
+        return stats
@@ -0,0 +1,118 @@
+# processors/near_duplicates.py
+import re
+import zlib
+import random
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+# Prime just above 2**32 so (a * x + b) stays inside uint64 for 32-bit shingle hashes
+_MERSENNE_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64(4294967295)
+
+
+class MinHashLSHIndex:
+    """Incremental near-duplicate index using MinHash signatures and LSH banding
+
+    Records are clustered greedily in insertion order: the first record of a
+    cluster is its canonical record and later near-duplicates are attached to
+    it as members. Only canonical records are indexed, so each insert costs a
+    signature plus a few bucket lookups and a full pass is roughly linear.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.8,
+                 shingle_size: int = 3, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._a = np.array([rng.randint(1, (1 << 31) - 1) for _ in range(num_perm)], dtype=np.uint64)
+        self._b = np.array([rng.randint(0, (1 << 31) - 1) for _ in range(num_perm)], dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+        self.members: Dict[str, List[str]] = {}
+
+    def shingles(self, text: str) -> set:
+        """Word n-gram shingles of normalized text"""
+        words = re.findall(r'\w+', text.lower())
+        if len(words) < self.shingle_size:
+            return {' '.join(words)} if words else {text}
+        return {' '.join(words[i:i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text"""
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in self.shingles(text)), dtype=np.uint64)
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return np.minimum(permuted.min(axis=1), _MAX_HASH)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, record_id: str, text: str) -> Optional[str]:
+        """Insert a record, returning the canonical id if it is a near-duplicate"""
+        signature = self.signature(text)
+        band_keys = self._band_keys(signature)
+
+        best_id, best_score = None, self.threshold
+        seen = set()
+        for band, key in enumerate(band_keys):
+            for candidate in self._buckets[band].get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                score = float(np.mean(self._signatures[candidate] == signature))
+                if score >= best_score and (best_id is None or score > best_score):
+                    best_id, best_score = candidate, score
+
+        if best_id is not None:
+            self.members[best_id].append(record_id)
+            return best_id
+
+        self._signatures[record_id] = signature
+        self.members[record_id] = []
+        for band, key in enumerate(band_keys):
+            self._buckets[band].setdefault(key, []).append(record_id)
+        return None
+
+
+def deduplicate_records(records: List[Dict], text_key: str = 'text', id_key: str = 'id',
+                        group_key: Optional[str] = None, **index_options) -> Tuple[List[Dict], int]:
+    """Keep one canonical record per near-duplicate cluster
+
+    Canonical records get a 'duplicate_ids' list when other records were
+    merged into them. With group_key set, only records sharing that field
+    value are compared (e.g. timeline events of the same year).
+
+    Returns the canonical records in their original order and the number
+    of records removed.
+    """
+    indexes: Dict[Any, MinHashLSHIndex] = {}
+    canonical = []
+
+    for record in records:
+        group = record.get(group_key) if group_key else None
+        if group not in indexes:
+            indexes[group] = MinHashLSHIndex(**index_options)
+        if indexes[group].add(record[id_key], record.get(text_key) or '') is None:
+            canonical.append(record)
+
+    members = {}
+    for index in indexes.values():
+        members.update(index.members)
+
+    deduplicated = []
+    for record in canonical:
+        duplicate_ids = members.get(record[id_key])
+        if duplicate_ids:
+            record = dict(record, duplicate_ids=duplicate_ids)
+        deduplicated.append(record)
+
+    return deduplicated, len(records) - len(deduplicated)
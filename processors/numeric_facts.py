@@ -0,0 +1,159 @@
+# processors/numeric_facts.py
+import logging
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+
+class NumericFactFrame:
+    """Stage 1 numeric facts loaded once into typed pandas columns
+
+    Monetary values and percentages from numeric_facts.json share one frame
+    with a 'kind' column. Each fact gets the year mentioned in its context,
+    one boolean column per sector keyword tag and a primary 'sector', so
+    builders can slice and aggregate without rescanning the raw list of
+    dicts.
+    """
+
+    # Sector names follow DataConsolidator.corruption_data, plus Debt
+    SECTOR_KEYWORDS = {
+        'Debt': r'debt|loan|borrow|eurobond|interest|repayment',
+        'Health': r'health|hospital|medical|nhif|sha\b',
+        'Education': r'education|school|university|teacher|helb',
+        'Agriculture': r'agricultur|farm|fertili[sz]er|maize|food',
+        'Infrastructure': r'infrastructure|road|railway|sgr|dam|construction',
+        'Counties': r'count(?:y|ies)|devolution|governor',
+        'Youth Programs': r'youth|nys|hustler|jobs',
+        'Security': r'security|police|defen[cs]e|military'
+    }
+
+    COLUMNS = ['kind', 'value', 'amount', 'unit', 'currency', 'page',
+               'position', 'year', 'sector', 'original_text', 'context']
+
+    # One row per fact, as stored in the columnar numeric_facts artifact
+    FLAT_COLUMNS = ['kind', 'value', 'unit', 'currency', 'page', 'position', 'original_text', 'context']
+
+    def __init__(self, numeric_data: Optional[Dict] = None, flat: Optional[pd.DataFrame] = None):
+        self.logger = logging.getLogger(__name__)
+        self.frame = self._build_frame(flat if flat is not None else self.flatten(numeric_data or {}))
+
+    @classmethod
+    def from_flat(cls, flat: pd.DataFrame) -> 'NumericFactFrame':
+        """Build from the one-row-per-fact table produced by flatten()"""
+        return cls(flat=flat)
+
+    @classmethod
+    def coerce(cls, numeric_data: Union['NumericFactFrame', Dict, None]) -> 'NumericFactFrame':
+        """Accept either a frame or the raw numeric_facts dict"""
+        if isinstance(numeric_data, cls):
+            return numeric_data
+        return cls(numeric_data if isinstance(numeric_data, dict) else None)
+
+    @property
+    def sector_tags(self) -> List[str]:
+        return [self._tag_column(sector) for sector in self.SECTOR_KEYWORDS]
+
+    @staticmethod
+    def _tag_column(sector: str) -> str:
+        return 'tag_' + sector.lower().replace(' ', '_')
+
+    @classmethod
+    def flatten(cls, numeric_data: Dict) -> pd.DataFrame:
+        """Monetary values and percentages of numeric_facts.json as one untyped table"""
+        monetary = pd.DataFrame.from_records(numeric_data.get('monetary_values') or [])
+        percentages = pd.DataFrame.from_records(numeric_data.get('percentages') or [])
+
+        if not monetary.empty:
+            monetary = monetary.rename(columns={'amount': 'value'})
+            monetary['kind'] = 'monetary'
+        if not percentages.empty:
+            percentages['kind'] = 'percentage'
+            percentages['unit'] = 'percent'
+
+        frame = pd.concat([monetary, percentages], ignore_index=True, sort=False)
+        for column in cls.FLAT_COLUMNS:
+            if column not in frame.columns:
+                frame[column] = np.nan
+        return frame[cls.FLAT_COLUMNS]
+
+    def _build_frame(self, flat: pd.DataFrame) -> pd.DataFrame:
+        frame = flat.copy()
+        context = frame['context'].fillna('').astype(str)
+        unit = frame['unit'].fillna('').astype(str).str.lower()
+
+        frame['value'] = pd.to_numeric(frame['value'], errors='coerce').astype('float64')
+        frame['page'] = pd.to_numeric(frame['page'], errors='coerce').astype('Int32')
+        frame['position'] = pd.to_numeric(frame['position'], errors='coerce').astype('Int64')
+
+        # The extractor already applies the unit multiplier, so amounts are in full currency units
+        frame['amount'] = frame['value'].where(frame['kind'] == 'monetary')
+
+        frame['year'] = pd.to_numeric(context.str.extract(r'\b((?:19|20)\d{2})\b', expand=False),
+                                      errors='coerce').astype('Int16')
+
+        # One vectorised regex pass per sector over the whole context column
+        lowered = context.str.lower()
+        tag_columns = {}
+        for sector, pattern in self.SECTOR_KEYWORDS.items():
+            tag_columns[self._tag_column(sector)] = lowered.str.contains(pattern, regex=True)
+        tags = pd.DataFrame(tag_columns, index=frame.index)
+
+        sectors = np.array(list(self.SECTOR_KEYWORDS), dtype=object)
+        has_tag = tags.to_numpy().any(axis=1)
+        primary = np.where(has_tag, sectors[tags.to_numpy().argmax(axis=1)], 'Other') if len(frame) else []
+        frame['sector'] = pd.Categorical(primary, categories=list(self.SECTOR_KEYWORDS) + ['Other'])
+
+        frame['kind'] = frame['kind'].astype('category')
+        frame['unit'] = unit.replace('', np.nan).astype('category')
+        frame['currency'] = frame['currency'].astype('category')
+
+        return pd.concat([frame[self.COLUMNS], tags], axis=1)
+
+    @property
+    def monetary(self) -> pd.DataFrame:
+        return self.frame[self.frame['kind'] == 'monetary']
+
+    @property
+    def percentages(self) -> pd.DataFrame:
+        return self.frame[self.frame['kind'] == 'percentage']
+
+    def for_sector(self, sector: str) -> pd.DataFrame:
+        """All facts tagged with the given sector"""
+        column = self._tag_column(sector)
+        if column not in self.frame.columns:
+            return self.frame.iloc[0:0]
+        return self.frame[self.frame[column]]
+
+    def sector_summary(self, scale: float = 1e9, currency: Optional[str] = 'KSh') -> pd.DataFrame:
+        """Mentions and monetary totals per sector tag, counting facts with several tags in each"""
+        if self.frame.empty:
+            return pd.DataFrame(columns=['sector', 'mentions', 'monetary_mentions', 'amount'])
+
+        tags = self.frame[self.sector_tags]
+        is_monetary = self.frame['kind'] == 'monetary'
+        amounts = self.frame['amount']
+        if currency:
+            amounts = amounts.where(self.frame['currency'] == currency)
+        is_monetary = is_monetary.to_numpy()[:, None]
+        amounts = amounts.fillna(0).to_numpy()[:, None]
+
+        return pd.DataFrame({
+            'sector': list(self.SECTOR_KEYWORDS),
+            'mentions': tags.sum(axis=0).to_numpy(),
+            'monetary_mentions': (tags.to_numpy() & is_monetary).sum(axis=0),
+            'amount': (tags.to_numpy() * amounts).sum(axis=0) / scale
+        })
+
+    def sector_by_year(self, sector: str, scale: float = 1e9,
+                       currency: Optional[str] = 'KSh') -> pd.DataFrame:
+        """Largest cited amount and number of monetary mentions per year for one sector tag"""
+        facts = self.for_sector(sector)
+        facts = facts[(facts['kind'] == 'monetary')].dropna(subset=['year'])
+        if currency:
+            facts = facts[facts['currency'] == currency]
+        if facts.empty:
+            return pd.DataFrame(columns=['max_amount', 'mentions'])
+        grouped = facts.groupby('year', observed=True)['amount'].agg(['max', 'count'])
+        grouped.index = grouped.index.astype(int)
+        return pd.DataFrame({'max_amount': grouped['max'] / scale, 'mentions': grouped['count']})
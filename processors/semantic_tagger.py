@@ -1,10 +1,21 @@
 # processors/semantic_tagger.py
+import copy
 import json
 import re
-from typing import Dict, List, Any
+import time
+import hashlib
+import tempfile
+import textwrap
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+from processors.near_duplicates import MinHashLSHIndex, deduplicate_records
+from processors.columnar_store import ArrowRecordWriter, PYARROW_AVAILABLE
+from processors.article_index import ArticleIndexBuilder
+
 @dataclass
 class TaggedParagraph:
     paragraph_id: str
@@ -16,8 +27,16 @@ class TaggedParagraph:
     metadata: Dict[str, Any]
 
 class SemanticTagger:
-    def __init__(self):
+    # Bump when tagging code changes in a way the rule tables do not capture
+    RULES_VERSION = '1.0'
+    
+    def __init__(self, cache: Optional['TaggingCache'] = None):
         self.logger = logging.getLogger(__name__)
+        self.cache = cache
+        
+        # Optional LLM backend; annotations stay None when keyword tagging only
+        self.llm_backend = None
+        self.llm_annotations: Optional[Dict[str, Dict]] = None
         
         # Define tagging rules
         self.tag_keywords = {
@@ -62,12 +81,77 @@ class SemanticTagger:
             'fact': r'(?:According to|Data shows|Statistics indicate|Figures show)',
             'analysis': r'(?:This suggests|This indicates|Therefore|Thus|Consequently)'
         }
+        
+        # Near-duplicate detection for recommendations, findings and timeline
+        self.dedup_options = {
+            'num_perm': 64,
+            'bands': 16,
+            'threshold': 0.8,
+            'shingle_size': 3
+        }
+    
+    @property
+    def rules_version(self) -> str:
+        """Version string covering the tagger code and its rule tables"""
+        rules = json.dumps([self.tag_keywords, self.classification_patterns], sort_keys=True)
+        version = f"{self.RULES_VERSION}-{hashlib.sha256(rules.encode('utf-8')).hexdigest()[:12]}"
+        if self.llm_backend is not None:
+            version += f"+{self.llm_backend.version}"
+        return version
+    
+    def use_llm_backend(self, backend):
+        """Tag with an LLMTaggingBackend, falling back to keywords per paragraph"""
+        self.llm_backend = backend
+        self.llm_annotations = {}
     
-    def process_all(self, raw_text_data: Dict) -> Dict[str, Any]:
-        """Process all paragraphs from raw text data"""
+    def _prefetch_llm(self, texts: List[str]):
+        """Ask the LLM backend about every paragraph not already in the tagging cache"""
+        if self.llm_backend is None:
+            return
+        if self.cache is not None:
+            texts = [text for text in texts if self.cache.key(text) not in self.cache.entries]
+        self.llm_annotations = self.llm_backend.annotate(texts)
+    
+    def process_all(self, raw_text_data: Dict, parallel: bool = False,
+                    max_workers: Optional[int] = None, batch_size: int = 8) -> Dict[str, Any]:
+        """Process all paragraphs from raw text data
+        
+        Args:
+            raw_text_data: Stage 1 raw text keyed by page (page_001, page_002, ...)
+            parallel: Shard pages across a process pool instead of tagging serially
+            max_workers: Number of worker processes (defaults to CPU count)
+            batch_size: Number of pages sent to a worker per task
+        """
         self.logger.info("Starting semantic tagging process")
         
-        results = {
+        results = self._empty_results()
+        
+        try:
+            if self.llm_backend is not None:
+                self._prefetch_llm([para_text for _, paragraphs in self._iter_pages(raw_text_data.items())
+                                    for para_text in paragraphs if self._is_taggable(para_text)])
+            
+            if parallel:
+                paragraph_id = self._process_parallel(raw_text_data, results, max_workers, batch_size)
+            else:
+                paragraph_id = 0
+                for page_num, paragraphs in self._iter_pages(raw_text_data.items()):
+                    paragraph_id = self._tag_page(paragraphs, page_num, paragraph_id, results)
+            
+            self.logger.info(f"Processed {paragraph_id} paragraphs")
+            
+            # Post-process results
+            self.post_process_results(results)
+            
+        except Exception as e:
+            self.logger.error(f"Error in semantic tagging: {str(e)}")
+            raise
+        
+        return results
+    
+    def _empty_results(self) -> Dict[str, List]:
+        """Create an empty result container"""
+        return {
             'paragraphs': [],
             'recommendations': [],
             'findings': [],
@@ -75,63 +159,182 @@ class SemanticTagger:
             'statistics': [],
             'violations': []
         }
-        
-        try:
-            paragraph_id = 0
+    
+    def iter_tagged(self, pages_iterable: Iterable[Tuple[str, Dict]]) -> Iterator[TaggedParagraph]:
+        """Yield tagged paragraphs one at a time
+        
+        Args:
+            pages_iterable: (page_key, page_data) pairs, e.g. raw_text.items()
+                or iter_raw_text_pages(path) to avoid loading Stage 1 at once
+        """
+        for _, tagged in self.iter_tagged_with_source(pages_iterable):
+            yield tagged
+    
+    def iter_source_paragraphs(self, pages_iterable: Iterable[Tuple[str, Dict]]) -> Iterator[Tuple[str, int, str]]:
+        """Yield (paragraph id, page number, raw text) for each paragraph the tagger would tag
+        
+        Ids match the ones process_all and iter_tagged assign, so indexes
+        built over the raw Stage 1 text line up with the tagged output.
+        """
+        paragraph_id = 0
+        for page_num, paragraphs in self._iter_pages(pages_iterable):
+            for para_text in paragraphs:
+                if self._is_taggable(para_text):
+                    paragraph_id += 1
+                    yield f"para_{paragraph_id:06d}", page_num, para_text
+    
+    def iter_tagged_with_source(self, pages_iterable: Iterable[Tuple[str, Dict]]) -> Iterator[Tuple[str, TaggedParagraph]]:
+        """Like iter_tagged, but yield (raw paragraph text, tagged paragraph) pairs"""
+        paragraph_id = 0
+        for window in self._iter_llm_windows(self._iter_pages(pages_iterable)):
+            if self.llm_backend is not None:
+                self._prefetch_llm([para_text for _, paragraphs in window
+                                    for para_text in paragraphs if self._is_taggable(para_text)])
             
-            for page_key, page_data in raw_text_data.items():
-                page_num = int(page_key.split('_')[1])
-                paragraphs = page_data.get('paragraphs', [])
-                
+            for page_num, paragraphs in window:
                 for para_text in paragraphs:
-                    if len(para_text.strip()) < 10:  # Skip very short paragraphs
+                    if not self._is_taggable(para_text):
                         continue
                     
                     paragraph_id += 1
-                    tagged_para = self.tag_paragraph(para_text, paragraph_id, page_num)
-                    
-                    # Add to results
-                    results['paragraphs'].append(asdict(tagged_para))
-                    
-                    # Categorize further
-                    self.categorize_paragraph(tagged_para, results)
+                    yield para_text, self.tag_paragraph(para_text, paragraph_id, page_num)
+    
+    def _iter_llm_windows(self, pages: Iterator[Tuple[int, List[str]]]) -> Iterator[List[Tuple[int, List[str]]]]:
+        """Group pages so each LLM prefetch fills every concurrent request slot
+        
+        Without an LLM backend each page is its own window. With one, pages
+        are buffered until they hold batch_size * max_concurrency taggable
+        paragraphs, so batching and concurrency span page boundaries and
+        only one event loop is started per window rather than per page.
+        """
+        if self.llm_backend is None:
+            for page in pages:
+                yield [page]
+            return
+        
+        window_size = self.llm_backend.batch_size * self.llm_backend.max_concurrency
+        window, pending = [], 0
+        for page in pages:
+            window.append(page)
+            pending += sum(1 for para_text in page[1] if self._is_taggable(para_text))
+            if pending >= window_size:
+                yield window
+                window, pending = [], 0
+        if window:
+            yield window
+    
+    def _iter_pages(self, pages_iterable: Iterable[Tuple[str, Dict]]) -> Iterator[Tuple[int, List[str]]]:
+        """Yield (page number, paragraphs) for each page in Stage 1 order"""
+        for page_key, page_data in pages_iterable:
+            page_num = int(page_key.split('_')[1])
+            yield page_num, page_data.get('paragraphs', [])
+    
+    @staticmethod
+    def _is_taggable(para_text: str) -> bool:
+        """Skip very short paragraphs"""
+        return len(para_text.strip()) >= 10
+    
+    def _tag_page(self, paragraphs: List[str], page_num: int, paragraph_id: int, results: Dict) -> int:
+        """Tag the paragraphs of one page into results, returning the last paragraph id used"""
+        for para_text in paragraphs:
+            if not self._is_taggable(para_text):
+                continue
             
-            self.logger.info(f"Processed {paragraph_id} paragraphs")
+            paragraph_id += 1
+            tagged_para = self.tag_paragraph(para_text, paragraph_id, page_num)
             
-            # Post-process results
-            self.post_process_results(results)
+            # Add to results
+            results['paragraphs'].append(asdict(tagged_para))
             
-        except Exception as e:
-            self.logger.error(f"Error in semantic tagging: {str(e)}")
-            raise
+            # Categorize further
+            self.categorize_paragraph(tagged_para, results)
         
-        return results
+        return paragraph_id
+    
+    def _process_parallel(self, raw_text_data: Dict, results: Dict,
+                          max_workers: Optional[int], batch_size: int) -> int:
+        """Tag pages in batches across a process pool, merging in page order"""
+        # Paragraph ids are assigned up front so they match the serial path
+        shards = []
+        paragraph_id = 0
+        for page_num, paragraphs in self._iter_pages(raw_text_data.items()):
+            shards.append((page_num, paragraph_id, paragraphs))
+            paragraph_id += sum(1 for para_text in paragraphs if self._is_taggable(para_text))
+        
+        batch_size = max(1, batch_size)
+        batches = [shards[i:i + batch_size] for i in range(0, len(shards), batch_size)]
+        self.logger.info(f"Tagging {len(shards)} pages in {len(batches)} batches across a process pool")
+        
+        # Workers get only the cache entries and LLM annotations for their own paragraphs
+        tasks = []
+        for batch in batches:
+            texts = [para for _, _, paragraphs in batch for para in paragraphs]
+            cached = None
+            if self.cache is not None:
+                cached = self.cache.subset(texts)
+            annotations = None
+            if self.llm_annotations is not None:
+                annotations = {text: self.llm_annotations[text] for text in texts if text in self.llm_annotations}
+            tasks.append((batch, cached, annotations))
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_tagging_worker,
+                                 initargs=(type(self),)) as executor:
+            # map() yields in submission order, so the merge is deterministic
+            for partial, cache_delta in executor.map(_tag_page_batch, tasks):
+                for key, items in partial.items():
+                    results[key].extend(items)
+                if self.cache is not None:
+                    self.cache.merge(cache_delta)
+        
+        return paragraph_id
     
     def tag_paragraph(self, text: str, para_id: int, page_num: int) -> TaggedParagraph:
         """Tag a single paragraph"""
+        # Unchanged paragraphs are copied through from the previous run
+        if self.cache is not None:
+            cached = self.cache.get(text)
+            if cached is not None:
+                return TaggedParagraph(
+                    paragraph_id=f"para_{para_id:06d}",
+                    page_number=page_num,
+                    **cached
+                )
+            started = time.perf_counter()
+        
+        annotation = None
+        if self.llm_annotations is not None:
+            annotation = self.llm_annotations.get(text)
+        
         # Clean text
         clean_text = self.clean_text(text)
         
-        # Initialize tags
-        tags = []
-        
-        # Apply keyword tagging
-        for tag, keywords in self.tag_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in clean_text.lower():
-                    tags.append(tag)
-                    break  # Found one keyword, move to next tag
-        
-        # Determine category
-        category = self.determine_category(clean_text, tags)
-        
-        # Calculate confidence
-        confidence = self.calculate_confidence(clean_text, tags, category)
+        if annotation is not None:
+            # Tags, category and confidence from the LLM backend
+            tags = list(annotation['tags'])
+            category = annotation['category']
+            confidence = annotation['confidence']
+        else:
+            # Initialize tags
+            tags = []
+            
+            # Apply keyword tagging
+            for tag, keywords in self.tag_keywords.items():
+                for keyword in keywords:
+                    if keyword.lower() in clean_text.lower():
+                        tags.append(tag)
+                        break  # Found one keyword, move to next tag
+            
+            # Determine category
+            category = self.determine_category(clean_text, tags)
+            
+            # Calculate confidence
+            confidence = self.calculate_confidence(clean_text, tags, category)
         
         # Extract metadata
         metadata = self.extract_metadata(clean_text)
         
-        return TaggedParagraph(
+        tagged = TaggedParagraph(
             paragraph_id=f"para_{para_id:06d}",
             text=clean_text,
             tags=list(set(tags)),  # Remove duplicates
@@ -140,6 +343,12 @@ class SemanticTagger:
             page_number=page_num,
             metadata=metadata
         )
+        
+        # Keyword fallbacks are not cached in LLM mode so they are retried next run
+        if self.cache is not None and (annotation is not None or self.llm_annotations is None):
+            self.cache.put(text, tagged, time.perf_counter() - started)
+        
+        return tagged
     
     def determine_category(self, text: str, tags: List[str]) -> str:
         """Determine the primary category of a paragraph"""
@@ -321,17 +530,11 @@ class SemanticTagger:
     def post_process_results(self, results: Dict):
         """Post-process and deduplicate results"""
         
-        # Remove duplicate recommendations
-        unique_recommendations = []
-        seen_recommendations = set()
-        
-        for rec in results['recommendations']:
-            rec_hash = hash(rec['text'][:100])  # Hash first 100 chars
-            if rec_hash not in seen_recommendations:
-                seen_recommendations.add(rec_hash)
-                unique_recommendations.append(rec)
-        
-        results['recommendations'] = unique_recommendations
+        # Collapse near-duplicate recommendations, findings and timeline events
+        for key, group_key in [('recommendations', None), ('findings', None), ('timeline', 'year')]:
+            results[key], removed = deduplicate_records(results[key], group_key=group_key, **self.dedup_options)
+            if removed:
+                self.logger.info(f"Merged {removed} near-duplicate {key} entries")
         
         # Sort timeline by year
         results['timeline'] = sorted(results['timeline'], key=lambda x: x['year'])
@@ -346,10 +549,414 @@ class SemanticTagger:
         
         results['findings_by_tag'] = findings_by_tag
     
+    def near_duplicate_index(self) -> MinHashLSHIndex:
+        """Create an empty near-duplicate index with this tagger's settings"""
+        return MinHashLSHIndex(**self.dedup_options)
+    
     def clean_text(self, text: str) -> str:
         """Clean text for processing"""
         # Remove special characters but keep basic punctuation
         cleaned = re.sub(r'[^\w\s.,;:!?\'"-]', ' ', text)
         # Remove multiple spaces
         cleaned = re.sub(r'\s+', ' ', cleaned)
-        return cleaned.strip()
\ No newline at end of file
+        return cleaned.strip()
+
+
+
+_JSON_WHITESPACE = re.compile(r'\s*')
+_JSON_DELIMITERS = ' \t\r\n,:}]'
+
+def iter_raw_text_pages(path: Path, chunk_size: int = 1 << 16) -> Iterator[Tuple[str, Dict]]:
+    """Yield (page_key, page_data) pairs from raw_text.json without loading the whole file
+    
+    Only the top-level object is parsed incrementally; each page is decoded
+    with the stdlib decoder once its bytes are in the buffer.
+    """
+    decoder = json.JSONDecoder()
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+        state = 'start'
+        key = None
+        
+        def read_more() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+        
+        def decode_value():
+            nonlocal pos
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                    # A number may continue past the end of the buffer
+                    if eof or (end < len(buffer) and buffer[end] in _JSON_DELIMITERS):
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                read_more()
+        
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                if not read_more():
+                    raise ValueError(f"Unexpected end of JSON in {path}")
+                continue
+            
+            ch = buffer[pos]
+            if state == 'start':
+                if ch != '{':
+                    raise ValueError(f"Expected a JSON object in {path}")
+                pos += 1
+                state = 'first_key'
+            elif state in ('first_key', 'key'):
+                if ch == '}' and state == 'first_key':
+                    return
+                key = decode_value()
+                state = 'colon'
+            elif state == 'colon':
+                if ch != ':':
+                    raise ValueError(f"Malformed JSON object in {path}")
+                pos += 1
+                state = 'value'
+            elif state == 'value':
+                yield key, decode_value()
+                state = 'separator'
+            else:
+                if ch == ',':
+                    pos += 1
+                    state = 'key'
+                elif ch == '}':
+                    return
+                else:
+                    raise ValueError(f"Malformed JSON object in {path}")
+
+
+class _JsonArrayWriter:
+    """Append items to a JSON array file, formatted like json.dump(indent=2)"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write('[')
+    
+    def append(self, item: Any):
+        self.file.write(',\n' if self.count else '\n')
+        self.file.write(textwrap.indent(json.dumps(item, indent=2, ensure_ascii=False), '  '))
+        self.count += 1
+    
+    def close(self):
+        self.file.write('\n]' if self.count else ']')
+        self.file.close()
+
+
+class SemanticStreamWriter:
+    """Streams tagged paragraphs and derived records into the Stage 2 outputs
+    
+    Memory is bounded by the paragraph being written plus the near-duplicate
+    signatures and spool offsets of canonical records. Recommendations,
+    findings and timeline events are spooled to a temporary file and written
+    on close, once every duplicate has been attached to its canonical record.
+    With pyarrow installed, each output also gets an Arrow IPC sibling.
+    Constitutional article references are indexed as paragraphs go by and
+    written to article_index.json on close. Given the raw paragraph text,
+    the index is built from it rather than from the cleaned text.
+    """
+    
+    def __init__(self, output_dir: Path, tagger: SemanticTagger):
+        self.output_dir = Path(output_dir)
+        self.tagger = tagger
+        self.logger = logging.getLogger(__name__)
+        self.counts = {
+            'paragraphs': 0,
+            'recommendations': 0,
+            'findings': 0,
+            'timeline': 0,
+            'statistics': 0,
+            'violations': 0
+        }
+        self._indexes = {
+            'recommendations': tagger.near_duplicate_index(),
+            'findings': tagger.near_duplicate_index()
+        }
+        self._timeline_indexes: Dict[str, MinHashLSHIndex] = {}
+        self._offsets: Dict[str, List[int]] = {'recommendations': [], 'findings': []}
+        self._timeline_offsets: Dict[str, List[int]] = {}
+        self.article_index = ArticleIndexBuilder()
+        self._jsonl = None
+    
+    def __enter__(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._jsonl = open(self.output_dir / 'tagged_paragraphs.jsonl', 'w', encoding='utf-8')
+        # JSON array kept for consumers that still read the whole file
+        self._paragraphs = _JsonArrayWriter(self.output_dir / 'tagged_paragraphs.json')
+        self._paragraph_writers = [self._paragraphs]
+        if PYARROW_AVAILABLE:
+            self._paragraph_writers.append(
+                ArrowRecordWriter(self.output_dir / 'tagged_paragraphs.arrow', 'tagged_paragraphs'))
+        self._spool = tempfile.TemporaryFile(mode='w+', encoding='utf-8', dir=self.output_dir)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def write(self, paragraph: TaggedParagraph, source_text: Optional[str] = None):
+        """Write one tagged paragraph and everything derived from it
+        
+        Args:
+            paragraph: The tagged paragraph
+            source_text: Raw Stage 1 text of the paragraph, indexed for article references
+        """
+        record = asdict(paragraph)
+        self._jsonl.write(json.dumps(record, ensure_ascii=False) + '\n')
+        for writer in self._paragraph_writers:
+            writer.append(record)
+        self.counts['paragraphs'] += 1
+        self.article_index.add(paragraph.paragraph_id, paragraph.page_number,
+                               paragraph.text if source_text is None else source_text)
+        
+        derived = self.tagger._empty_results()
+        self.tagger.categorize_paragraph(paragraph, derived)
+        
+        for key in ('recommendations', 'findings'):
+            for item in derived[key]:
+                if self._indexes[key].add(item['id'], item['text']) is None:
+                    self._offsets[key].append(self._spool_record(item))
+                    self.counts[key] += 1
+        
+        # Timeline is deduplicated within a year and sorted by year on close
+        for event in derived['timeline']:
+            index = self._timeline_indexes.setdefault(event['year'], self.tagger.near_duplicate_index())
+            if index.add(event['id'], event['text']) is None:
+                self._timeline_offsets.setdefault(event['year'], []).append(self._spool_record(event))
+                self.counts['timeline'] += 1
+        
+        self.counts['statistics'] += len(derived['statistics'])
+        self.counts['violations'] += len(derived['violations'])
+    
+    def _spool_record(self, record: Dict) -> int:
+        offset = self._spool.tell()
+        self._spool.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return offset
+    
+    def _open_writers(self, filename: str, name: str) -> List:
+        writers = [_JsonArrayWriter(self.output_dir / filename)]
+        if PYARROW_AVAILABLE:
+            writers.append(ArrowRecordWriter(self.output_dir / Path(filename).with_suffix('.arrow'), name))
+        return writers
+    
+    def _write_spooled(self, writers: List, offsets: List[int], index: MinHashLSHIndex):
+        for offset in offsets:
+            self._spool.seek(offset)
+            record = json.loads(self._spool.readline())
+            if index.members.get(record['id']):
+                record['duplicate_ids'] = index.members[record['id']]
+            for writer in writers:
+                writer.append(record)
+    
+    def write_all(self, paragraphs: Iterable[Union[TaggedParagraph, Tuple[str, TaggedParagraph]]]) -> Dict[str, int]:
+        """Write every paragraph from an iterator, returning output counts
+        
+        Accepts tagged paragraphs, or (raw text, tagged paragraph) pairs from
+        SemanticTagger.iter_tagged_with_source.
+        """
+        for item in paragraphs:
+            if isinstance(item, tuple):
+                source_text, paragraph = item
+                self.write(paragraph, source_text)
+            else:
+                self.write(item)
+        return self.counts
+    
+    def close(self):
+        """Finish all output files"""
+        if self._jsonl is None:
+            return
+        
+        self._jsonl.close()
+        # JSON first so the Arrow siblings are never older than it
+        for writer in self._paragraph_writers:
+            writer.close()
+        
+        for key, filename in [('recommendations', 'recommendations.json'), ('findings', 'key_findings.json')]:
+            writers = self._open_writers(filename, Path(filename).stem)
+            self._write_spooled(writers, self._offsets[key], self._indexes[key])
+            for writer in writers:
+                writer.close()
+        
+        # Stable sort by year, matching post_process_results
+        timeline = self._open_writers('timeline_events.json', 'timeline_events')
+        for year in sorted(self._timeline_offsets):
+            self._write_spooled(timeline, self._timeline_offsets[year], self._timeline_indexes[year])
+        for writer in timeline:
+            writer.close()
+        self._spool.close()
+        self.article_index.save(self.output_dir / 'article_index.json')
+        self._jsonl = None
+        
+        self.logger.info(f"Streamed {self.counts['paragraphs']} paragraphs to {self.output_dir}")
+
+
+class TaggingCache:
+    """Persistent map from paragraph content hash to its tagging result
+    
+    The whole cache is dropped when the tagger rules version changes. Only
+    entries used in the current run are written back, so paragraphs removed
+    from the source do not accumulate.
+    """
+    
+    def __init__(self, path: Optional[Path], rules_version: str):
+        self.path = Path(path) if path else None
+        self.rules_version = rules_version
+        self.logger = logging.getLogger(__name__)
+        self.entries: Dict[str, Dict] = {}
+        self.new_entries: Dict[str, Dict] = {}
+        self.used_keys = set()
+        self.hits = 0
+        self.misses = 0
+        self.tag_seconds = 0.0
+        self.previous_avg_tag_seconds = 0.0
+        
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('rules_version') == rules_version:
+                    self.entries = data.get('entries', {})
+                    self.previous_avg_tag_seconds = data.get('avg_tag_seconds', 0.0)
+                    self.logger.info(f"Loaded {len(self.entries)} cached tagging results")
+                else:
+                    self.logger.info("Tagger rules changed, discarding tagging cache")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not read tagging cache {self.path}: {e}")
+    
+    @staticmethod
+    def key(text: str) -> str:
+        """Content hash of a raw paragraph"""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def get(self, text: str) -> Optional[Dict]:
+        """Return a copy of the cached content fields for a paragraph, if any
+        
+        The copy keeps later edits to the paragraph's tags or metadata from
+        leaking back into the cache.
+        """
+        key = self.key(text)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used_keys.add(key)
+        return copy.deepcopy(entry)
+    
+    def put(self, text: str, paragraph: TaggedParagraph, seconds: float):
+        """Store the position-independent fields of a freshly tagged paragraph"""
+        key = self.key(text)
+        entry = copy.deepcopy({
+            'text': paragraph.text,
+            'tags': paragraph.tags,
+            'category': paragraph.category,
+            'confidence': paragraph.confidence,
+            'metadata': paragraph.metadata
+        })
+        self.entries[key] = entry
+        self.new_entries[key] = entry
+        self.used_keys.add(key)
+        self.tag_seconds += seconds
+    
+    def subset(self, texts: Iterable[str]) -> Dict[str, Dict]:
+        """Cached entries for the given paragraphs, for shipping to a worker"""
+        keys = (self.key(text) for text in texts)
+        return {key: self.entries[key] for key in keys if key in self.entries}
+    
+    def delta(self) -> Dict[str, Any]:
+        """New entries and counters accumulated by this (worker) cache"""
+        return {
+            'entries': self.new_entries,
+            'used_keys': list(self.used_keys),
+            'hits': self.hits,
+            'misses': self.misses,
+            'tag_seconds': self.tag_seconds
+        }
+    
+    def merge(self, delta: Dict[str, Any]):
+        """Fold a worker's delta back into this cache"""
+        self.entries.update(delta['entries'])
+        self.new_entries.update(delta['entries'])
+        self.used_keys.update(delta['used_keys'])
+        self.hits += delta['hits']
+        self.misses += delta['misses']
+        self.tag_seconds += delta['tag_seconds']
+    
+    def _avg_tag_seconds(self) -> float:
+        if self.misses:
+            return self.tag_seconds / self.misses
+        return self.previous_avg_tag_seconds
+    
+    def statistics(self) -> Dict[str, Any]:
+        """Hit rate and estimated time saved for semantic_statistics.json"""
+        lookups = self.hits + self.misses
+        return {
+            'rules_version': self.rules_version,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'tagging_seconds': round(self.tag_seconds, 4),
+            'estimated_seconds_saved': round(self.hits * self._avg_tag_seconds(), 4)
+        }
+    
+    def save(self):
+        """Write back the entries used in this run"""
+        if self.path is None:
+            return
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'rules_version': self.rules_version,
+            'avg_tag_seconds': self._avg_tag_seconds(),
+            'entries': {key: self.entries[key] for key in self.used_keys if key in self.entries}
+        }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        
+        self.logger.info(f"Saved {len(data['entries'])} tagging results to {self.path}")
+
+
+# Process pool workers for SemanticTagger.process_all(parallel=True)
+_worker_tagger = None
+
+def _init_tagging_worker(tagger_cls=SemanticTagger):
+    """Build one tagger per worker process so rules are compiled once"""
+    global _worker_tagger
+    _worker_tagger = tagger_cls()
+
+def _tag_page_batch(task: Tuple[List[Tuple[int, int, List[str]]], Optional[Dict[str, Dict]], Optional[Dict[str, Dict]]]):
+    """Tag a batch of (page number, first paragraph id, paragraphs) shards
+    
+    Returns the partial results and, when a cache subset was sent, the
+    cache delta to merge back in the parent.
+    """
+    batch, cached, annotations = task
+    tagger = _worker_tagger or SemanticTagger()
+    tagger.llm_annotations = annotations
+    tagger.cache = None
+    if cached is not None:
+        tagger.cache = TaggingCache(None, tagger.rules_version)
+        tagger.cache.entries = cached
+    
+    partial = tagger._empty_results()
+    for page_num, first_id, paragraphs in batch:
+        tagger._tag_page(paragraphs, page_num, first_id, partial)
+    return partial, (tagger.cache.delta() if tagger.cache is not None else None)
@@ -0,0 +1,101 @@
+# test_chart_cache.py
+"""ChartGenerator render hashes: which changes re-render which charts
+
+Charts are exported as JSON only, so no plotting backend is needed.
+
+Run with: python -m pytest -q test_chart_cache.py
+"""
+import json
+from pathlib import Path
+
+from visualizers.chart_generator import ChartConfig, ChartGenerator
+
+
+def make_generator(tmp_path, **config):
+    options = dict(export_formats=['json'], plotlyjs='cdn')
+    options.update(config)
+    return ChartGenerator(tmp_path / 'data', tmp_path / 'charts', config=ChartConfig(**options))
+
+
+def run(tmp_path, incremental=True, **config):
+    generator = make_generator(tmp_path, **config)
+    charts = generator.generate_all_charts(incremental=incremental)
+    charts.pop('dashboard', None)
+    return generator, charts
+
+
+def rendered(generator, charts):
+    return set(charts) - generator.cached_charts
+
+
+def test_second_run_reuses_every_chart(tmp_path):
+    (tmp_path / 'data').mkdir()
+    first, charts = run(tmp_path)
+    assert charts and first.cached_charts == set()
+
+    second, again = run(tmp_path)
+    assert second.cached_charts == set(charts)
+    assert again == charts
+
+    full, _ = run(tmp_path, incremental=False)
+    assert full.cached_charts == set()
+
+
+def test_changed_data_rerenders_only_its_chart(tmp_path):
+    (tmp_path / 'data').mkdir()
+    run(tmp_path)
+
+    debt = {'years': ['2023', '2024'], 'debt_amounts': [10.5, 11.6], 'debt_gdp': [69, 69]}
+    (tmp_path / 'data' / 'charts_data.json').write_text(
+        json.dumps({'debt_timeline': {'data': debt}}), encoding='utf-8')
+    generator, again = run(tmp_path)
+
+    assert rendered(generator, again) == {'debt_timeline'}
+    assert json.loads(Path(again['debt_timeline']['json']).read_text(encoding='utf-8'))['values'] == [10.5, 11.6]
+
+
+def test_changed_config_rerenders_everything(tmp_path):
+    (tmp_path / 'data').mkdir()
+    _, charts = run(tmp_path)
+
+    generator, again = run(tmp_path, width=1600)
+    assert rendered(generator, again) == set(charts)
+
+
+def test_deleted_file_rerenders_its_chart(tmp_path):
+    (tmp_path / 'data').mkdir()
+    run(tmp_path)
+
+    (tmp_path / 'charts' / 'json' / 'poverty_trends_data.json').unlink()
+    generator, again = run(tmp_path)
+
+    assert rendered(generator, again) == {'poverty_trends'}
+    assert (tmp_path / 'charts' / 'json' / 'poverty_trends_data.json').exists()
+
+
+def test_format_missing_from_the_last_run_rerenders(tmp_path):
+    (tmp_path / 'data').mkdir()
+    run(tmp_path)
+
+    manifest_path = tmp_path / 'charts' / 'charts_manifest.json'
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    del manifest['charts']['reform_priority']['paths']['json']
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+    generator, again = run(tmp_path)
+
+    assert rendered(generator, again) == {'reform_priority'}
+
+
+def test_failed_export_is_not_cached(tmp_path):
+    (tmp_path / 'data').mkdir()
+    failing = make_generator(tmp_path)
+    # The chart data JSON cannot be written while json/ is a file
+    json_dir = tmp_path / 'charts' / 'json'
+    json_dir.rmdir()
+    json_dir.write_text('', encoding='utf-8')
+    failing.generate_all_charts()
+    assert failing.chart_hashes == {}
+
+    json_dir.unlink()
+    generator, again = run(tmp_path)
+    assert again and generator.cached_charts == set()
@@ -0,0 +1,88 @@
+# test_document_cache.py
+"""TextGenerator input hashes: which changes regenerate which Stage 5 documents
+
+Run with: python -m pytest -q test_document_cache.py
+"""
+import json
+from types import SimpleNamespace
+
+import generators.text_generator as text_generator
+from generators.text_generator import TextGenerator
+
+STATISTICS = {'total_debt': '11 trillion', 'conviction_rate': '9%', 'unused_key': 1}
+MATRIX = {'10': {'violation_count': 1, 'violations': [{'text': 'Funds were misused.'}]}}
+
+
+def make_generator(data_dir, statistics=STATISTICS, matrix=MATRIX):
+    (data_dir / 'statistics_summary.json').write_text(json.dumps(statistics), encoding='utf-8')
+    (data_dir / 'constitutional_matrix.json').write_text(json.dumps(matrix), encoding='utf-8')
+    return TextGenerator(data_dir)
+
+
+def hashes(generator):
+    return {doc_name: generator.input_hash(doc_name) for doc_name in TextGenerator.DOCUMENTS}
+
+
+def changed(before, after):
+    return {doc_name for doc_name in before if before[doc_name] != after[doc_name]}
+
+
+def test_second_run_regenerates_nothing(tmp_path):
+    output_dir = tmp_path / 'stage_3'
+    first = make_generator(tmp_path).update_documents(output_dir, parallel=False)
+    assert set(first.values()) == {'generated'}
+
+    second = make_generator(tmp_path).update_documents(output_dir, parallel=False)
+    assert set(second.values()) == {'unchanged'}
+
+    # A deleted document is written again even though its inputs are the same
+    (output_dir / 'action_handbook.md').unlink()
+    third = make_generator(tmp_path).update_documents(output_dir, parallel=False)
+    assert [doc for doc, status in third.items() if status == 'generated'] == ['action_handbook']
+
+    full = make_generator(tmp_path).update_documents(output_dir, incremental=False, parallel=False)
+    assert set(full.values()) == {'generated'}
+
+
+def test_only_documents_reading_a_changed_input_are_stale(tmp_path):
+    before = hashes(make_generator(tmp_path))
+
+    # Keys the executive summary does not read leave it alone
+    unread = hashes(make_generator(tmp_path, statistics=dict(STATISTICS, unused_key=2)))
+    assert changed(before, unread) == set()
+
+    read = hashes(make_generator(tmp_path, statistics=dict(STATISTICS, total_debt='12 trillion')))
+    assert changed(before, read) == {'executive_summary'}
+
+    matrix = hashes(make_generator(tmp_path, matrix={}))
+    assert changed(before, matrix) == {'constitutional_guide'}
+
+
+def test_date_only_invalidates_dated_documents(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path)
+    before = hashes(generator)
+
+    monkeypatch.setattr(TextGenerator, 'get_current_date', lambda self: 'January 01, 2099')
+    assert changed(before, hashes(generator)) == {'executive_summary'}
+
+
+def test_template_change_invalidates_its_document(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path)
+    before = hashes(generator)
+    real_get_template = text_generator.get_template
+
+    def get_template(name):
+        if name == 'action_handbook.md':
+            return SimpleNamespace(fingerprint='edited')
+        return real_get_template(name)
+
+    monkeypatch.setattr(text_generator, 'get_template', get_template)
+    assert changed(before, hashes(generator)) == {'action_handbook'}
+
+
+def test_template_version_invalidates_everything(tmp_path, monkeypatch):
+    generator = make_generator(tmp_path)
+    before = hashes(generator)
+
+    monkeypatch.setattr(TextGenerator, 'TEMPLATE_VERSION', TextGenerator.TEMPLATE_VERSION + '.1')
+    assert changed(before, hashes(generator)) == set(TextGenerator.DOCUMENTS)
@@ -0,0 +1,85 @@
+# test_json_assembler.py
+"""JsonStructureScanner, JsonWhitespaceStripper and assemble_json_object
+
+Run with: python -m pytest -q test_json_assembler.py
+"""
+import json
+
+import pytest
+
+from processors.json_assembler import JsonStructureScanner, JsonWhitespaceStripper, assemble_json_object
+
+# Quotes, backslashes and brackets inside strings must not affect the scan
+TRICKY = {
+    'quote': 'He said "pay back the ] loan" }',
+    'backslash': 'C:\\audit\\',
+    'brackets': ['[', ']', '{', '}', '\\"]'],
+    'nested': {'list': [1, 2.5, None, True], 'text': '  keep  inner  spaces\n'},
+    'unicode': 'Ksh 1,000 — \u00e9'
+}
+
+
+def scan(data: bytes, chunk_size: int) -> JsonStructureScanner:
+    scanner = JsonStructureScanner()
+    for i in range(0, len(data), chunk_size):
+        if not scanner.feed(data[i:i + chunk_size]):
+            break
+    scanner.close()
+    return scanner
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 1 << 20])
+def test_scanner_accepts_strings_with_escapes_and_brackets(chunk_size):
+    data = json.dumps(TRICKY, indent=2, ensure_ascii=False).encode('utf-8')
+    assert scan(data, chunk_size).error is None
+    assert scan(b'  [1, "]", {"a": "\\\\"}]\n', chunk_size).error is None
+
+
+@pytest.mark.parametrize('data, error', [
+    (b'{"a": [1, 2}', "unbalanced '}'"),
+    (b'{"a": "unterminated}', 'document is empty or truncated'),
+    (b'{"a": 1}', None),
+    (b'{"a": 1} {"b": 2}', 'data after the top-level value'),
+    (b'"just a string"', 'top-level value is not an object or array'),
+    (b'   ', 'document is empty or truncated'),
+    (b'{"a": "\\"}', 'document is empty or truncated'),
+])
+def test_scanner_rejects_broken_documents(data, error):
+    for chunk_size in (1, len(data)):
+        assert scan(data, chunk_size).error == error
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 1 << 20])
+def test_stripper_removes_only_whitespace_outside_strings(chunk_size):
+    data = json.dumps(TRICKY, indent=2, ensure_ascii=False).encode('utf-8')
+    stripper = JsonWhitespaceStripper()
+    compact = b''.join(stripper.feed(data[i:i + chunk_size]) for i in range(0, len(data), chunk_size))
+    assert compact == json.dumps(TRICKY, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def test_assembly_skips_broken_files_and_keeps_the_rest(tmp_path):
+    good = tmp_path / 'good.json'
+    good.write_text(json.dumps(TRICKY, indent=2), encoding='utf-8')
+    truncated = tmp_path / 'truncated.json'
+    truncated.write_text('{"a": [1, 2', encoding='utf-8')
+    output = tmp_path / 'out' / 'all.json'
+
+    entries = [('first', good), ('broken', truncated), ('missing', tmp_path / 'nope.json'), ('last', good)]
+    stats = assemble_json_object(entries, output, compact=False)
+
+    assert stats == {'files': 2, 'skipped': 2, 'bytes': output.stat().st_size}
+    assert json.loads(output.read_bytes()) == {'first': TRICKY, 'last': TRICKY}
+    # Verbatim copies keep the member files' layout
+    assert good.read_bytes() in output.read_bytes()
+
+
+def test_compact_assembly_matches_the_pretty_one(tmp_path):
+    member = tmp_path / 'member.json'
+    member.write_text(json.dumps(TRICKY, indent=2), encoding='utf-8')
+
+    assemble_json_object([('m', member)], tmp_path / 'pretty.json', compact=False)
+    assemble_json_object([('m', member)], tmp_path / 'compact.json', compact=True)
+
+    compact = (tmp_path / 'compact.json').read_bytes()
+    assert json.loads(compact) == json.loads((tmp_path / 'pretty.json').read_bytes())
+    assert b'\n' not in compact
@@ -0,0 +1,164 @@
+# test_llm_tagger.py
+"""LLMTaggingBackend against a local stub of an OpenAI-compatible chat endpoint
+
+Run with: python -m pytest -q test_llm_tagger.py
+"""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from processors.llm_tagger import LLMTaggingBackend, OPENAI_AVAILABLE
+from processors.semantic_tagger import SemanticTagger, TaggingCache
+
+pytestmark = pytest.mark.skipif(not OPENAI_AVAILABLE, reason="openai is not installed")
+
+TAGS = ['finding', 'debt', 'corruption']
+
+
+class StubChatHandler(BaseHTTPRequestHandler):
+    """Answers /chat/completions according to markers in the paragraphs
+
+    SLOW anywhere in a batch delays the reply past the client timeout,
+    GARBAGE makes the reply invalid JSON, anything else is tagged 'debt'.
+    """
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['messages'][-1]['content']
+        indexes = [int(i) for i in re.findall(r'^\[(\d+)\]', prompt, re.MULTILINE)]
+
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            # Hold the request briefly so concurrent batches overlap
+            time.sleep(server.slow_seconds if 'SLOW' in prompt else 0.05)
+            if 'GARBAGE' in prompt:
+                content = 'Sorry, I cannot help with that.'
+            else:
+                content = json.dumps([{'index': i, 'tags': ['debt', 'not-a-tag'],
+                                       'category': 'debt', 'confidence': 0.9} for i in indexes])
+            reply = json.dumps({
+                'id': 'stub', 'object': 'chat.completion', 'created': 0, 'model': body['model'],
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': content}}]
+            }).encode('utf-8')
+            try:
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(reply)))
+                self.end_headers()
+                self.wfile.write(reply)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up on a slow reply
+                pass
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubChatHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.slow_seconds = 1.5
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_backend(server, **kwargs):
+    options = dict(base_url=f"http://127.0.0.1:{server.server_port}/v1", model='stub',
+                   batch_size=2, max_concurrency=2, timeout=0.5)
+    options.update(kwargs)
+    return LLMTaggingBackend(TAGS, **options)
+
+
+def test_good_reply_is_batched_within_the_concurrency_limit(stub_server):
+    backend = make_backend(stub_server)
+    texts = [f"Paragraph {i} about public debt levels." for i in range(7)]
+
+    annotations = backend.annotate(texts)
+
+    assert set(annotations) == set(texts)
+    # Unknown tags are dropped, values are validated
+    assert all(a == {'tags': ['debt'], 'category': 'debt', 'confidence': 0.9} for a in annotations.values())
+    assert stub_server.requests == 4  # ceil(7 / batch_size)
+    assert stub_server.max_in_flight == 2
+    assert backend.stats['annotated'] == 7 and backend.stats['fallback'] == 0
+
+    # Answers are cached, so asking again sends nothing
+    assert backend.annotate(texts) == annotations
+    assert stub_server.requests == 4
+    assert backend.stats['cache_hits'] == 7
+
+
+def test_malformed_reply_falls_back(stub_server):
+    backend = make_backend(stub_server, batch_size=1)
+    good, bad = "Debt rose sharply in the period.", "GARBAGE paragraph on corruption."
+
+    annotations = backend.annotate([good, bad])
+
+    assert list(annotations) == [good]
+    assert backend.stats['failed_requests'] == 1
+    assert backend.stats['fallback'] == 1
+    assert backend.available
+
+
+def test_timeout_falls_back_and_repeated_failures_stop_requests(stub_server):
+    backend = make_backend(stub_server, batch_size=1, max_concurrency=1, max_failures=2)
+    texts = [f"SLOW paragraph {i} on borrowing." for i in range(4)]
+
+    started = time.perf_counter()
+    annotations = backend.annotate(texts)
+
+    assert annotations == {}
+    assert backend.stats['failed_requests'] == 2
+    assert backend.stats['fallback'] == 4
+    assert not backend.available
+    # Batches after the cutoff are not sent at all
+    assert stub_server.requests == 2
+    assert time.perf_counter() - started < 2 * stub_server.slow_seconds
+
+
+def test_fallback_paragraphs_are_keyword_tagged_and_not_cached(stub_server):
+    tagger = SemanticTagger(TaggingCache(None, 'test'))
+    tagger.use_llm_backend(make_backend(stub_server, batch_size=1))
+    pages = {'page_001': {'paragraphs': [
+        "The audit found that county debt was misreported.",
+        "GARBAGE: the audit found that funds were lost to fraud."
+    ]}}
+
+    tagged = list(tagger.iter_tagged(pages.items()))
+
+    assert tagged[0].category == 'debt' and tagged[0].tags == ['debt']
+    assert 'finding' in tagged[1].tags and tagged[1].confidence != 0.9
+    cached = [entry['text'] for entry in tagger.cache.entries.values()]
+    assert cached == [tagged[0].text]
+
+
+def test_cache_round_trips_through_disk(stub_server, tmp_path):
+    cache_path = tmp_path / 'cache' / 'llm_cache.json'
+    backend = make_backend(stub_server, cache_path=cache_path)
+    backend.annotate(["Debt service costs keep rising."])
+    backend.save_cache()
+
+    reloaded = make_backend(stub_server, cache_path=cache_path)
+    assert reloaded.cache == backend.cache
+    # Another model does not reuse the answers
+    assert make_backend(stub_server, cache_path=cache_path, model='other').cache == {}
@@ -0,0 +1,62 @@
+# test_near_duplicates.py
+"""MinHashLSHIndex and deduplicate_records
+
+Run with: python -m pytest -q test_near_duplicates.py
+"""
+import pytest
+
+from processors.near_duplicates import MinHashLSHIndex, deduplicate_records
+
+BASE = ("The Auditor-General found that the county government could not account for "
+        "2.4 billion shillings spent on medical equipment leased from private suppliers "
+        "between 2015 and 2018, and recommended that the officers responsible be surcharged.")
+
+
+def test_identical_and_reworded_copies_cluster_with_the_first():
+    index = MinHashLSHIndex()
+    assert index.add('a', BASE) is None
+    assert index.add('b', BASE.upper()) == 'a'  # normalization ignores case and punctuation
+    assert index.add('c', BASE.replace('2015', '2014')) == 'a'
+    assert index.members == {'a': ['b', 'c']}
+
+
+def test_unrelated_text_starts_its_own_cluster():
+    index = MinHashLSHIndex()
+    index.add('a', BASE)
+    assert index.add('b', "Youth unemployment rose to 1.7 million as manufacturing jobs moved abroad.") is None
+    # A shared opening alone does not make a near-duplicate
+    assert index.add('c', BASE[:60] + " but the Treasury disputed the figures and no one was charged.") is None
+    assert set(index.members) == {'a', 'b', 'c'}
+
+
+def test_signatures_are_deterministic_for_a_seed():
+    assert (MinHashLSHIndex(seed=7).signature(BASE) == MinHashLSHIndex(seed=7).signature(BASE)).all()
+    assert not (MinHashLSHIndex(seed=7).signature(BASE) == MinHashLSHIndex(seed=8).signature(BASE)).all()
+
+
+def test_bands_must_divide_num_perm():
+    with pytest.raises(ValueError):
+        MinHashLSHIndex(num_perm=64, bands=10)
+
+
+def test_deduplicate_records_keeps_order_and_groups():
+    records = [
+        {'id': 'r1', 'text': BASE, 'year': '2018'},
+        {'id': 'r2', 'text': "Debt service took 56% of revenue.", 'year': '2018'},
+        {'id': 'r3', 'text': BASE, 'year': '2018'},
+        {'id': 'r4', 'text': BASE, 'year': '2019'},
+        {'id': 'r5', 'text': None, 'year': '2019'}
+    ]
+
+    kept, removed = deduplicate_records(records, group_key='year')
+
+    assert [r['id'] for r in kept] == ['r1', 'r2', 'r4', 'r5']
+    assert removed == 1
+    assert kept[0]['duplicate_ids'] == ['r3']
+    assert 'duplicate_ids' not in kept[2]
+    # Input records are not modified
+    assert 'duplicate_ids' not in records[0]
+
+    kept, removed = deduplicate_records(records)
+    assert [r['id'] for r in kept] == ['r1', 'r2', 'r5'] and removed == 2
+    assert kept[0]['duplicate_ids'] == ['r3', 'r4']
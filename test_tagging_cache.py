@@ -0,0 +1,91 @@
+# test_tagging_cache.py
+"""TaggingCache invalidation: rules version, content-hash keys and copied entries
+
+Run with: python -m pytest -q test_tagging_cache.py
+"""
+from processors.semantic_tagger import SemanticTagger, TaggingCache
+
+PARAGRAPHS = [
+    "The audit found that county debt was misreported by 2 billion shillings.",
+    "We recommend that the Auditor-General publish every county report.",
+    "Funds were lost to fraud and embezzlement in the health sector."
+]
+
+
+def tag_all(tagger, paragraphs, page_num=1):
+    return [tagger.tag_paragraph(text, para_id, page_num) for para_id, text in enumerate(paragraphs, 1)]
+
+
+def saved_cache(tmp_path, tagger):
+    path = tmp_path / 'tagging_cache.json'
+    tagger.cache = TaggingCache(path, tagger.rules_version)
+    fresh = tag_all(tagger, PARAGRAPHS)
+    tagger.cache.save()
+    return path, fresh
+
+
+def test_unchanged_paragraphs_are_served_from_the_saved_cache(tmp_path):
+    tagger = SemanticTagger()
+    path, fresh = saved_cache(tmp_path, tagger)
+
+    tagger.cache = TaggingCache(path, tagger.rules_version)
+    cached = tag_all(tagger, PARAGRAPHS)
+
+    assert tagger.cache.hits == len(PARAGRAPHS) and tagger.cache.misses == 0
+    assert [p.__dict__ for p in cached] == [p.__dict__ for p in fresh]
+
+
+def test_key_is_the_paragraph_content_not_its_position(tmp_path):
+    tagger = SemanticTagger()
+    path, _ = saved_cache(tmp_path, tagger)
+
+    tagger.cache = TaggingCache(path, tagger.rules_version)
+    moved = tag_all(tagger, list(reversed(PARAGRAPHS)), page_num=9)
+    edited = tagger.tag_paragraph(PARAGRAPHS[0] + " Revised.", 99, 9)
+
+    assert tagger.cache.hits == len(PARAGRAPHS) and tagger.cache.misses == 1
+    # Position fields come from the current run, not the cache
+    assert [(p.paragraph_id, p.page_number) for p in moved] == [('para_000001', 9), ('para_000002', 9),
+                                                                ('para_000003', 9)]
+    assert edited.text.endswith("Revised.")
+
+
+def test_changed_rules_discard_the_cache(tmp_path):
+    tagger = SemanticTagger()
+    path, _ = saved_cache(tmp_path, tagger)
+    old_version = tagger.rules_version
+
+    tagger.tag_keywords['debt'].append('arrears')
+    assert tagger.rules_version != old_version
+
+    tagger.cache = TaggingCache(path, tagger.rules_version)
+    assert tagger.cache.entries == {}
+    tag_all(tagger, PARAGRAPHS)
+    assert tagger.cache.hits == 0 and tagger.cache.misses == len(PARAGRAPHS)
+
+
+def test_llm_backend_version_is_part_of_the_rules_version():
+    class Backend:
+        version = 'model-a'
+
+    tagger = SemanticTagger()
+    keyword_version = tagger.rules_version
+    tagger.use_llm_backend(Backend())
+    llm_version = tagger.rules_version
+    Backend.version = 'model-b'
+
+    assert len({keyword_version, llm_version, tagger.rules_version}) == 3
+
+
+def test_entries_are_copied_in_and_out():
+    tagger = SemanticTagger(TaggingCache(None, 'test'))
+    first = tagger.tag_paragraph(PARAGRAPHS[0], 1, 1)
+    first.tags.append('edited')
+    first.metadata['note'] = 'edited'
+
+    second = tagger.tag_paragraph(PARAGRAPHS[0], 2, 1)
+    second.tags.append('edited again')
+    third = tagger.tag_paragraph(PARAGRAPHS[0], 3, 1)
+
+    assert 'edited' not in third.tags and 'edited again' not in third.tags
+    assert 'note' not in third.metadata
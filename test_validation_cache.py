@@ -0,0 +1,99 @@
+# test_validation_cache.py
+"""ValidationCache invalidation: rules version, article text and reference context
+
+Run with: python -m pytest -q test_validation_cache.py
+"""
+import json
+
+import validators.constitutional_validator as constitutional_validator
+from validators.constitutional_validator import ConstitutionalValidator, ValidationCache
+
+REFERENCES = {
+    '10': [
+        {'page': 3, 'paragraph_id': 'page_003_para_001',
+         'context': 'The county failed to comply with Article 10 on accountability.'},
+        {'page': 7, 'paragraph_id': 'page_007_para_004',
+         'context': 'Article 10 national values were upheld in the budget process.'}
+    ],
+    '201': [
+        {'page': 12, 'paragraph_id': 'page_012_para_002',
+         'context': 'Billions were lost in breach of Article 201 on public finance.'}
+    ]
+}
+
+
+def make_validator(tmp_path, article_10='National values and principles of governance.', cache=None):
+    constitution = tmp_path / 'constitution.json'
+    constitution.write_text(json.dumps({'articles': [
+        {'article_number': '10', 'full_text': article_10},
+        {'article_number': '201', 'full_text': 'Principles of public finance.'}
+    ]}), encoding='utf-8')
+    return ConstitutionalValidator(tmp_path, constitution, cache=cache)
+
+
+def validate(validator, path):
+    validator.cache = ValidationCache(path, validator.rules_version)
+    results = validator.validate_articles(REFERENCES)
+    validator.cache.save()
+    return results
+
+
+def test_unchanged_references_are_served_from_the_saved_cache(tmp_path):
+    path = tmp_path / 'cache' / 'validation_cache.json'
+    validator = make_validator(tmp_path)
+    fresh = validate(validator, path)
+    assert validator.cache.misses == 3
+
+    cached = validate(validator, path)
+    assert validator.cache.hits == 3 and validator.cache.misses == 0
+    assert cached == fresh
+
+
+def test_page_moves_reuse_the_entry_with_the_new_position():
+    cache = ValidationCache(None, 'test')
+    reference = dict(REFERENCES['10'][0])
+    cache.put('10', 'text', reference, {'is_violation': True, 'is_compliant': False, 'status': 'violation',
+                                        'violation_indicators': ['failed to'], 'compliance_indicators': []})
+
+    moved = dict(reference, page=30, paragraph_id='page_030_para_001')
+    hit = cache.get('10', 'text', moved)
+
+    assert hit['page'] == 30 and hit['paragraph_id'] == 'page_030_para_001'
+    assert hit['status'] == 'violation'
+
+
+def test_changed_context_or_article_text_misses():
+    cache = ValidationCache(None, 'test')
+    reference = REFERENCES['10'][0]
+    cache.put('10', 'text', reference, {'is_violation': True, 'is_compliant': False, 'status': 'violation',
+                                        'violation_indicators': [], 'compliance_indicators': []})
+
+    assert cache.get('10', 'amended text', reference) is None
+    assert cache.get('10', 'text', dict(reference, context=reference['context'] + ' Later repaid.')) is None
+    assert cache.get('11', 'text', reference) is None
+    assert cache.misses == 3 and cache.hits == 0
+
+
+def test_amended_article_is_revalidated(tmp_path):
+    path = tmp_path / 'cache' / 'validation_cache.json'
+    validate(make_validator(tmp_path), path)
+
+    validator = make_validator(tmp_path, article_10='National values, amended.')
+    validate(validator, path)
+
+    # Only Article 201's reference still matches
+    assert validator.cache.hits == 1 and validator.cache.misses == 2
+
+
+def test_changed_indicators_discard_the_cache(tmp_path, monkeypatch):
+    path = tmp_path / 'cache' / 'validation_cache.json'
+    validator = make_validator(tmp_path)
+    validate(validator, path)
+    old_version = validator.rules_version
+
+    monkeypatch.setattr(constitutional_validator, 'VIOLATION_INDICATORS',
+                        constitutional_validator.VIOLATION_INDICATORS + ('squandered',))
+    assert validator.rules_version != old_version
+
+    assert ValidationCache(path, validator.rules_version).entries == {}
+    assert ValidationCache(path, old_version).entries != {}
@@ -1,28 +1,104 @@
 # validators/constitutional_validator.py
-import json
 import re
-from typing import Dict, List, Any
+import time
+import hashlib
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import logging
 
+from processors import json_io
+from processors.article_index import ArticleIndexBuilder, load_article_index
+from processors.semantic_tagger import iter_raw_text_pages
+from generators.templates import render_template
+
+# Phrases looked for in the text around each article reference
+VIOLATION_INDICATORS = (
+    'violat', 'breach', 'fail', 'deny', 'ignore',
+    'disregard', 'not implement', 'not fulfill',
+    'lack of', 'absence of', 'contrary to'
+)
+
+COMPLIANCE_INDICATORS = (
+    'comply', 'implement', 'fulfill', 'respect',
+    'uphold', 'honor', 'accordance with'
+)
+
+
+class IndicatorMatcher:
+    """Finds every violation and compliance indicator in a context in one regex pass
+    
+    Gives the same answers as testing each indicator as a substring. The
+    pattern is a lookahead, so overlapping indicators are all found, and an
+    indicator contained in a longer one ('implement' in 'not implement') is
+    implied whenever the longer one matches.
+    """
+    
+    def __init__(self, violation: Tuple[str, ...], compliance: Tuple[str, ...]):
+        self.violation = tuple(violation)
+        self.compliance = tuple(compliance)
+        indicators = list(dict.fromkeys(self.violation + self.compliance))
+        alternatives = '|'.join(re.escape(ind) for ind in sorted(indicators, key=len, reverse=True))
+        self.pattern = re.compile(f'(?=({alternatives}))')
+        self.implied = {ind: {other for other in indicators if other in ind} for ind in indicators}
+    
+    def match(self, context: str) -> Tuple[List[str], List[str]]:
+        """Violation and compliance indicators found in a normalized context, in list order"""
+        found = set()
+        for match in self.pattern.finditer(context):
+            found |= self.implied[match.group(1)]
+        return ([ind for ind in self.violation if ind in found],
+                [ind for ind in self.compliance if ind in found])
+
+
+INDICATOR_MATCHER = IndicatorMatcher(VIOLATION_INDICATORS, COMPLIANCE_INDICATORS)
+
+
+def normalize_context(context: str) -> str:
+    """Lowercase and collapse whitespace, so PDF line breaks do not split indicator phrases"""
+    return ' '.join(context.lower().split())
+
+
 class ConstitutionalValidator:
-    def __init__(self, stage1_dir: Path, constitution_data_path: Path):
+    # Bump when validation code changes in a way the indicator tables do not capture
+    RULES_VERSION = '1.0'
+    
+    def __init__(self, stage1_dir: Path, constitution_data_path: Path,
+                 article_index_path: Optional[Path] = None, cache: Optional['ValidationCache'] = None):
         self.stage1_dir = stage1_dir
         self.constitution_data_path = constitution_data_path
+        self.article_index_path = article_index_path
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
         self.constitution_data = self.load_constitution_data()
+        self.article_texts = self.build_article_lookup()
+        self.missing_articles = set()
+    
+    @property
+    def rules_version(self) -> str:
+        """Version string covering the validator code and its indicator tables"""
+        rules = '\n'.join(VIOLATION_INDICATORS + ('',) + COMPLIANCE_INDICATORS)
+        return f"{self.RULES_VERSION}-{hashlib.sha256(rules.encode('utf-8')).hexdigest()[:12]}"
     
     def load_constitution_data(self) -> Dict:
         """Load extracted constitution data"""
         try:
-            with open(self.constitution_data_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_io.load(self.constitution_data_path)
         except Exception as e:
             self.logger.warning(f"Could not load constitution data: {str(e)}")
             return {}
     
-    def validate_all(self) -> Dict[str, Any]:
-        """Validate all constitutional references"""
+    def validate_all(self, parallel: bool = False, max_workers: Optional[int] = None,
+                     batch_size: int = 16, corpus_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """Validate all constitutional references
+        
+        Args:
+            parallel: Shard articles across a process pool instead of validating serially
+            max_workers: Number of worker processes (defaults to CPU count)
+            batch_size: Number of articles sent to a worker per task
+            corpus_dir: Extracted reference materials (Acts, CoB reports) to
+                validate as well, one result per document under 'corpus'
+        """
         self.logger.info("Starting constitutional validation")
         
         validation_results = {
@@ -30,22 +106,32 @@ class ConstitutionalValidator:
             'summary': {},
             'guide': ''
         }
+        pool_opts = {'parallel': parallel, 'max_workers': max_workers, 'batch_size': batch_size}
         
         try:
-            # Load references from stage 1
+            # Prefer the Stage 2 article index, which already holds each reference's sentence
+            article_references = None
+            if self.article_index_path is not None:
+                article_references = load_article_index(self.article_index_path)
+            
+            # Otherwise scan the references from stage 1
             references_path = self.stage1_dir / 'references.json'
-            if references_path.exists():
-                with open(references_path, 'r', encoding='utf-8') as f:
-                    references_data = json.load(f)
-                
+            if article_references is None and references_path.exists():
+                article_references = self.extract_article_references(json_io.load(references_path))
+            
+            if article_references is not None:
                 # Validate each article reference
-                validation_results['detailed'] = self.validate_articles(references_data)
+                validation_results['detailed'] = self.validate_articles(article_references, **pool_opts)
                 
                 # Generate summary
                 validation_results['summary'] = self.generate_summary(validation_results['detailed'])
                 
                 # Generate citizen guide
-                validation_results['guide'] = self.generate_citizen_guide(validation_results['detailed'])
+                validation_results['guide'] = self.generate_citizen_guide(validation_results['detailed'],
+                                                                          validation_results['summary'])
+            
+            if corpus_dir is not None:
+                validation_results['corpus'] = self.validate_corpus(corpus_dir, **pool_opts)
             
             self.logger.info("Constitutional validation completed")
             
@@ -55,37 +141,132 @@ class ConstitutionalValidator:
         
         return validation_results
     
-    def validate_articles(self, references_data: Dict) -> Dict:
-        """Validate each constitutional article reference"""
-        validated_articles = {}
+    def validate_articles(self, article_references: Dict[str, List], parallel: bool = False,
+                          max_workers: Optional[int] = None, batch_size: int = 16) -> Dict:
+        """Validate each constitutional article reference
         
-        # Extract article references
-        article_references = self.extract_article_references(references_data)
+        Args:
+            article_references: References keyed by article number, each with
+                at least a page and a context (see extract_article_references)
+            parallel: Shard articles across a process pool
+            max_workers: Number of worker processes (defaults to CPU count)
+            batch_size: Number of articles sent to a worker per task
+        """
+        tasks = self.article_tasks(article_references)
+        results = self.run_tasks(tasks, parallel, max_workers, batch_size)
+        return {task[0]: result for task, result in zip(tasks, results)}
+    
+    def validate_corpus(self, corpus_dir: Path, parallel: bool = False,
+                        max_workers: Optional[int] = None, batch_size: int = 16) -> Dict[str, Dict]:
+        """Validate the article references in every extracted reference document
         
+        Articles from all documents go into one task list, so a single pool
+        is shared across the whole corpus. Copies of the constitution itself
+        are skipped.
+        """
+        corpus_dir = Path(corpus_dir)
+        tasks = []
+        for raw_text_path in sorted(corpus_dir.rglob('raw_text.json')):
+            document = raw_text_path.parent.relative_to(corpus_dir).as_posix()
+            if 'constitution' in document:
+                continue
+            
+            index = ArticleIndexBuilder()
+            for page_key, page_data in iter_raw_text_pages(raw_text_path):
+                if not isinstance(page_data, dict):
+                    continue
+                page_num = page_data.get('page_number', page_key)
+                for para_num, para_text in enumerate(page_data.get('paragraphs', []), 1):
+                    index.add(f"{page_key}_para_{para_num:03d}", page_num, para_text)
+            
+            tasks.extend(((document, article_num), article_num, article_text, references)
+                         for _, article_num, article_text, references in self.article_tasks(index.articles))
+        
+        results = self.run_tasks(tasks, parallel, max_workers, batch_size)
+        
+        corpus = {}
+        for (key, *_), result in zip(tasks, results):
+            document, article_num = key
+            corpus.setdefault(document, {'articles': {}})['articles'][article_num] = result
+        for document_results in corpus.values():
+            document_results['summary'] = self.generate_summary(document_results['articles'])
+        
+        self.logger.info(f"Validated article references in {len(corpus)} reference documents")
+        return corpus
+    
+    def article_tasks(self, article_references: Dict[str, List]) -> List[Tuple]:
+        """(key, article number, article text, references) for each article found in the constitution"""
+        tasks = []
         for article_num, references in article_references.items():
             # Get article text from constitution
             article_text = self.get_article_text(article_num)
-            
             if article_text:
-                # Validate each reference
-                validations = []
-                for ref in references:
-                    validation = self.validate_reference(ref, article_text)
-                    validations.append(validation)
-                
-                # Overall assessment
-                overall_status = self.assess_overall_status(validations)
-                
-                validated_articles[article_num] = {
-                    'article_number': article_num,
-                    'article_text': article_text[:500] + '...',  # Truncated
-                    'references': references,
-                    'validations': validations,
-                    'overall_status': overall_status,
-                    'violation_count': sum(1 for v in validations if v['is_violation'])
-                }
-        
-        return validated_articles
+                tasks.append((article_num, article_num, article_text, references))
+        return tasks
+    
+    def run_tasks(self, tasks: List[Tuple], parallel: bool, max_workers: Optional[int],
+                  batch_size: int) -> List[Dict]:
+        """Validate article tasks, returning results in task order
+        
+        References with a cached result are filled in up front; only the
+        remaining ones are sent to be validated.
+        """
+        validations = []
+        pending = []
+        for task_num, (_, article_num, article_text, references) in enumerate(tasks):
+            task_validations = [None] * len(references)
+            missing = []
+            for ref_num, ref in enumerate(references):
+                cached = self.cache.get(article_num, article_text, ref) if self.cache is not None else None
+                if cached is not None:
+                    task_validations[ref_num] = cached
+                else:
+                    missing.append(ref_num)
+            validations.append(task_validations)
+            if missing:
+                pending.append((task_num, missing))
+        
+        batch_size = max(1, batch_size)
+        batches = []
+        for i in range(0, len(pending), batch_size):
+            batches.append([(tasks[task_num][2], [tasks[task_num][3][ref_num] for ref_num in missing])
+                            for task_num, missing in pending[i:i + batch_size]])
+        
+        started = time.perf_counter()
+        if not parallel or len(batches) < 2:
+            fresh = [result for batch in batches for result in _validate_reference_batch(batch)]
+        else:
+            self.logger.info(f"Validating {len(pending)} articles in {len(batches)} batches across a process pool")
+            fresh = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields in submission order, so the merge is deterministic
+                for partial in executor.map(_validate_reference_batch, batches):
+                    fresh.extend(partial)
+        
+        for (task_num, missing), task_fresh in zip(pending, fresh):
+            _, article_num, article_text, references = tasks[task_num]
+            for ref_num, validation in zip(missing, task_fresh):
+                validations[task_num][ref_num] = validation
+                if self.cache is not None:
+                    self.cache.put(article_num, article_text, references[ref_num], validation)
+        if self.cache is not None:
+            self.cache.validate_seconds += time.perf_counter() - started
+        
+        return [self.assess_article(article_num, article_text, references, task_validations)
+                for (_, article_num, article_text, references), task_validations in zip(tasks, validations)]
+    
+    @staticmethod
+    def assess_article(article_num: str, article_text: str, references: List[Dict],
+                       validations: List[Dict]) -> Dict:
+        """Combine the validations of every reference to one article"""
+        return {
+            'article_number': article_num,
+            'article_text': article_text[:500] + '...',  # Truncated
+            'references': references,
+            'validations': validations,
+            'overall_status': ConstitutionalValidator.assess_overall_status(validations),
+            'violation_count': sum(1 for v in validations if v['is_violation'])
+        }
     
     def extract_article_references(self, references_data: Dict) -> Dict[str, List]:
         """Extract article references from data"""
@@ -120,8 +301,30 @@ class ConstitutionalValidator:
         
         return article_references
     
+    def build_article_lookup(self) -> Dict[str, str]:
+        """Map article numbers to their text, read once from the constitution data"""
+        lookup = {}
+        
+        # Extractor output holds a list of article records
+        articles = self.constitution_data.get('articles', [])
+        if isinstance(articles, list):
+            for article_data in articles:
+                if not isinstance(article_data, dict):
+                    continue
+                article_num = str(article_data.get('article_number', ''))
+                if article_data.get('full_text') and article_num not in lookup:
+                    lookup[article_num] = article_data['full_text']
+        
+        return lookup
+    
     def get_article_text(self, article_num: str) -> str:
         """Get article text from constitution data"""
+        # Sub-clause references such as 6(2) fall back to the whole article
+        base_num = re.sub(r'\(.*?\)', '', article_num).strip()
+        for num in (article_num, base_num):
+            if num in self.article_texts:
+                return self.article_texts[num]
+        
         # Try different key formats
         possible_keys = [
             f"Article_{article_num}",
@@ -137,29 +340,21 @@ class ConstitutionalValidator:
                 elif isinstance(article_data, str):
                     return article_data
         
-        self.logger.warning(f"Article {article_num} not found in constitution data")
+        # Warn once per article, the corpus can cite the same one many times
+        if article_num not in self.missing_articles:
+            self.missing_articles.add(article_num)
+            self.logger.warning(f"Article {article_num} not found in constitution data")
         return ""
     
-    def validate_reference(self, reference: Dict, article_text: str) -> Dict:
+    @staticmethod
+    def validate_reference(reference: Dict, article_text: str) -> Dict:
         """Validate a single reference against article text"""
-        context = reference.get('context', '').lower()
-        
-        # Check for violation indicators
-        violation_indicators = [
-            'violat', 'breach', 'fail', 'deny', 'ignore',
-            'disregard', 'not implement', 'not fulfill',
-            'lack of', 'absence of', 'contrary to'
-        ]
+        context = normalize_context(reference.get('context', ''))
         
-        is_violation = any(indicator in context for indicator in violation_indicators)
-        
-        # Check for compliance indicators
-        compliance_indicators = [
-            'comply', 'implement', 'fulfill', 'respect',
-            'uphold', 'honor', 'accordance with'
-        ]
-        
-        is_compliant = any(indicator in context for indicator in compliance_indicators)
+        # Violation and compliance indicators in a single pass
+        violation_found, compliance_found = INDICATOR_MATCHER.match(context)
+        is_violation = bool(violation_found)
+        is_compliant = bool(compliance_found)
         
         # Determine status
         if is_violation:
@@ -171,15 +366,17 @@ class ConstitutionalValidator:
         
         return {
             'page': reference.get('page'),
+            'paragraph_id': reference.get('paragraph_id'),
             'context': reference.get('context', ''),
             'is_violation': is_violation,
             'is_compliant': is_compliant,
             'status': status,
-            'violation_indicators': [ind for ind in violation_indicators if ind in context],
-            'compliance_indicators': [ind for ind in compliance_indicators if ind in context]
+            'violation_indicators': violation_found,
+            'compliance_indicators': compliance_found
         }
     
-    def assess_overall_status(self, validations: List[Dict]) -> str:
+    @staticmethod
+    def assess_overall_status(validations: List[Dict]) -> str:
         """Assess overall status for an article"""
         violation_count = sum(1 for v in validations if v['is_violation'])
         compliance_count = sum(1 for v in validations if v['is_compliant'])
@@ -196,21 +393,23 @@ class ConstitutionalValidator:
             return 'referenced_only'
     
     def generate_summary(self, validated_articles: Dict) -> Dict:
-        """Generate summary statistics"""
+        """Generate summary statistics in a single pass over the articles"""
         total_articles = len(validated_articles)
-        violated_articles = sum(1 for a in validated_articles.values() 
-                              if a['overall_status'] in ['mostly_violated', 'mixed_violations'])
-        complied_articles = sum(1 for a in validated_articles.values() 
-                              if a['overall_status'] in ['mostly_complied', 'mixed_compliance'])
+        violated_articles = 0
+        complied_articles = 0
+        total_violations = 0
+        violation_counts = []
         
-        total_violations = sum(a['violation_count'] for a in validated_articles.values())
+        for num, data in validated_articles.items():
+            if data['overall_status'] in ('mostly_violated', 'mixed_violations'):
+                violated_articles += 1
+            elif data['overall_status'] in ('mostly_complied', 'mixed_compliance'):
+                complied_articles += 1
+            total_violations += data['violation_count']
+            violation_counts.append((num, data['violation_count']))
         
         # Most violated articles
-        most_violated = sorted(
-            [(num, data['violation_count']) for num, data in validated_articles.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
+        most_violated = sorted(violation_counts, key=lambda x: x[1], reverse=True)[:10]
         
         return {
             'total_articles_referenced': total_articles,
@@ -221,24 +420,10 @@ class ConstitutionalValidator:
             'violation_rate': (violated_articles / total_articles * 100) if total_articles > 0 else 0
         }
     
-    def generate_citizen_guide(self, validated_articles: Dict) -> str:
+    def generate_citizen_guide(self, validated_articles: Dict, summary: Optional[Dict] = None) -> str:
         """Generate citizen-friendly constitutional guide"""
-        guide = "YOUR CONSTITUTIONAL RIGHTS: What They Promise vs. What You Get\n"
-        guide += "=" * 80 + "\n\n"
-        
-        guide += "INTRODUCTION\n"
-        guide += "The Constitution of Kenya (2010) is your contract with the government. "
-        guide += "It lists what the government must do for you and what rights you have. "
-        guide += "This guide shows you which parts of the Constitution are being violated.\n\n"
-        
-        guide += "KEY FINDINGS\n"
-        summary = self.generate_summary(validated_articles)
-        guide += f"- {summary['total_articles_referenced']} constitutional articles were referenced in the audit\n"
-        guide += f"- {summary['articles_with_violations']} articles show evidence of violation\n"
-        guide += f"- {summary['total_violation_instances']} specific violations were documented\n\n"
-        
-        guide += "MOST VIOLATED RIGHTS\n"
-        guide += "=" * 80 + "\n\n"
+        if summary is None:
+            summary = self.generate_summary(validated_articles)
         
         # Add details for top violated articles
         most_violated = sorted(
@@ -248,38 +433,21 @@ class ConstitutionalValidator:
             reverse=True
         )[:15]
         
+        articles = []
         for article_num, article_data in most_violated:
-            guide += f"ARTICLE {article_num}\n"
-            guide += "-" * 40 + "\n"
-            
-            # Add simplified explanation
-            simple_exp = self.get_simple_explanation(article_num)
-            guide += f"What it means: {simple_exp}\n\n"
-            
-            # Add violation examples
             violation_examples = [v for v in article_data['validations'] if v['is_violation']]
-            if violation_examples:
-                guide += "How it's being violated:\n"
-                for i, violation in enumerate(violation_examples[:3], 1):  # Top 3 examples
-                    guide += f"{i}. {violation['context'][:150]}...\n"
-                guide += "\n"
-            
-            guide += f"Total violations found: {article_data['violation_count']}\n\n"
-        
-        guide += "WHAT YOU CAN DO\n"
-        guide += "=" * 80 + "\n\n"
-        guide += "1. KNOW YOUR RIGHTS: The Constitution belongs to you\n"
-        guide += "2. DEMAND INFORMATION: Use Article 35 to request documents\n"
-        guide += "3. REPORT VIOLATIONS: File complaints with EACC and KNCHR\n"
-        guide += "4. PARTICIPATE: Attend county budget forums\n"
-        guide += "5. ORGANIZE: Join with others to demand accountability\n\n"
-        
-        guide += "Remember: Sovereignty belongs to you (Article 1). Use it.\n\n"
+            examples = [{'number': i, 'excerpt': violation['context'][:150]}
+                        for i, violation in enumerate(violation_examples[:3], 1)]  # Top 3 examples
+            articles.append({
+                'number': article_num,
+                'explanation': self.get_simple_explanation(article_num),
+                'has_examples': bool(examples),
+                'examples': examples,
+                'violation_count': article_data['violation_count']
+            })
         
-        guide += "Generated from the People's Audit analysis\n"
-        guide += f"Date: {self.get_current_date()}\n"
-        
-        return guide
+        return render_template('citizen_constitutional_guide.txt', summary=summary, articles=articles,
+                               generated_date=self.get_current_date())
     
     def get_simple_explanation(self, article_num: str) -> str:
         """Get simple explanation of constitutional article"""
@@ -301,4 +469,100 @@ class ConstitutionalValidator:
     def get_current_date(self) -> str:
         """Get current date in readable format"""
         from datetime import datetime
-        return datetime.now().strftime("%B %d, %Y")
\ No newline at end of file
+        return datetime.now().strftime("%B %d, %Y")
+
+
+class ValidationCache:
+    """Persistent map from (article, article text, reference context) to a validation result
+    
+    The whole cache is dropped when the validator rules version changes, and
+    an entry no longer matches once either the constitution's article text
+    or the audit text around the reference changes. Only entries used in
+    the current run are written back.
+    """
+    
+    # Fields that depend only on the key; page and paragraph come from the reference
+    FIELDS = ('is_violation', 'is_compliant', 'status', 'violation_indicators', 'compliance_indicators')
+    
+    def __init__(self, path: Optional[Path], rules_version: str):
+        self.path = Path(path) if path else None
+        self.rules_version = rules_version
+        self.logger = logging.getLogger(__name__)
+        self.entries: Dict[str, Dict] = {}
+        self.used_keys = set()
+        self.hits = 0
+        self.misses = 0
+        self.validate_seconds = 0.0
+        
+        if self.path and self.path.exists():
+            try:
+                data = json_io.load(self.path)
+                if data.get('rules_version') == rules_version:
+                    self.entries = data.get('entries', {})
+                    self.logger.info(f"Loaded {len(self.entries)} cached validation results")
+                else:
+                    self.logger.info("Validator rules changed, discarding validation cache")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not read validation cache {self.path}: {e}")
+    
+    @staticmethod
+    def key(article_num: str, article_text: str, reference: Dict) -> str:
+        """Hash of the article and the reference's context"""
+        digest = hashlib.sha256()
+        for part in (article_num, article_text, reference.get('context', '')):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def get(self, article_num: str, article_text: str, reference: Dict) -> Optional[Dict]:
+        """Return the cached validation for a reference, if any"""
+        key = self.key(article_num, article_text, reference)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used_keys.add(key)
+        validation = {
+            'page': reference.get('page'),
+            'paragraph_id': reference.get('paragraph_id'),
+            'context': reference.get('context', '')
+        }
+        validation.update(entry)
+        return validation
+    
+    def put(self, article_num: str, article_text: str, reference: Dict, validation: Dict):
+        key = self.key(article_num, article_text, reference)
+        self.entries[key] = {field: validation[field] for field in self.FIELDS}
+        self.used_keys.add(key)
+    
+    def statistics(self) -> Dict[str, Any]:
+        """Hit rate for validation_summary.json"""
+        lookups = self.hits + self.misses
+        return {
+            'rules_version': self.rules_version,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'validation_seconds': round(self.validate_seconds, 4)
+        }
+    
+    def save(self):
+        """Write back the entries used in this run"""
+        if self.path is None:
+            return
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'rules_version': self.rules_version,
+            'entries': {key: self.entries[key] for key in self.used_keys if key in self.entries}
+        }
+        json_io.dump(data, self.path, machine=True)
+        
+        self.logger.info(f"Saved {len(data['entries'])} validation results to {self.path}")
+
+
+def _validate_reference_batch(batch: List[Tuple[str, List[Dict]]]) -> List[List[Dict]]:
+    """Worker entry point: validate the references of each (article text, references) pair"""
+    return [[ConstitutionalValidator.validate_reference(ref, article_text) for ref in references]
+            for article_text, references in batch]
@@ -1,15 +1,25 @@
 # visualizers/chart_generator.py
+import time
 import json
+import inspect
+import hashlib
 import logging
 import base64
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
 import numpy as np
 
+from processors import json_io
+from visualizers.plotly_assets import ensure_plotlyjs_bundle, plotlyjs_bundle_path, plotlyjs_source
+from visualizers.static_export import KaleidoExporter, KALEIDO_AVAILABLE
+
 # Import visualization libraries
 try:
+    import plotly
     import plotly.graph_objects as go
     import plotly.express as px
     from plotly.subplots import make_subplots
@@ -40,6 +50,8 @@ class ChartConfig:
     background_color: str = "#ffffff"
     grid_color: str = "#f0f0f0"
     export_formats: List[str] = None
+    plotlyjs: str = "local"  # 'local' (shared bundle in charts/js), 'inline' or 'cdn'
+    static_engine: str = "kaleido"  # 'kaleido' (images of the Plotly figure) or 'matplotlib'
     
     def __post_init__(self):
         if self.export_formats is None:
@@ -65,6 +77,26 @@ class ChartData:
 class ChartGenerator:
     """Generates various charts for People's Audit data visualization"""
     
+    # Predefined charts in manifest order: chart name -> generator method
+    CHARTS = [
+        ('debt_timeline', 'generate_debt_timeline'),
+        ('corruption_by_sector', 'generate_corruption_by_sector'),
+        ('budget_allocation', 'generate_budget_allocation'),
+        ('social_indicators', 'generate_social_indicators'),
+        ('constitutional_violations', 'generate_constitutional_violations'),
+        ('county_performance', 'generate_county_performance'),
+        ('reform_priority', 'generate_reform_priority'),
+        ('debt_service_ratio', 'generate_debt_service_ratio'),
+        ('poverty_trends', 'generate_poverty_trends'),
+        ('institutional_performance', 'generate_institutional_performance')
+    ]
+    
+    # Formats written from the Matplotlib figure, in export order
+    STATIC_FORMATS = ['png', 'svg', 'pdf']
+    
+    # Bump when chart output changes in a way the renderer sources do not capture
+    RENDERER_VERSION = '1.0'
+    
     def __init__(self, data_dir: Path, output_dir: Optional[Path] = None, config: Optional[ChartConfig] = None):
         """
         Initialize chart generator
@@ -77,6 +109,15 @@ class ChartGenerator:
         self.data_dir = Path(data_dir)
         self.output_dir = output_dir or self.data_dir / 'charts'
         self.config = config or ChartConfig()
+        # Seconds spent encoding each static format, per chart
+        self.export_timings: Dict[str, Dict[str, float]] = {}
+        # Render hash of each chart this run, and the charts reused from the last run
+        self.chart_hashes: Dict[str, str] = {}
+        self.cached_charts = set()
+        self.incremental = False
+        self.previous_charts: Dict[str, Dict[str, Any]] = {}
+        self._exporter: Optional[KaleidoExporter] = None
+        self._kaleido_failed = False
         
         self.setup_directories()
         self.setup_logging()
@@ -141,8 +182,7 @@ class ChartGenerator:
             for filename in json_files:
                 filepath = self.data_dir / filename
                 if filepath.exists():
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        self.data[filename.replace('.json', '')] = json.load(f)
+                    self.data[filename.replace('.json', '')] = json_io.load(filepath)
                     self.logger.debug(f"Loaded {filename}")
                 else:
                     self.logger.warning(f"File not found: {filename}")
@@ -153,74 +193,56 @@ class ChartGenerator:
             self.logger.error(f"Error loading data: {str(e)}")
             raise
     
-    def generate_all_charts(self) -> Dict[str, Dict[str, str]]:
+    def generate_all_charts(self, parallel: bool = False, max_workers: Optional[int] = None,
+                            incremental: bool = True) -> Dict[str, Dict[str, str]]:
         """
         Generate all predefined charts
         
+        Args:
+            parallel: Render the charts across a process pool (matplotlib is not thread-safe)
+            max_workers: Worker processes (defaults to the CPU count)
+            incremental: Reuse a chart's files when its render hash matches the last manifest
+        
         Returns:
             Dictionary mapping chart names to file paths
         """
         self.logger.info("Starting generation of all charts")
+        started = time.perf_counter()
         
         generated_charts = {}
         
         try:
-            # 1. Debt Timeline Chart
-            debt_chart = self.generate_debt_timeline()
-            if debt_chart:
-                generated_charts['debt_timeline'] = debt_chart
-            
-            # 2. Corruption by Sector Chart
-            corruption_chart = self.generate_corruption_by_sector()
-            if corruption_chart:
-                generated_charts['corruption_by_sector'] = corruption_chart
-            
-            # 3. Budget Allocation Chart
-            budget_chart = self.generate_budget_allocation()
-            if budget_chart:
-                generated_charts['budget_allocation'] = budget_chart
-            
-            # 4. Social Indicators Chart
-            social_chart = self.generate_social_indicators()
-            if social_chart:
-                generated_charts['social_indicators'] = social_chart
-            
-            # 5. Constitutional Violations Chart
-            violations_chart = self.generate_constitutional_violations()
-            if violations_chart:
-                generated_charts['constitutional_violations'] = violations_chart
-            
-            # 6. County Performance Chart
-            county_chart = self.generate_county_performance()
-            if county_chart:
-                generated_charts['county_performance'] = county_chart
-            
-            # 7. Reform Priority Chart
-            reform_chart = self.generate_reform_priority()
-            if reform_chart:
-                generated_charts['reform_priority'] = reform_chart
-            
-            # 8. Debt Service Ratio Chart
-            debt_service_chart = self.generate_debt_service_ratio()
-            if debt_service_chart:
-                generated_charts['debt_service_ratio'] = debt_service_chart
-            
-            # 9. Poverty Trends Chart
-            poverty_chart = self.generate_poverty_trends()
-            if poverty_chart:
-                generated_charts['poverty_trends'] = poverty_chart
-            
-            # 10. Institutional Performance Chart
-            institutional_chart = self.generate_institutional_performance()
-            if institutional_chart:
-                generated_charts['institutional_performance'] = institutional_chart
-            
-            # Generate dashboard
+            chart_names = [chart_name for chart_name, _ in self.CHARTS]
+            self.chart_hashes, self.cached_charts, self.export_timings = {}, set(), {}
+            self._kaleido_failed = False
+            self.incremental = incremental
+            self.previous_charts = self._load_previous_charts() if incremental else {}
+            if PLOTLY_AVAILABLE and self.config.plotlyjs == 'local':
+                # Written up front so parallel workers only reference it
+                ensure_plotlyjs_bundle(self.output_dir)
+            if parallel and len(chart_names) > 1:
+                # Each worker gets a copy of this generator and imports the plotting libraries once
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_chart_worker,
+                                         initargs=(self,)) as executor:
+                    rendered = list(executor.map(_render_chart, chart_names))
+                results = [file_paths for file_paths, _ in rendered]
+                for chart_name, (_, state) in zip(chart_names, rendered):
+                    self.restore_render_state(chart_name, state)
+            else:
+                results = [self.render_chart(chart_name) for chart_name in chart_names]
+            
+            for chart_name, file_paths in zip(chart_names, results):
+                if file_paths:
+                    generated_charts[chart_name] = file_paths
+            
+            # Generate dashboard once every chart is on disk
             dashboard = self.generate_dashboard(generated_charts)
             if dashboard:
                 generated_charts['dashboard'] = dashboard
             
-            self.logger.info(f"Generated {len(generated_charts)} charts")
+            self.logger.info(f"Generated {len(generated_charts)} charts in "
+                             f"{time.perf_counter() - started:.2f}s ({'parallel' if parallel else 'serial'}, "
+                             f"{len(self.cached_charts)} unchanged)")
             
             # Save chart manifest
             self._save_chart_manifest(generated_charts)
@@ -230,6 +252,63 @@ class ChartGenerator:
         except Exception as e:
             self.logger.error(f"Error generating charts: {str(e)}")
             raise
+        finally:
+            # The kaleido process lives for exactly one run
+            self.close_static_exporter()
+    
+    def render_chart(self, chart_name: str) -> Dict[str, str]:
+        """Generate one of the predefined charts by name"""
+        return getattr(self, dict(self.CHARTS)[chart_name])()
+    
+    def render_state(self, chart_name: str) -> Dict[str, Any]:
+        """What rendering a chart recorded on this generator, for passing back from a worker"""
+        return {
+            'hash': self.chart_hashes.get(chart_name),
+            'cached': chart_name in self.cached_charts,
+            'encode_seconds': self.export_timings.get(chart_name)
+        }
+    
+    def restore_render_state(self, chart_name: str, state: Dict[str, Any]):
+        if state.get('hash'):
+            self.chart_hashes[chart_name] = state['hash']
+        if state.get('cached'):
+            self.cached_charts.add(chart_name)
+        if state.get('encode_seconds'):
+            self.export_timings[chart_name] = state['encode_seconds']
+    
+    def chart_hash(self, chart_data: ChartData, chart_name: str) -> str:
+        """Content hash of everything a chart is rendered from: its data, the config and the renderers"""
+        digest = hashlib.sha256(self.RENDERER_VERSION.encode('utf-8'))
+        digest.update(chart_name.encode('utf-8'))
+        
+        for method in (self._generate_chart, self._build_plotly_figure, self._generate_plotly_chart,
+                       self._generate_kaleido_chart, self._generate_matplotlib_chart, self._save_chart_data):
+            try:
+                digest.update(inspect.getsource(method).encode('utf-8'))
+            except (OSError, TypeError):
+                # No source available (e.g. frozen build), rely on RENDERER_VERSION
+                digest.update(method.__name__.encode('utf-8'))
+        
+        versions = {
+            'plotly': plotly.__version__ if PLOTLY_AVAILABLE else None,
+            'matplotlib': matplotlib.__version__ if MATPLOTLIB_AVAILABLE else None,
+            'kaleido': KALEIDO_AVAILABLE
+        }
+        for part in (asdict(chart_data), asdict(self.config), self.color_schemes, versions):
+            digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        
+        return digest.hexdigest()
+    
+    def _load_previous_charts(self) -> Dict[str, Dict[str, Any]]:
+        """Chart entries of the last run's manifest, or nothing when there is none"""
+        manifest_path = self.output_dir / 'charts_manifest.json'
+        if not manifest_path.exists():
+            return {}
+        try:
+            return json_io.load(manifest_path).get('charts', {})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read chart manifest {manifest_path}: {e}")
+            return {}
     
     def generate_debt_timeline(self) -> Dict[str, str]:
         """Generate debt timeline chart"""
@@ -781,29 +860,45 @@ class ChartGenerator:
         file_paths = {}
         
         try:
+            # Reuse last run's files when nothing the chart is rendered from has changed
+            # and every requested format is still on disk
+            chart_hash = self.chart_hash(chart_data, chart_name)
+            self.chart_hashes[chart_name] = chart_hash
+            previous = self.previous_charts.get(chart_name, {})
+            previous_paths = previous.get('paths') or {}
+            if (self.incremental and previous.get('hash') == chart_hash
+                    and all(fmt in previous_paths for fmt in self.config.export_formats)
+                    and all(Path(path).exists() for path in previous_paths.values())):
+                self.cached_charts.add(chart_name)
+                self.logger.debug(f"Chart '{chart_name}' unchanged, reusing {len(previous_paths)} files")
+                return dict(previous_paths)
+            
+            static_formats = [fmt for fmt in self.STATIC_FORMATS if fmt in self.config.export_formats]
+            wants_kaleido = self.config.static_engine == 'kaleido' and KALEIDO_AVAILABLE and bool(static_formats)
+            use_kaleido = wants_kaleido and not self._kaleido_failed
+            
+            # One Plotly figure serves the HTML chart and, with kaleido, the static images
+            fig = None
+            if PLOTLY_AVAILABLE and ('html' in self.config.export_formats or wants_kaleido):
+                fig = self._build_plotly_figure(chart_data)
+            
             # Generate HTML chart (Plotly)
-            if PLOTLY_AVAILABLE and 'html' in self.config.export_formats:
-                html_path = self._generate_plotly_chart(chart_data, chart_name)
+            if fig is not None and 'html' in self.config.export_formats:
+                html_path = self._generate_plotly_chart(fig, chart_name)
                 if html_path:
                     file_paths['html'] = html_path
             
-            # Generate PNG chart
-            if MATPLOTLIB_AVAILABLE and 'png' in self.config.export_formats:
-                png_path = self._generate_matplotlib_chart(chart_data, chart_name, 'png')
-                if png_path:
-                    file_paths['png'] = png_path
-            
-            # Generate SVG chart
-            if MATPLOTLIB_AVAILABLE and 'svg' in self.config.export_formats:
-                svg_path = self._generate_matplotlib_chart(chart_data, chart_name, 'svg')
-                if svg_path:
-                    file_paths['svg'] = svg_path
-            
-            # Generate PDF chart
-            if MATPLOTLIB_AVAILABLE and 'pdf' in self.config.export_formats:
-                pdf_path = self._generate_matplotlib_chart(chart_data, chart_name, 'pdf')
-                if pdf_path:
-                    file_paths['pdf'] = pdf_path
+            # Generate PNG, SVG and PDF charts from the Plotly figure via kaleido, falling
+            # back to a single Matplotlib figure for charts Plotly does not draw or kaleido fails on
+            static_paths = {}
+            if use_kaleido and fig is not None:
+                static_paths = self._generate_kaleido_chart(fig, chart_name, static_formats)
+            if not static_paths and MATPLOTLIB_AVAILABLE and static_formats:
+                static_paths = self._generate_matplotlib_chart(chart_data, chart_name, static_formats)
+                if wants_kaleido and fig is not None:
+                    # Fallback images are not what the hash describes, so render again next run
+                    self.chart_hashes.pop(chart_name, None)
+            file_paths.update(static_paths)
             
             # Save chart data as JSON
             if 'json' in self.config.export_formats:
@@ -811,16 +906,23 @@ class ChartGenerator:
                 if json_path:
                     file_paths['json'] = json_path
             
+            missing = [fmt for fmt in self.config.export_formats if fmt not in file_paths]
+            if missing:
+                # Only complete renders are cached, so the missing formats are retried next run
+                self.chart_hashes.pop(chart_name, None)
+                self.logger.warning(f"Chart '{chart_name}' was not generated as {', '.join(missing)}")
+            
             self.logger.debug(f"Generated chart '{chart_name}' in {len(file_paths)} formats")
             
             return file_paths
             
         except Exception as e:
             self.logger.error(f"Error generating chart '{chart_name}': {str(e)}")
+            self.chart_hashes.pop(chart_name, None)
             return {}
     
-    def _generate_plotly_chart(self, chart_data: ChartData, chart_name: str) -> Optional[str]:
-        """Generate chart using Plotly"""
+    def _build_plotly_figure(self, chart_data: ChartData) -> Optional[Any]:
+        """Build the Plotly figure for a chart, or None for chart types Plotly does not cover"""
         try:
             fig = None
             
@@ -918,22 +1020,63 @@ class ChartGenerator:
                     width=self.config.width,
                     height=self.config.height
                 )
-                
-                # Save HTML
-                html_path = self.output_dir / 'html' / f'{chart_name}.html'
-                fig.write_html(str(html_path))
-                
-                return str(html_path)
             
+            return fig
+            
+        except Exception as e:
+            self.logger.error(f"Error building Plotly chart: {str(e)}")
             return None
+    
+    def _generate_plotly_chart(self, fig, chart_name: str) -> Optional[str]:
+        """Save a Plotly figure as an interactive HTML chart"""
+        try:
+            html_path = self.output_dir / 'html' / f'{chart_name}.html'
+            fig.write_html(str(html_path),
+                           include_plotlyjs=plotlyjs_source(self.config.plotlyjs, self.output_dir,
+                                                            html_path.parent))
+            return str(html_path)
             
         except Exception as e:
             self.logger.error(f"Error generating Plotly chart: {str(e)}")
             return None
     
-    def _generate_matplotlib_chart(self, chart_data: ChartData, chart_name: str, 
-                                 format: str) -> Optional[str]:
-        """Generate chart using Matplotlib"""
+    def _generate_kaleido_chart(self, fig, chart_name: str, formats: List[str]) -> Dict[str, str]:
+        """Export the Plotly figure to static formats through the shared kaleido process"""
+        targets = {fmt: self.output_dir / fmt / f'{chart_name}.{fmt}' for fmt in formats}
+        try:
+            timings = self.static_exporter().export(fig, targets, self.config.width, self.config.height)
+        except Exception as e:
+            # Usually kaleido cannot start here; stop trying for the rest of the run
+            self.logger.error(f"Error exporting chart '{chart_name}' with kaleido, using Matplotlib: {str(e)}")
+            self._kaleido_failed = True
+            self.close_static_exporter()
+            return {}
+        
+        self.export_timings[chart_name] = timings
+        self.logger.debug(f"Encoded '{chart_name}': " +
+                          ', '.join(f"{fmt} {seconds:.2f}s" for fmt, seconds in timings.items()))
+        return {fmt: str(path) for fmt, path in targets.items()}
+    
+    def static_exporter(self) -> KaleidoExporter:
+        """The kaleido exporter for this run, started on first use"""
+        if self._exporter is None:
+            bundle = plotlyjs_bundle_path(self.output_dir).resolve()
+            self._exporter = KaleidoExporter(plotlyjs=bundle if bundle.exists() else None)
+        return self._exporter
+    
+    def close_static_exporter(self):
+        if self._exporter is not None:
+            try:
+                self._exporter.close()
+            except Exception as e:
+                self.logger.warning(f"Could not stop kaleido cleanly: {str(e)}")
+            self._exporter = None
+    
+    def _generate_matplotlib_chart(self, chart_data: ChartData, chart_name: str,
+                                 formats: List[str]) -> Dict[str, str]:
+        """Generate chart using Matplotlib, laying the figure out once and saving it in each format"""
+        file_paths = {}
+        fig = None
         try:
             plt.style.use('seaborn-v0_8-darkgrid')
             fig, ax = plt.subplots(figsize=(self.config.width/100, self.config.height/100))
@@ -987,18 +1130,27 @@ class ChartGenerator:
             ax.set_title(chart_data.title, fontsize=self.config.title_font_size, pad=20)
             
             # Adjust layout
-            plt.tight_layout()
+            fig.tight_layout()
             
-            # Save figure
-            output_path = self.output_dir / format / f'{chart_name}.{format}'
-            plt.savefig(str(output_path), dpi=300, bbox_inches='tight')
-            plt.close(fig)
+            # Save figure in every requested format
+            timings = self.export_timings.setdefault(chart_name, {})
+            for fmt in formats:
+                started = time.perf_counter()
+                output_path = self.output_dir / fmt / f'{chart_name}.{fmt}'
+                fig.savefig(str(output_path), format=fmt, dpi=300, bbox_inches='tight')
+                timings[fmt] = round(time.perf_counter() - started, 4)
+                file_paths[fmt] = str(output_path)
             
-            return str(output_path)
+            self.logger.debug(f"Encoded '{chart_name}': " +
+                              ', '.join(f"{fmt} {seconds:.2f}s" for fmt, seconds in timings.items()))
             
         except Exception as e:
             self.logger.error(f"Error generating Matplotlib chart: {str(e)}")
-            return None
+        finally:
+            if fig is not None:
+                plt.close(fig)
+        
+        return file_paths
     
     def _save_chart_data(self, chart_data: ChartData, chart_name: str) -> Optional[str]:
         """Save chart data as JSON"""
@@ -1006,8 +1158,7 @@ class ChartGenerator:
             data_dict = asdict(chart_data)
             json_path = self.output_dir / 'json' / f'{chart_name}_data.json'
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data_dict, f, indent=2, ensure_ascii=False)
+            json_io.dump(data_dict, json_path)
             
             return str(json_path)
             
@@ -1421,10 +1572,14 @@ class ChartGenerator:
                     'formats': list(chart_paths.keys()),
                     'paths': chart_paths
                 }
+                if chart_name in self.chart_hashes:
+                    manifest['charts'][chart_name]['hash'] = self.chart_hashes[chart_name]
+                    manifest['charts'][chart_name]['cached'] = chart_name in self.cached_charts
+                if chart_name in self.export_timings:
+                    manifest['charts'][chart_name]['encode_seconds'] = self.export_timings[chart_name]
             
             manifest_path = self.output_dir / 'charts_manifest.json'
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            json_io.dump(manifest, manifest_path)
             
             self.logger.info(f"Chart manifest saved to {manifest_path}")
             
@@ -1510,14 +1665,40 @@ class ChartGenerator:
         }
 
 
+# Generator copy used by chart worker processes, set once per worker
+_worker_generator: Optional[ChartGenerator] = None
+
+
+def _init_chart_worker(generator: ChartGenerator):
+    """Worker initializer: keep the generator and load the plotting backends before the first chart"""
+    global _worker_generator
+    _worker_generator = generator
+    # Workers leave through os._exit, which skips atexit; this finalizer stops
+    # the worker's kaleido process when the pool shuts down
+    Finalize(None, generator.close_static_exporter, exitpriority=10)
+    if PLOTLY_AVAILABLE:
+        # Plotly loads its trace and layout classes lazily on first use
+        go.Figure(data=[go.Scatter(), go.Bar(), go.Pie(), go.Scatterpolar()])
+    if MATPLOTLIB_AVAILABLE:
+        plt.close(plt.figure())
+
+
+def _render_chart(chart_name: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """Worker entry point: render one predefined chart, returning its file paths and render state"""
+    file_paths = _worker_generator.render_chart(chart_name)
+    return file_paths, _worker_generator.render_state(chart_name)
+
+
 # Utility function for standalone usage
-def generate_all_charts(data_dir: str, output_dir: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+def generate_all_charts(data_dir: str, output_dir: Optional[str] = None,
+                        parallel: bool = False) -> Dict[str, Dict[str, str]]:
     """
     Standalone function to generate all charts
     
     Args:
         data_dir: Directory containing consolidated data
         output_dir: Directory to save charts (defaults to data_dir/charts)
+        parallel: Render the charts across a process pool
         
     Returns:
         Dictionary of generated chart paths
@@ -1526,7 +1707,7 @@ def generate_all_charts(data_dir: str, output_dir: Optional[str] = None) -> Dict
     output_path = Path(output_dir) if output_dir else data_path / 'charts'
     
     generator = ChartGenerator(data_path, output_path)
-    charts = generator.generate_all_charts()
+    charts = generator.generate_all_charts(parallel=parallel)
     
     print(f"\nChart generation complete!")
     print(f"Generated {len(charts)} charts")
@@ -0,0 +1,115 @@
+# visualizers/export_benchmark.py
+import sys
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, Sequence
+
+import numpy as np
+
+from processors.artifact_writer import write_artifact
+from visualizers.chart_generator import ChartGenerator, ChartConfig, MATPLOTLIB_AVAILABLE
+from visualizers.static_export import KALEIDO_AVAILABLE, KALEIDO_SCALE
+
+if MATPLOTLIB_AVAILABLE:
+    import matplotlib.image as mpimg
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ['matplotlib', 'kaleido']
+
+
+def benchmark_static_export(data_dir: Path, output_dir: Path,
+                            formats: Sequence[str] = ('png', 'svg')) -> Dict[str, Any]:
+    """Render every predefined chart with each static engine and compare time and fidelity
+
+    Each engine renders into output_dir/<engine>, serially and without the
+    render cache. Kaleido draws the same Plotly figure that the HTML chart
+    embeds, so its PNGs serve as the reference: each engine is scored on
+    whether its PNG has the HTML layout's pixel size and on how closely it
+    matches the reference pixel for pixel.
+
+    Args:
+        data_dir: Directory containing the consolidated Stage 3 data
+        output_dir: Scratch directory for the rendered charts and the report
+        formats: Static formats to export
+
+    Returns:
+        The report, also written to output_dir/export_benchmark.json
+    """
+    data_dir, output_dir = Path(data_dir), Path(output_dir)
+    engines = [engine for engine in ENGINES if engine != 'kaleido' or KALEIDO_AVAILABLE]
+    report: Dict[str, Any] = {'formats': list(formats), 'engines': {}}
+    png_paths: Dict[str, Dict[str, str]] = {}
+
+    for engine in engines:
+        config = ChartConfig(export_formats=list(formats), static_engine=engine)
+        generator = ChartGenerator(data_dir, output_dir / engine, config)
+
+        started = time.perf_counter()
+        charts = generator.generate_all_charts(incremental=False)
+        total = time.perf_counter() - started
+
+        timings = generator.export_timings
+        first_chart = next(iter(timings.values()), {})
+        report['engines'][engine] = {
+            'charts': len(timings),
+            'total_seconds': round(total, 3),
+            'encode_seconds': {fmt: round(sum(t.get(fmt, 0.0) for t in timings.values()), 3)
+                               for fmt in formats},
+            # For kaleido this includes starting the process, paid once per run
+            'first_export_seconds': round(sum(first_chart.values()), 3),
+            'per_chart': timings
+        }
+        png_paths[engine] = {name: paths['png'] for name, paths in charts.items() if 'png' in paths}
+
+    if 'png' in formats and MATPLOTLIB_AVAILABLE:
+        expected = (ChartConfig().height * KALEIDO_SCALE, ChartConfig().width * KALEIDO_SCALE)
+        reference = png_paths.get('kaleido', {})
+        for engine in engines:
+            report['engines'][engine]['fidelity'] = _fidelity(png_paths[engine], reference, expected)
+
+    write_artifact(output_dir / 'export_benchmark.json', report)
+    for engine, result in report['engines'].items():
+        fidelity = result.get('fidelity', {})
+        logger.info(f"{engine}: {result['total_seconds']:.2f}s total, encode {result['encode_seconds']}, "
+                    f"html size match {fidelity.get('html_size_match')}, "
+                    f"similarity {fidelity.get('mean_similarity')}")
+    return report
+
+
+def _fidelity(pngs: Dict[str, str], reference: Dict[str, str], expected: tuple) -> Dict[str, Any]:
+    """Share of PNGs at the HTML pixel size, and mean similarity to the reference PNGs (1.0 = identical)"""
+    sizes, similarities = [], []
+    for name, path in pngs.items():
+        image = _grayscale(path)
+        sizes.append(image.shape == expected)
+        if name in reference:
+            similarities.append(_similarity(image, _grayscale(reference[name])))
+    return {
+        'html_size_match': round(sum(sizes) / len(sizes), 3) if sizes else None,
+        'mean_similarity': round(float(np.mean(similarities)), 4) if similarities else None
+    }
+
+
+def _grayscale(path: str) -> np.ndarray:
+    image = mpimg.imread(path)
+    return image[..., :3].mean(axis=2) if image.ndim == 3 else image
+
+
+def _similarity(image: np.ndarray, reference: np.ndarray) -> float:
+    """1 - mean absolute difference after nearest-neighbour resizing image to the reference shape"""
+    rows = (np.arange(reference.shape[0]) * image.shape[0] / reference.shape[0]).astype(int)
+    cols = (np.arange(reference.shape[1]) * image.shape[1] / reference.shape[1]).astype(int)
+    return 1.0 - float(np.abs(image[rows][:, cols] - reference).mean())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        output = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(sys.argv[1]) / 'charts_benchmark'
+        results = benchmark_static_export(Path(sys.argv[1]), output)
+        for engine_name, engine_result in results['engines'].items():
+            print(f"{engine_name}: {engine_result['total_seconds']:.2f}s, "
+                  f"encode {engine_result['encode_seconds']}, fidelity {engine_result.get('fidelity')}")
+    else:
+        print("Usage: python -m visualizers.export_benchmark <data_dir> [output_dir]")
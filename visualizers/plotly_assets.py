@@ -0,0 +1,60 @@
+# visualizers/plotly_assets.py
+import os
+import logging
+from pathlib import Path
+from typing import List, Union
+
+from processors.artifact_writer import write_artifact
+
+try:
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# How chart pages load plotly.js: embedded in every page, one shared local file, or the CDN
+PLOTLYJS_MODES = ['inline', 'local', 'cdn']
+
+# Shared bundle location, relative to the charts directory
+PLOTLYJS_SUBDIR = 'js'
+
+
+def plotlyjs_bundle_path(charts_dir: Path) -> Path:
+    """Versioned path of the shared plotly.js bundle, charts/js/plotly-<version>.min.js"""
+    return Path(charts_dir) / PLOTLYJS_SUBDIR / f"plotly-{get_plotlyjs_version()}.min.js"
+
+
+def ensure_plotlyjs_bundle(charts_dir: Path) -> Path:
+    """Write the plotly.js bundle under charts_dir once per plotly version"""
+    bundle = plotlyjs_bundle_path(charts_dir)
+    if not bundle.exists():
+        size = write_artifact(bundle, get_plotlyjs())
+        logger.info(f"Wrote shared plotly.js bundle {bundle} ({size / (1 << 20):.1f} MB)")
+    return bundle
+
+
+def plotlyjs_source(mode: str, charts_dir: Path, page_dir: Path) -> Union[bool, str]:
+    """Value for Plotly's include_plotlyjs on a page written to page_dir
+
+    In 'local' mode the bundle is written if needed and referenced by a
+    path relative to the page, so the output tree works offline and when
+    served as static files.
+    """
+    if mode not in PLOTLYJS_MODES:
+        raise ValueError(f"Unknown plotly.js mode: {mode}")
+    if mode == 'inline':
+        return True
+    if mode == 'cdn':
+        return 'cdn'
+    bundle = ensure_plotlyjs_bundle(charts_dir)
+    return Path(os.path.relpath(bundle, Path(page_dir))).as_posix()
+
+
+def find_plotlyjs_bundles(charts_dir: Path) -> List[Path]:
+    """Shared bundles present under charts_dir (normally one per plotly version used)"""
+    js_dir = Path(charts_dir) / PLOTLYJS_SUBDIR
+    if not js_dir.exists():
+        return []
+    return sorted(js_dir.glob('plotly-*.min.js'))
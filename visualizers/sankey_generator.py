@@ -2,15 +2,23 @@
 import json
 import plotly.graph_objects as go
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Union
 import logging
 
+from processors.artifact_writer import write_artifact
+
+
 class SankeyGenerator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def generate_sankey(self, sankey_data: Dict) -> str:
-        """Generate Sankey diagram HTML"""
+    def generate_sankey(self, sankey_data: Dict, include_plotlyjs: Union[bool, str] = 'cdn') -> str:
+        """Generate Sankey diagram HTML
+        
+        Args:
+            sankey_data: Nodes and links from Stage 3
+            include_plotlyjs: How the page loads plotly.js, as for Plotly's to_html
+        """
         try:
             # Extract nodes and links
             nodes = sankey_data.get('nodes', [])
@@ -80,7 +88,7 @@ class SankeyGenerator:
             )
             
             # Convert to HTML
-            html_content = fig.to_html(full_html=False, include_plotlyjs='cdn')
+            html_content = fig.to_html(full_html=False, include_plotlyjs=include_plotlyjs)
             
             # Wrap in complete HTML document
             full_html = self.create_html_wrapper(html_content)
@@ -226,8 +234,7 @@ class SankeyGenerator:
         try:
             # Save HTML
             html_path = output_dir / 'sankey.html'
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            write_artifact(html_path, html_content)
             
             self.logger.info(f"Sankey HTML saved to {html_path}")
             